@@ -2,9 +2,15 @@ from __future__ import annotations
 
 import csv
 import datetime as dt
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
+FILL_COLUMNS = ("ts", "side", "col_in", "copx_out", "price", "slip_bps")
+_NUMERIC = ("col_in", "copx_out", "price", "slip_bps")
+
 
 @dataclass(frozen=True)
 class Fill:
@@ -17,15 +23,22 @@ class Fill:
     notes: str = ""
 
 
+def _utc_naive(ts: dt.datetime) -> dt.datetime:
+    # Offsets are converted, not dropped: Fill.ts is always naive UTC
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(dt.UTC).replace(tzinfo=None)
+    return ts
+
+
 def parse_ts(x: str) -> dt.datetime:
-    # Accept ISO8601 or unix seconds
+    # Accept ISO8601 (with or without a UTC offset) or unix seconds
     x = x.strip()
     if x.isdigit():
         return dt.datetime.utcfromtimestamp(int(x))
     try:
-        # 2025-11-04T13:20:00Z / 2025-11-04 13:20:00
+        # 2025-11-04T13:20:00Z / 2025-11-04 13:20:00 / 2025-11-04T15:20:00+02:00
         x = x.replace("Z", "")
-        return dt.datetime.fromisoformat(x)
+        return _utc_naive(dt.datetime.fromisoformat(x))
     except Exception as err:
         raise ValueError(f"Unrecognized timestamp: {x}") from err
 
@@ -60,3 +73,83 @@ def read_fills_csv(path: Path | str) -> list[Fill]:
             notes = pick("notes") or ""
             fills.append(Fill(ts, side, col_in, copx_out, price, slip_bps, notes))
     return fills
+
+
+# ----- Columnar form (bulk replay) -----
+def parse_ts_many(values) -> np.ndarray:
+    """parse_ts over an array of strings -> datetime64[us] (UTC naive)."""
+    s = np.char.strip(np.asarray(values, dtype=str))
+    out = np.empty(s.shape, dtype="datetime64[us]")
+    digits = np.char.isdigit(s)
+    if digits.any():
+        out[digits] = s[digits].astype(np.int64).astype("datetime64[s]")
+    if not digits.all():
+        iso = np.char.replace(np.char.replace(s[~digits], "Z", ""), " ", "T")
+        # a '+' or '-' after the date part is a UTC offset: numpy's handling of
+        # those is deprecated, so they go through parse_ts one by one instead
+        clock = np.char.partition(iso, "T")[..., 2]
+        offset = (np.char.find(clock, "+") >= 0) | (np.char.find(clock, "-") >= 0)
+        vals = np.empty(iso.shape, dtype="datetime64[us]")
+        vals[~offset] = iso[~offset].astype("datetime64[us]")
+        vals[offset] = [np.datetime64(parse_ts(x), "us") for x in iso[offset]]
+        out[~digits] = vals
+    if np.isnat(out).any():
+        raise ValueError(f"Unrecognized timestamp: {s[np.isnat(out)][0]!r}")
+    return out
+
+
+def _check_sides(side: np.ndarray) -> np.ndarray:
+    side = np.char.lower(np.char.strip(side.astype(str)))
+    bad = ~np.isin(side, ["buy", "sell"])
+    if bad.any():
+        raise ValueError(f"side must be 'buy' or 'sell', got {side[bad][0]!r}")
+    return side
+
+
+def read_fills_columns(path: Path | str) -> dict[str, np.ndarray]:
+    """
+    read_fills_csv as NumPy columns (FILL_COLUMNS; ts as datetime64[us]) for bulk
+    replay: the CSV is parsed by pyarrow and converted column-wise, so millions of
+    rows load without building a Fill per row. `notes` is not loaded.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    path = Path(path)
+    with path.open("r", newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+    # Same header rules as read_fills_csv: exact or lower-case names
+    names = {}
+    for h in header:
+        names.setdefault(h.lower(), h)
+        names[h] = h
+    missing = [k for k in FILL_COLUMNS if k not in names]
+    if missing:
+        raise ValueError(f"CSV missing required columns: {sorted(missing)}")
+
+    cols = {k: names[k] for k in FILL_COLUMNS}
+    types = {cols["ts"]: pa.string(), cols["side"]: pa.string()}
+    types.update({cols[k]: pa.float64() for k in _NUMERIC})
+    try:
+        table = pacsv.read_csv(
+            path,
+            convert_options=pacsv.ConvertOptions(
+                column_types=types, include_columns=list(cols.values())
+            ),
+        )
+    except pa.ArrowInvalid as err:
+        raise ValueError(f"{path}: {err}") from err
+
+    out = {k: table[cols[k]].to_numpy() for k in _NUMERIC}
+    out["ts"] = parse_ts_many(table[cols["ts"]].to_numpy(zero_copy_only=False))
+    out["side"] = _check_sides(table[cols["side"]].to_numpy(zero_copy_only=False))
+    return {k: out[k] for k in FILL_COLUMNS}
+
+
+def fills_to_columns(fills: Iterable[Fill]) -> dict[str, np.ndarray]:
+    """Fill records -> the read_fills_columns layout."""
+    fills = list(fills)
+    out = {k: np.array([getattr(f, k) for f in fills], dtype=float) for k in _NUMERIC}
+    out["ts"] = np.array([_utc_naive(f.ts) for f in fills], dtype="datetime64[us]")
+    out["side"] = _check_sides(np.array([f.side for f in fills], dtype=str))
+    return {k: out[k] for k in FILL_COLUMNS}
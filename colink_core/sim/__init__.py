@@ -1,38 +1,108 @@
-from .amm import PoolState
-from .limits import LimitConfig, TradeLimiter
+from .amm import PoolBase, PoolState
+from .amm_fixed import FixedPoolState
+from .gbm import iter_gbm_chunks, simulate_gbm
+from .graph import PathQuote, PoolGraph
+from .limits import LimitConfig, LimiterRegistry, TradeLimiter
+from .pool_bank import PoolBank, PoolView
 from .price_utils import (
+    ImpactCurve,
     bps_deviation,
+    cached_quote_col_to_copx,
+    impact_curve,
     mid_route_price_col_to_copx,
     modeled_bps_impact_for_size,
     route_mid_price_copx_per_col,
 )
 from .risk_guard import (
+    GuardDecisions,
     GuardedQuote,
+    GuardEval,
+    allowed_deviation_bps,
+    evaluate_guard,
+    evaluate_guard_many,
+    guard_decisions_many,
     quote_with_slippage,
     size_aware_twap_guard,
 )
+from .rng import RngStreams
 from .router import (
     exec_col_to_copx,
     exec_copx_to_col,
     quote_col_to_copx,
+    quote_col_to_copx_exact_out,
     quote_copx_to_col,
+    quote_copx_to_col_exact_out,
+    quote_many_col_to_copx_exact_out,
+    quote_many_copx_to_col_exact_out,
+)
+from .snapshot import Checkpointer, Snapshot, load_snapshot, save_snapshot
+from .split import SplitResult, exec_split, optimal_split, quote_split
+from .threadsafe import LockedTradeLimiter, LockedTWAP, LockedTWAPOracle, StripedLimiterRegistry
+from .twap import (
+    TWAP,
+    MedianOracle,
+    OracleBank,
+    OracleView,
+    QuantileOracle,
+    TWAPOracle,
+    rolling_twap,
 )
-from .twap import TWAPOracle
 
 __all__ = [
+    "Checkpointer",
+    "FixedPoolState",
+    "GuardDecisions",
+    "GuardEval",
     "GuardedQuote",
+    "ImpactCurve",
     "LimitConfig",
+    "LimiterRegistry",
+    "LockedTWAP",
+    "LockedTWAPOracle",
+    "LockedTradeLimiter",
+    "MedianOracle",
+    "OracleBank",
+    "OracleView",
+    "PathQuote",
+    "PoolBank",
+    "PoolBase",
+    "PoolGraph",
     "PoolState",
+    "PoolView",
+    "QuantileOracle",
+    "RngStreams",
+    "Snapshot",
+    "SplitResult",
+    "StripedLimiterRegistry",
+    "TWAP",
     "TWAPOracle",
     "TradeLimiter",
+    "allowed_deviation_bps",
     "bps_deviation",
+    "cached_quote_col_to_copx",
+    "evaluate_guard",
+    "evaluate_guard_many",
     "exec_col_to_copx",
     "exec_copx_to_col",
+    "exec_split",
+    "guard_decisions_many",
+    "impact_curve",
+    "iter_gbm_chunks",
+    "load_snapshot",
     "mid_route_price_col_to_copx",
     "modeled_bps_impact_for_size",
+    "optimal_split",
     "quote_col_to_copx",
+    "quote_col_to_copx_exact_out",
     "quote_copx_to_col",
+    "quote_copx_to_col_exact_out",
+    "quote_many_col_to_copx_exact_out",
+    "quote_many_copx_to_col_exact_out",
+    "quote_split",
     "quote_with_slippage",
+    "rolling_twap",
     "route_mid_price_copx_per_col",
+    "save_snapshot",
+    "simulate_gbm",
     "size_aware_twap_guard",
 ]
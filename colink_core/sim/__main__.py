@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import argparse
-import csv
+import json
 import time
 from pathlib import Path
 
+import numpy as np
+
 from .amm import PoolState
-from .price_utils import modeled_bps_impact_for_size, route_mid_price_copx_per_col
-from .risk_guard import quote_with_slippage, size_aware_twap_guard
+from .parallel import worker_pool
+from .price_utils import route_mid_price_copx_per_col
+from .risk_guard import iter_guard_chunks, quote_with_slippage, size_aware_twap_guard
 from .router import exec_col_to_copx, quote_col_to_copx
+from .sink import open_sink
+from .snapshot import load_snapshot, save_snapshot
 from .twap import TWAPOracle
 
+SWEEP_CHUNK = 65_536  # sizes per guard pass / sink batch
+CHART_MAX_POINTS = 10_000
+
 
 def fmt(n: float) -> str:
     return f"{n:,.6f}"
@@ -27,8 +35,34 @@ def seed_pools(
     return pool_col_x, pool_x_copx
 
 
-def cmd_quote(args: argparse.Namespace) -> int:
+def restore_or_seed(args: argparse.Namespace):
+    """
+    Pools and TWAP from --state if that snapshot exists (warm restart), else seeded
+    pools and a TWAP warmed flat at the current mid. Returns (pool_col_x, pool_x_copx, tw).
+    """
+    state = getattr(args, "state", None)
+    if state and Path(state).exists():
+        snap = load_snapshot(state)
+        return snap.pools["col_x"], snap.pools["x_copx"], snap.oracles["twap"]
     pool_col_x, pool_x_copx = seed_pools()
+    tw = TWAPOracle(window=args.twap_window)
+    tw.warm([route_mid_price_copx_per_col(pool_col_x, pool_x_copx)] * args.twap_window)
+    return pool_col_x, pool_x_copx, tw
+
+
+def checkpoint(args: argparse.Namespace, pool_col_x, pool_x_copx, tw: TWAPOracle) -> None:
+    """Record the current mid into the TWAP and save everything to --state (if given)."""
+    if not getattr(args, "state", None):
+        return
+    tw.push(route_mid_price_copx_per_col(pool_col_x, pool_x_copx))
+    save_snapshot(
+        args.state, pools={"col_x": pool_col_x, "x_copx": pool_x_copx}, oracles={"twap": tw}
+    )
+    print(f"Saved state -> {args.state}")
+
+
+def cmd_quote(args: argparse.Namespace) -> int:
+    pool_col_x, pool_x_copx, tw = restore_or_seed(args)
     col_in = float(args.col_in)
 
     # Basic routed quote (no mutation)
@@ -44,9 +78,6 @@ def cmd_quote(args: argparse.Namespace) -> int:
 
     # Optional TWAP size-aware guard
     if args.twap_guard:
-        tw = TWAPOracle(window=args.twap_window)
-        mid = route_mid_price_copx_per_col(pool_col_x, pool_x_copx)
-        tw.warm([mid] * args.twap_window)
         ok, dev, budget = size_aware_twap_guard(
             pool_col_x,
             pool_x_copx,
@@ -58,6 +89,7 @@ def cmd_quote(args: argparse.Namespace) -> int:
         )
         verdict = "OK" if ok else "BLOCK"
         print(f"  TWAP guard: dev={dev:.1f} bps  budget={budget:.1f} bps  => {verdict}")
+    checkpoint(args, pool_col_x, pool_x_copx, tw)
     return 0
 
 
@@ -80,7 +112,7 @@ def cmd_exec(args: argparse.Namespace) -> int:
 
 
 def cmd_sweep(args: argparse.Namespace) -> int:
-    pool_col_x, pool_x_copx = seed_pools()
+    pool_col_x, pool_x_copx, tw = restore_or_seed(args)
 
     sizes = (
         [float(s) for s in args.sizes]
@@ -91,52 +123,59 @@ def cmd_sweep(args: argparse.Namespace) -> int:
     outdir = Path(args.outdir or Path(__file__).resolve().parent / "out")
     outdir.mkdir(parents=True, exist_ok=True)
     stamp = time.strftime("%Y%m%d_%H%M%S")
-    csv_path = outdir / f"sweep_col_to_copx_{stamp}.csv"
-
-    # Warm TWAP
-    tw = TWAPOracle(window=args.twap_window)
-    mid0 = route_mid_price_copx_per_col(pool_col_x, pool_x_copx)
-    tw.warm([mid0] * args.twap_window)
-
-    rows = []
-    for col_in in sizes:
-        q = quote_col_to_copx(pool_col_x, pool_x_copx, col_in)
-        modeled = modeled_bps_impact_for_size(pool_col_x, pool_x_copx, col_in)
-        ok, dev, budget = size_aware_twap_guard(
+    out_path = outdir / f"sweep_col_to_copx_{stamp}.{args.format}"
+
+    # Fused, vectorized guard passes over SWEEP_CHUNK slices of the size curve,
+    # spread over one --workers pool (inline for a single slice) and streamed to
+    # the sink in order, so memory stays flat for any sweep length
+    twap_now = tw.value()
+    sizes_arr = np.asarray(sizes, dtype=float)
+    keep_for_charts = sizes_arr.size <= CHART_MAX_POINTS
+    chart_cols: dict[str, list] = {}
+    workers = args.workers if sizes_arr.size > SWEEP_CHUNK else 1
+    with worker_pool(workers) as ex, open_sink(out_path) as sink:
+        for g in iter_guard_chunks(
             pool_col_x,
             pool_x_copx,
             tw,
-            col_in,
+            sizes_arr,
+            chunk=SWEEP_CHUNK,
+            executor=ex,
             base_guard_bps=args.base_bps,
             cushion_bps=args.cushion_bps,
             cap_bps=args.cap_bps,
-        )
-        rows.append(
-            {
-                "col_in": col_in,
-                "copx_out": q.amount_out,
-                "eff_copx_per_col": q.effective_price,
-                "twap": tw.value(),
-                "dev_bps": dev,
-                "modeled_bps": modeled,
-                "budget_bps": budget,
-                "approved": ok,
+        ):
+            cols = {
+                "col_in": g.col_in,
+                "copx_out": g.copx_out,
+                "eff_copx_per_col": g.effective_price,
+                "twap": np.full(g.col_in.size, twap_now),
+                "dev_bps": g.deviation_bps,
+                "modeled_bps": g.modeled_bps,
+                "budget_bps": g.budget_bps,
+                "approved": g.approved,
             }
-        )
-
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=rows[0].keys())
-        w.writeheader()
-        w.writerows(rows)
-    print(f"Saved CSV -> {csv_path}")
+            sink.write_columns(cols)
+            if keep_for_charts:
+                for k, v in cols.items():
+                    chart_cols.setdefault(k, []).extend(v.tolist())
+    summary = sink.summary()
+    print(f"Saved {args.format.upper()} -> {out_path}  ({summary['rows']} rows)")
+    dev = summary["columns"].get("dev_bps")
+    if dev:
+        print(f"  dev_bps: min={dev['min']:.1f} mean={dev['mean']:.1f} max={dev['max']:.1f}")
+    checkpoint(args, pool_col_x, pool_x_copx, tw)
+    if not keep_for_charts:
+        print(f"Plotting skipped: more than {CHART_MAX_POINTS} sizes")
+        return 0
 
     # Optional charts
     try:
         import matplotlib.pyplot as plt
 
-        xs = [r["col_in"] for r in rows]
-        effs = [r["eff_copx_per_col"] for r in rows]
-        tws = [r["twap"] for r in rows]
+        xs = chart_cols["col_in"]
+        effs = chart_cols["eff_copx_per_col"]
+        tws = chart_cols["twap"]
 
         plt.figure()
         plt.plot(xs, effs, marker="o", label="Eff. price (COPX/COL)")
@@ -152,9 +191,9 @@ def cmd_sweep(args: argparse.Namespace) -> int:
         plt.close()
         print(f"Saved chart -> {p1}")
 
-        devs = [r["dev_bps"] for r in rows]
-        models = [r["modeled_bps"] for r in rows]
-        buds = [r["budget_bps"] for r in rows]
+        devs = chart_cols["dev_bps"]
+        models = chart_cols["modeled_bps"]
+        buds = chart_cols["budget_bps"]
 
         plt.figure()
         plt.plot(xs, devs, marker="o", label="Deviation (bps)")
@@ -176,6 +215,28 @@ def cmd_sweep(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_backtest(args: argparse.Namespace) -> int:
+    """Replay a fills CSV from --state pools (if that snapshot exists) or the seeded ones."""
+    from .backtest import run_backtest
+
+    if args.state and Path(args.state).exists():
+        snap = load_snapshot(args.state)
+        pools = snap.pools["col_x"], snap.pools["x_copx"]
+    else:
+        pools = seed_pools()
+    res = run_backtest(
+        args.fills,
+        args.out,
+        *pools,
+        twap_window_sec=args.twap_window_sec,
+        base_guard_bps=args.base_bps,
+        cushion_bps=args.cushion_bps,
+        cap_bps=args.cap_bps,
+    )
+    print(json.dumps(res))
+    return 0
+
+
 def main():
     p = argparse.ArgumentParser(
         prog="colink-sim", description="COLINK routed AMM simulator (COL ⇄ XRP ⇄ COPX)"
@@ -190,6 +251,7 @@ def main():
     p_q.add_argument("--base-bps", type=float, default=100.0)
     p_q.add_argument("--cushion-bps", type=float, default=150.0)
     p_q.add_argument("--cap-bps", type=float, default=2000.0)
+    p_q.add_argument("--state", help="Snapshot (.npz) to restore pools/TWAP from and save to")
     p_q.set_defaults(func=cmd_quote)
 
     p_e = sub.add_parser("exec", help="Execute COL→COPX (mutates pools)")
@@ -203,8 +265,21 @@ def main():
     p_s.add_argument("--cushion-bps", type=float, default=150.0)
     p_s.add_argument("--cap-bps", type=float, default=2000.0)
     p_s.add_argument("--outdir", type=str, help="Output folder (default: package out/)")
+    p_s.add_argument("--state", help="Snapshot (.npz) to restore pools/TWAP from and save to")
+    p_s.add_argument("--workers", type=int, default=1, help="Processes (0 = all cores)")
+    p_s.add_argument("--format", choices=["csv", "ndjson", "parquet"], default="csv")
     p_s.set_defaults(func=cmd_sweep)
 
+    p_b = sub.add_parser("backtest", help="Replay a fills CSV through the route (report)")
+    p_b.add_argument("--fills", required=True, help="CSV: ts,side,col_in,copx_out,price,slip_bps")
+    p_b.add_argument("--out", default="backtest.parquet", help="Report (.csv/.ndjson/.parquet)")
+    p_b.add_argument("--twap-window-sec", type=float, default=600.0)
+    p_b.add_argument("--base-bps", type=float, default=100.0)
+    p_b.add_argument("--cushion-bps", type=float, default=150.0)
+    p_b.add_argument("--cap-bps", type=float, default=2000.0)
+    p_b.add_argument("--state", help="Snapshot (.npz) with the pools to start from")
+    p_b.set_defaults(func=cmd_backtest)
+
     args = p.parse_args()
     raise SystemExit(args.func(args))
 
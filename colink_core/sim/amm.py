@@ -1,23 +1,86 @@
 from __future__ import annotations
 
+import itertools
 import math
 
+import numpy as np
 
-class PoolState:
-    def __init__(self, x_reserve: float, y_reserve: float, fee_bps: float = 30):
-        self.x_reserve = float(x_reserve)
-        self.y_reserve = float(y_reserve)
-        self.fee_bps = float(fee_bps)
 
-        # LP supply (initialize from current reserves so seed() has non-zero LP)
-        k = max(self.x_reserve * self.y_reserve, 0.0)
-        self.total_lp = math.sqrt(k) if k > 0 else 0.0
+def cp_amount_out(r_in: float, r_out: float, fee_bps: float, amount_in: float) -> float:
+    """
+    Closed-form constant-product output for `amount_in` paid into reserve `r_in`.
+    Same float operations (and therefore bit-identical results) as the PoolState swaps.
+    """
+    amount_eff = amount_in * (1.0 - fee_bps / 1e4)
+    k = r_in * r_out
+    return r_out - k / (r_in + amount_eff)
 
-        # Optional fee tallies for demos; harmless for tests
-        self.lp_fee_x = 0.0
-        self.lp_fee_y = 0.0
-        self.protocol_fee_x = 0.0
-        self.protocol_fee_y = 0.0
+
+def cp_amount_in(r_in: float, r_out: float, fee_bps: float, amount_out: float) -> float:
+    """
+    Inverse of cp_amount_out: input required to receive exactly `amount_out` from `r_out`.
+    Returns inf when the pool cannot pay that much (amount_out >= r_out).
+    """
+    if amount_out >= r_out:
+        return math.inf
+    k = r_in * r_out
+    return (k / (r_out - amount_out) - r_in) / (1.0 - fee_bps / 1e4)
+
+
+def cp_amount_in_many(r_in, r_out, fee_bps, amounts_out) -> np.ndarray:
+    """Array form of cp_amount_in; infeasible entries come back as inf."""
+    out = np.asarray(amounts_out, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = (r_in * r_out / (r_out - out) - r_in) / (1.0 - fee_bps / 1e4)
+    return np.where(out < r_out, a, np.inf)
+
+
+# Process-wide pool identities; (uid, version) names one reserve state of one pool.
+_pool_uids = itertools.count(1)
+_POOL_FIELDS = (
+    "x_reserve",
+    "y_reserve",
+    "fee_bps",
+    "total_lp",
+    "lp_fee_x",
+    "lp_fee_y",
+    "protocol_fee_x",
+    "protocol_fee_y",
+    "version",
+)
+
+
+class PoolBase:
+    """
+    Constant-product pool behaviour (swaps, quotes, liquidity) over the attributes
+    x_reserve, y_reserve, fee_bps, total_lp, the lp/protocol fee tallies, uid and
+    version. It declares no storage of its own (`__slots__ = ()`), so subclasses
+    choose it: PoolState keeps plain instance fields, while pool_bank.PoolView
+    reads and writes one PoolBank slot and carries no per-instance __dict__.
+    """
+
+    __slots__ = ()
+
+    def clone(self) -> PoolState:
+        """
+        Standalone PoolState holding this pool's current fields, with a fresh uid.
+        Unlike copy(), this also detaches subclasses that alias shared storage
+        (a PoolView clones to an independent pool, not another view).
+        """
+        new = PoolState.__new__(PoolState)
+        for f in _POOL_FIELDS:
+            setattr(new, f, getattr(self, f))
+        new.uid = next(_pool_uids)
+        return new
+
+    def set_reserves(self, x_reserve: float, y_reserve: float, *, updates: int = 1) -> None:
+        """
+        Overwrite both reserves with a state computed elsewhere (e.g. a replay of
+        `updates` swaps done on plain floats), bumping version once per update.
+        """
+        self.x_reserve = float(x_reserve)
+        self.y_reserve = float(y_reserve)
+        self.version += int(updates)
 
     # ----- Swaps (unchanged math; constant-product with fee) -----
     def _apply_fee(self, amount: float) -> float:
@@ -31,6 +94,7 @@ class PoolState:
         dy_out = self.y_reserve - y_new
         self.x_reserve += dx
         self.y_reserve -= dy_out
+        self.version += 1
         eff_price = dy_out / dx if dx > 0 else 0.0
         return dy_out, eff_price
 
@@ -42,9 +106,68 @@ class PoolState:
         dx_out = self.x_reserve - x_new
         self.y_reserve += dy
         self.x_reserve -= dx_out
+        self.version += 1
         eff_price = dx_out / dy if dy > 0 else 0.0
         return dx_out, eff_price
 
+    # ----- Batch quotes (non-mutating; same math as the scalar swaps) -----
+    def _quote_many(self, r_in: float, r_out: float, sizes) -> tuple[np.ndarray, np.ndarray]:
+        d = np.asarray(sizes, dtype=float)
+        d_eff = d * (1.0 - self.fee_bps / 1e4)
+        k = self.x_reserve * self.y_reserve
+        out = r_out - k / (r_in + d_eff)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eff = np.where(d > 0, out / d, 0.0)
+        return out, eff
+
+    def quote_many_x_for_y(self, sizes) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Quote swap_x_for_y for an array of dx sizes without touching reserves.
+        Returns (dy_out, eff_price) arrays shaped like `sizes`.
+        """
+        return self._quote_many(self.x_reserve, self.y_reserve, sizes)
+
+    def quote_many_y_for_x(self, sizes) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Quote swap_y_for_x for an array of dy sizes without touching reserves.
+        Returns (dx_out, eff_price) arrays shaped like `sizes`.
+        """
+        return self._quote_many(self.y_reserve, self.x_reserve, sizes)
+
+    # ----- Exact-output quotes (non-mutating inverse of the swaps) -----
+    def quote_exact_out_x_for_y(self, dy_out: float) -> tuple[float, float]:
+        """
+        X needed so that swap_x_for_y returns exactly `dy_out`.
+        Returns (dx_in, eff_price); dx_in is inf if the pool cannot pay `dy_out`.
+        """
+        dx_in = cp_amount_in(self.x_reserve, self.y_reserve, self.fee_bps, dy_out)
+        eff_price = dy_out / dx_in if 0 < dx_in < math.inf else 0.0
+        return dx_in, eff_price
+
+    def quote_exact_out_y_for_x(self, dx_out: float) -> tuple[float, float]:
+        """
+        Y needed so that swap_y_for_x returns exactly `dx_out`.
+        Returns (dy_in, eff_price); dy_in is inf if the pool cannot pay `dx_out`.
+        """
+        dy_in = cp_amount_in(self.y_reserve, self.x_reserve, self.fee_bps, dx_out)
+        eff_price = dx_out / dy_in if 0 < dy_in < math.inf else 0.0
+        return dy_in, eff_price
+
+    def _quote_many_exact_out(self, r_in: float, r_out: float, outs):
+        o = np.asarray(outs, dtype=float)
+        a = cp_amount_in_many(r_in, r_out, self.fee_bps, o)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eff = np.where((a > 0) & np.isfinite(a), o / a, 0.0)
+        return a, eff
+
+    def quote_many_exact_out_x_for_y(self, dy_outs) -> tuple[np.ndarray, np.ndarray]:
+        """Array form of quote_exact_out_x_for_y. Returns (dx_in, eff_price) arrays."""
+        return self._quote_many_exact_out(self.x_reserve, self.y_reserve, dy_outs)
+
+    def quote_many_exact_out_y_for_x(self, dx_outs) -> tuple[np.ndarray, np.ndarray]:
+        """Array form of quote_exact_out_y_for_x. Returns (dy_in, eff_price) arrays."""
+        return self._quote_many_exact_out(self.y_reserve, self.x_reserve, dx_outs)
+
     # ----- Liquidity -----
     def add_liquidity(self, dx: float, dy: float) -> float:
         """
@@ -64,6 +187,7 @@ class PoolState:
             self.x_reserve += dx
             self.y_reserve += dy
             self.total_lp = minted
+            self.version += 1
             return minted
 
         # Existing pool: mint proportionally
@@ -74,6 +198,7 @@ class PoolState:
         self.x_reserve += dx
         self.y_reserve += dy
         self.total_lp += minted
+        self.version += 1
         return minted
 
     def remove_liquidity(self, fraction: float) -> tuple[float, float]:
@@ -91,4 +216,38 @@ class PoolState:
         self.x_reserve -= dx
         self.y_reserve -= dy
         self.total_lp *= 1.0 - fraction
+        self.version += 1
         return dx, dy
+
+
+class PoolState(PoolBase):
+    """Single constant-product pool holding its fields as ordinary attributes."""
+
+    def __init__(self, x_reserve: float, y_reserve: float, fee_bps: float = 30):
+        self.x_reserve = float(x_reserve)
+        self.y_reserve = float(y_reserve)
+        self.fee_bps = float(fee_bps)
+
+        # LP supply (initialize from current reserves so seed() has non-zero LP)
+        k = max(self.x_reserve * self.y_reserve, 0.0)
+        self.total_lp = math.sqrt(k) if k > 0 else 0.0
+
+        # Optional fee tallies for demos; harmless for tests
+        self.lp_fee_x = 0.0
+        self.lp_fee_y = 0.0
+        self.protocol_fee_x = 0.0
+        self.protocol_fee_y = 0.0
+
+        # Bumped by every mutating method so derived values can be memoized
+        self.uid = next(_pool_uids)
+        self.version = 0
+
+    def __copy__(self) -> PoolState:
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.uid = next(_pool_uids)
+        return new
+
+    def __deepcopy__(self, memo) -> PoolState:
+        # all fields are immutable scalars, so a shallow copy with a fresh uid suffices
+        return self.__copy__()
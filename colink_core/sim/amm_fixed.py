@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from .amm import _pool_uids
+
+# XRPL expresses the AMM trading fee in units of 1/100,000 (tradingFee 1000 = 1%).
+FEE_DENOM = 100_000
+DROPS_PER_XRP = 1_000_000
+_I64_MAX = int(np.iinfo(np.int64).max)
+
+
+def to_units(amount: float, scale: int) -> int:
+    """Human amount -> integer ledger units (nearest unit; floats carry decimal noise)."""
+    return round(float(amount) * scale)
+
+
+def swap_out_units(r_in: int, r_out: int, trading_fee: int, amount_in: int) -> int:
+    """
+    Constant-product output in integer units, rounded down (in the pool's favour)
+    as XRPL's swapIn does: out = floor(r_out * a*g / (r_in*F + a*g)), g = F - fee.
+    """
+    if amount_in <= 0:
+        return 0
+    a_g = amount_in * (FEE_DENOM - trading_fee)
+    return r_out * a_g // (r_in * FEE_DENOM + a_g)
+
+
+def swap_in_units(r_in: int, r_out: int, trading_fee: int, amount_out: int) -> int:
+    """
+    Input needed to receive exactly `amount_out` units, rounded up (in the pool's
+    favour) as XRPL's swapOut does. Raises ValueError if the pool cannot pay it.
+    """
+    if amount_out <= 0:
+        return 0
+    if amount_out >= r_out:
+        raise ValueError("amount_out exceeds pool reserve")
+    num = r_in * amount_out * FEE_DENOM
+    den = (r_out - amount_out) * (FEE_DENOM - trading_fee)
+    return -(-num // den)
+
+
+class FixedPoolState:
+    """
+    Constant-product pool held in integer ledger units (XRP drops, scaled IOU units)
+    with XRPL AMM rounding: swap outputs, withdrawals and minted LP round down and
+    required inputs (swap_in_units) round up, so the pool never loses to rounding.
+
+    The float-facing API (x_reserve, y_reserve, fee_bps, swap_*, add/remove_liquidity)
+    mirrors PoolState, so router and guard helpers accept it unchanged; the *_units
+    methods work on raw integers and are exact.
+    """
+
+    def __init__(
+        self,
+        x_reserve: float,
+        y_reserve: float,
+        fee_bps: float = 30,
+        *,
+        x_scale: int = DROPS_PER_XRP,
+        y_scale: int = 1_000_000,
+    ):
+        self.x_scale = int(x_scale)
+        self.y_scale = int(y_scale)
+        self.x_units = to_units(x_reserve, self.x_scale)
+        self.y_units = to_units(y_reserve, self.y_scale)
+        self.trading_fee = round(float(fee_bps) * FEE_DENOM / 1e4)
+        if not 0 <= self.trading_fee < FEE_DENOM:
+            raise ValueError("fee_bps must be in [0, 10000)")
+
+        # LP supply in integer units, initialised like XRPL: sqrt(x * y)
+        self.lp_units = math.isqrt(max(self.x_units * self.y_units, 0))
+
+        self.uid = next(_pool_uids)
+        self.version = 0
+
+    # ----- PoolState-compatible float view -----
+    @property
+    def x_reserve(self) -> float:
+        return self.x_units / self.x_scale
+
+    @property
+    def y_reserve(self) -> float:
+        return self.y_units / self.y_scale
+
+    @property
+    def fee_bps(self) -> float:
+        return self.trading_fee * 1e4 / FEE_DENOM
+
+    @property
+    def total_lp(self) -> float:
+        return self.lp_units / math.sqrt(self.x_scale * self.y_scale)
+
+    # ----- Swaps (integer units) -----
+    def swap_x_for_y_units(self, dx: int) -> int:
+        dy_out = swap_out_units(self.x_units, self.y_units, self.trading_fee, int(dx))
+        self.x_units += int(dx)
+        self.y_units -= dy_out
+        self.version += 1
+        return dy_out
+
+    def swap_y_for_x_units(self, dy: int) -> int:
+        dx_out = swap_out_units(self.y_units, self.x_units, self.trading_fee, int(dy))
+        self.y_units += int(dy)
+        self.x_units -= dx_out
+        self.version += 1
+        return dx_out
+
+    # ----- Swaps (PoolState API) -----
+    def swap_x_for_y(self, dx: float) -> tuple[float, float]:
+        dx_u = to_units(dx, self.x_scale)
+        dy_out = self.swap_x_for_y_units(dx_u) / self.y_scale
+        eff_price = dy_out / (dx_u / self.x_scale) if dx_u > 0 else 0.0
+        return dy_out, eff_price
+
+    def swap_y_for_x(self, dy: float) -> tuple[float, float]:
+        dy_u = to_units(dy, self.y_scale)
+        dx_out = self.swap_y_for_x_units(dy_u) / self.x_scale
+        eff_price = dx_out / (dy_u / self.y_scale) if dy_u > 0 else 0.0
+        return dx_out, eff_price
+
+    # ----- Batch quotes (non-mutating, exact) -----
+    def _quote_many_units(self, r_in: int, r_out: int, amounts) -> np.ndarray:
+        a = np.maximum(np.asarray(amounts, dtype=np.int64), 0)
+        g = FEE_DENOM - self.trading_fee
+        a_g_max = int(a.max(initial=0)) * g
+        if r_out * a_g_max <= _I64_MAX and r_in * FEE_DENOM + a_g_max <= _I64_MAX:
+            # every intermediate fits in int64 (checked above on Python ints)
+            a_g = a * g
+            return r_out * a_g // (r_in * FEE_DENOM + a_g)
+        # overflow fallback: object arrays keep Python's arbitrary-precision ints
+        a_g = a.astype(object) * g
+        out = r_out * a_g // (r_in * FEE_DENOM + a_g)
+        return out.astype(np.int64)
+
+    def quote_many_x_for_y_units(self, dx_units) -> np.ndarray:
+        """Exact swap_x_for_y_units for each entry, without touching reserves."""
+        return self._quote_many_units(self.x_units, self.y_units, dx_units)
+
+    def quote_many_y_for_x_units(self, dy_units) -> np.ndarray:
+        """Exact swap_y_for_x_units for each entry, without touching reserves."""
+        return self._quote_many_units(self.y_units, self.x_units, dy_units)
+
+    def quote_many_x_for_y(self, sizes) -> tuple[np.ndarray, np.ndarray]:
+        """Float-facing batch quote, same shape as PoolState.quote_many_x_for_y."""
+        d = np.rint(np.asarray(sizes, dtype=float) * self.x_scale)
+        out = self.quote_many_x_for_y_units(d) / self.y_scale
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eff = np.where(d > 0, out / (d / self.x_scale), 0.0)
+        return out, eff
+
+    def quote_many_y_for_x(self, sizes) -> tuple[np.ndarray, np.ndarray]:
+        """Float-facing batch quote, same shape as PoolState.quote_many_y_for_x."""
+        d = np.rint(np.asarray(sizes, dtype=float) * self.y_scale)
+        out = self.quote_many_y_for_x_units(d) / self.x_scale
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eff = np.where(d > 0, out / (d / self.y_scale), 0.0)
+        return out, eff
+
+    # ----- Liquidity -----
+    def add_liquidity_units(self, dx: int, dy: int) -> int:
+        """
+        Proportional deposit in integer units; minted LP rounds down.
+        Returns minted LP units (0 if either side is non-positive).
+        """
+        dx, dy = int(dx), int(dy)
+        if dx <= 0 or dy <= 0:
+            return 0
+        if self.lp_units <= 0:
+            minted = math.isqrt(dx * dy)
+        else:
+            minted = min(dx * self.lp_units // self.x_units, dy * self.lp_units // self.y_units)
+        self.x_units += dx
+        self.y_units += dy
+        self.lp_units += minted
+        self.version += 1
+        return minted
+
+    def remove_liquidity_units(self, lp_burn: int) -> tuple[int, int]:
+        """Burn `lp_burn` LP units; withdrawn amounts round down. Returns (dx, dy)."""
+        lp_burn = min(int(lp_burn), self.lp_units)
+        if lp_burn <= 0:
+            return 0, 0
+        dx = self.x_units * lp_burn // self.lp_units
+        dy = self.y_units * lp_burn // self.lp_units
+        self.x_units -= dx
+        self.y_units -= dy
+        self.lp_units -= lp_burn
+        self.version += 1
+        return dx, dy
+
+    def add_liquidity(self, dx: float, dy: float) -> float:
+        """PoolState.add_liquidity in human units. Returns minted LP."""
+        minted = self.add_liquidity_units(to_units(dx, self.x_scale), to_units(dy, self.y_scale))
+        return minted / math.sqrt(self.x_scale * self.y_scale)
+
+    def remove_liquidity(self, fraction: float) -> tuple[float, float]:
+        """PoolState.remove_liquidity: burn a fraction of total LP, return (dx, dy)."""
+        fraction = min(float(fraction), 1.0)
+        if fraction <= 0:
+            return 0.0, 0.0
+        burn = self.lp_units if fraction >= 1.0 else int(self.lp_units * fraction)
+        dx, dy = self.remove_liquidity_units(burn)
+        return dx / self.x_scale, dy / self.y_scale
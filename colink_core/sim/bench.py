@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .amm import PoolState
+from .gbm import simulate_gbm
+from .limits import LimitConfig, TradeLimiter
+from .price_utils import VersionedLRU, modeled_bps_impact_for_size, route_mid_price_copx_per_col
+from .risk_guard import evaluate_guard_many, guard_decisions_many, size_aware_twap_guard
+from .router import quote_col_to_copx
+from .twap import TWAP, MedianOracle, TWAPOracle
+
+SCHEMA_VERSION = "colink.bench.v1"
+SIZES_COL = (100.0, 5_000.0, 50_000.0)
+
+
+@dataclass
+class BenchResult:
+    name: str
+    param: float
+    n_ops: int
+    ops_per_sec: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.param:g}]"
+
+
+def seed_pools():
+    pool_x_copx = PoolState(x_reserve=10_000.0, y_reserve=25_000_000.0, fee_bps=30)
+    pool_col_x = PoolState(x_reserve=10_000.0, y_reserve=200_000.0, fee_bps=30)
+    return pool_col_x, pool_x_copx
+
+
+def _warm_twap(pool_col_x, pool_x_copx, window: int = 8) -> TWAPOracle:
+    tw = TWAPOracle(window=window)
+    tw.warm([route_mid_price_copx_per_col(pool_col_x, pool_x_copx)] * window)
+    return tw
+
+
+# ----- Benchmark cases: factory(param) -> zero-arg op -----
+def _amm_swap(size: float) -> Callable[[], object]:
+    pool_col_x, _ = seed_pools()
+    return lambda: pool_col_x.swap_y_for_x(size)
+
+
+def _router_quote(size: float) -> Callable[[], object]:
+    a, b = seed_pools()
+    return lambda: quote_col_to_copx(a, b, size)
+
+
+def _modeled_impact_cold(size: float) -> Callable[[], object]:
+    a, b = seed_pools()
+    # private cache, so the cold case never evicts other callers' PRICE_CACHE entries
+    cache = VersionedLRU(maxsize=1)
+
+    def op():
+        cache.clear()
+        return modeled_bps_impact_for_size(a, b, size, cache)
+
+    return op
+
+
+def _modeled_impact_cached(size: float) -> Callable[[], object]:
+    a, b = seed_pools()
+    return lambda: modeled_bps_impact_for_size(a, b, size)
+
+
+def _guard(size: float) -> Callable[[], object]:
+    a, b = seed_pools()
+    tw = _warm_twap(a, b)
+    return lambda: size_aware_twap_guard(a, b, tw, size)
+
+
+def _guard_many(n: float) -> Callable[[], object]:
+    a, b = seed_pools()
+    tw = _warm_twap(a, b)
+    sizes = np.geomspace(100.0, 50_000.0, int(n))
+    return lambda: evaluate_guard_many(a, b, tw, sizes)
+
+
+def _guard_decisions(n: float) -> Callable[[], object]:
+    a, b = seed_pools()
+    tw = _warm_twap(a, b)
+    sizes = np.geomspace(100.0, 50_000.0, int(n))
+    slip = np.full(int(n), 500.0)
+    quoted = evaluate_guard_many(a, b, tw, sizes).copx_out
+    cfg = LimitConfig()
+    return lambda: guard_decisions_many(a, b, tw, sizes, slip, quoted_out=quoted, limits=cfg)
+
+
+def _twap_push(window: float) -> Callable[[], object]:
+    tw = TWAPOracle(window=int(window))
+    return lambda: tw.push(125.0)
+
+
+def _median_push(window: float) -> Callable[[], object]:
+    tw = MedianOracle(window=int(window))
+    prices = itertools.cycle(np.random.default_rng(7).normal(125.0, 1.0, 4096).tolist())
+    return lambda: tw.push(next(prices))
+
+
+def _twap_time_add(window_sec: float) -> Callable[[], object]:
+    tw = TWAP(window_sec=window_sec)
+    clock = iter(range(1 << 62))
+    return lambda: tw.add(125.0, ts=next(clock) * 0.01)
+
+
+def _limiter_check(size: float) -> Callable[[], object]:
+    lim = TradeLimiter(LimitConfig())
+    return lambda: lim.check_and_record(size, 100.0)
+
+
+def _gbm(n_paths: float) -> Callable[[], object]:
+    rng = np.random.default_rng(0)
+    return lambda: simulate_gbm(252, int(n_paths), 0.05, 0.2, seed=rng)
+
+
+def _backtest(n: float) -> Callable[[], object]:
+    from .backtest import backtest_fills  # pulls in the fills reader only when run
+
+    a, b = seed_pools()
+    rng = np.random.default_rng(3)
+    n = int(n)
+    sell = rng.random(n) < 0.5
+    col = rng.uniform(100.0, 5_000.0, n)
+    fills = {
+        "ts": np.datetime64("2025-01-01") + np.sort(rng.integers(0, 86_400, n)).astype("m8[s]"),
+        "side": np.where(sell, "sell", "buy"),
+        "col_in": col,
+        "copx_out": col * 125.0,
+        "price": np.full(n, 125.0),
+        "slip_bps": np.zeros(n),
+    }
+    return lambda: backtest_fills(fills, a, b)
+
+
+BENCHMARKS: dict[str, tuple[Callable[[float], Callable[[], object]], tuple[float, ...]]] = {
+    "amm.swap_y_for_x": (_amm_swap, SIZES_COL),
+    "router.quote_col_to_copx": (_router_quote, SIZES_COL),
+    "price_utils.modeled_bps_impact.cold": (_modeled_impact_cold, SIZES_COL),
+    "price_utils.modeled_bps_impact.cached": (_modeled_impact_cached, SIZES_COL),
+    "risk_guard.size_aware_twap_guard": (_guard, SIZES_COL),
+    "risk_guard.evaluate_guard_many": (_guard_many, (8.0, 1024.0)),
+    "risk_guard.guard_decisions_many": (_guard_decisions, (10_000.0,)),
+    "twap.push": (_twap_push, (8.0, 64.0, 1024.0)),
+    "twap.MedianOracle.push": (_median_push, (64.0, 1024.0)),
+    "twap.TWAP.add": (_twap_time_add, (1.0, 60.0)),
+    "gbm.simulate_gbm": (_gbm, (1_000.0,)),
+    "backtest.backtest_fills": (_backtest, (10_000.0,)),
+    "limits.check_and_record": (_limiter_check, (1_000.0, 30_000.0)),
+}
+
+
+def measure(name: str, param: float, op: Callable[[], object], *, number: int, repeat: int):
+    """
+    Time `repeat` rounds of `number` calls. ops/sec comes from a batch timed as a
+    whole in each round; p50/p95/p99 are per-call latencies from a second,
+    individually timed pass (each sample includes one perf_counter_ns pair).
+    """
+    for _ in range(min(number, 1_000)):
+        op()
+    batch_us = np.empty(repeat)
+    call_ns = np.empty((repeat, number), dtype=np.int64)
+    clock, clock_ns = time.perf_counter, time.perf_counter_ns
+    for r in range(repeat):
+        t0 = clock()
+        for _ in range(number):
+            op()
+        batch_us[r] = (clock() - t0) * 1e6 / number
+        row = call_ns[r]
+        for j in range(number):
+            t = clock_ns()
+            op()
+            row[j] = clock_ns() - t
+    p50, p95, p99 = np.percentile(call_ns, [50, 95, 99]) / 1e3
+    n_ops = number * repeat
+    ops_per_sec = 1e6 / float(batch_us.mean())
+    return BenchResult(name, param, n_ops, ops_per_sec, float(p50), float(p95), float(p99))
+
+
+def run_suite(
+    *, number: int = 2_000, repeat: int = 25, only: list[str] | None = None
+) -> list[BenchResult]:
+    results = []
+    for name, (factory, params) in BENCHMARKS.items():
+        if only and not any(name.startswith(o) for o in only):
+            continue
+        for param in params:
+            results.append(measure(name, param, factory(param), number=number, repeat=repeat))
+    return results
+
+
+# git's all-zero object id: "no commit known", still a valid schema `sha`
+NULL_SHA = "0" * 40
+
+
+def git_sha() -> str:
+    """HEAD commit from $GITHUB_SHA / $GIT_SHA, else `git rev-parse HEAD`, else NULL_SHA."""
+    sha = os.getenv("GITHUB_SHA") or os.getenv("GIT_SHA")
+    if sha:
+        return sha
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return NULL_SHA
+    return out.stdout.strip() or NULL_SHA
+
+
+def to_metrics_doc(results: list[BenchResult], run_id: str, sha: str | None = None) -> dict:
+    """
+    Collector-friendly *.metrics.json document (same top-level shape as
+    tools/collect.py, valid against tools/metrics.schema.json). `sha` defaults to
+    git_sha(). success_rate is null: micro-benchmarks have no failing events.
+    """
+    return {
+        "run_id": run_id,
+        "timestamp": dt.datetime.now(dt.UTC).isoformat(),
+        "backend": "cpython-" + platform.python_version(),
+        "os": platform.platform(),
+        "sha": sha or git_sha(),
+        "schema_version": SCHEMA_VERSION,
+        "metrics": {
+            "success_rate": None,
+            "p95_latency_ms": max((r.p95_us for r in results), default=0.0) / 1e3,
+            "events_count": len(results),
+            "benchmarks": {r.key: asdict(r) for r in results},
+        },
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """
+    Return one message per benchmark whose ops/sec fell more than `threshold`
+    (fraction, e.g. 0.2 = 20%) below the baseline. Missing keys are ignored.
+    """
+    base = baseline.get("metrics", {}).get("benchmarks", {})
+    cur = current.get("metrics", {}).get("benchmarks", {})
+    failures = []
+    for key, b in base.items():
+        c = cur.get(key)
+        if c is None or b["ops_per_sec"] <= 0:
+            continue
+        drop = 1.0 - c["ops_per_sec"] / b["ops_per_sec"]
+        if drop > threshold:
+            failures.append(
+                f"{key}: {c['ops_per_sec']:,.0f} ops/s vs baseline {b['ops_per_sec']:,.0f} "
+                f"(-{drop:.0%} > {threshold:.0%})"
+            )
+    return failures
+
+
+def _print_table(results: list[BenchResult]) -> None:
+    print(f"{'benchmark':<48} {'ops/s':>14} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9}")
+    for r in results:
+        print(
+            f"{r.key:<48} {r.ops_per_sec:>14,.0f} {r.p50_us:>9.2f} {r.p95_us:>9.2f} {r.p99_us:>9.2f}"
+        )
+
+
+def _load(path: str) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8-sig"))
+
+
+def _report(failures: list[str]) -> int:
+    for f in failures:
+        print(f"[bench][FAIL] {f}")
+    if not failures:
+        print("[bench] no regressions past threshold")
+    return 1 if failures else 0
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    results = run_suite(number=args.number, repeat=args.repeat, only=args.only)
+    _print_table(results)
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    run_id = out.name.removesuffix(".metrics.json")
+    doc = to_metrics_doc(results, run_id=run_id, sha=args.sha)
+    out.write_text(json.dumps(doc, indent=2), encoding="utf-8")
+    print(f"Saved metrics -> {out}")
+
+    if args.baseline:
+        return _report(compare(_load(args.baseline), doc, args.threshold))
+    return 0
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    return _report(compare(_load(args.baseline), _load(args.current), args.threshold))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="colink-bench", description="Micro-benchmarks for the colink_core.sim hot paths"
+    )
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    p_run = sub.add_parser("run", help="Run the suite and write *.metrics.json")
+    p_run.add_argument("--out", default=".artifacts/bench.metrics.json")
+    p_run.add_argument("--number", type=int, default=2_000, help="Calls per timed batch")
+    p_run.add_argument("--repeat", type=int, default=25, help="Timed batches per case")
+    p_run.add_argument("--only", nargs="*", help="Benchmark name prefixes to run")
+    p_run.add_argument("--sha", default=None)
+    p_run.add_argument("--baseline", help="Baseline *.metrics.json to gate against")
+    p_run.add_argument("--threshold", type=float, default=0.20, help="Max ops/s drop (fraction)")
+    p_run.set_defaults(func=cmd_run)
+
+    p_cmp = sub.add_parser("compare", help="Compare two bench *.metrics.json files")
+    p_cmp.add_argument("--baseline", required=True)
+    p_cmp.add_argument("--current", required=True)
+    p_cmp.add_argument("--threshold", type=float, default=0.20, help="Max ops/s drop (fraction)")
+    p_cmp.set_defaults(func=cmd_compare)
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import math
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+from .parallel import parallel_map
+from .rng import RngStreams
+
+DEFAULT_CHUNK_PATHS = 8_192
+
+
+def _fill_chunk(
+    rng: np.random.Generator, buf: np.ndarray, out: np.ndarray, mu_dt: float, sig_sqrt_dt: float
+) -> None:
+    # buf: (m, n_steps) scratch; out: (m, n_steps + 1) paths with out[:, 0] = s0
+    rng.standard_normal(out=buf)
+    buf *= sig_sqrt_dt
+    buf += mu_dt
+    np.cumsum(buf, axis=1, out=buf)
+    np.exp(buf, out=buf)
+    np.multiply(buf, out[:, :1], out=out[:, 1:])
+
+
+def _plan(n_steps, n_paths, drift, vol, dt, s0, chunk_paths):
+    if chunk_paths <= 0:
+        raise ValueError("chunk_paths must be > 0")
+    n_steps = max(int(n_steps), 1)
+    n_paths = max(int(n_paths), 1)
+    if dt is None:
+        dt = 1.0 / float(n_steps)
+    p = (n_steps, (drift - 0.5 * vol * vol) * dt, vol * math.sqrt(dt), float(s0))
+    bounds = [(a, min(a + chunk_paths, n_paths)) for a in range(0, n_paths, chunk_paths)]
+    return (n_paths, n_steps + 1), bounds, p
+
+
+def _chunk_rngs(seed, n_chunks: int) -> Iterator[np.random.Generator]:
+    # RngStreams: chunk i has its own keyed stream; anything else: one shared
+    # Generator drawn path-major across chunks
+    if isinstance(seed, RngStreams):
+        for i in range(n_chunks):
+            yield seed.generator(path=i)
+    else:
+        rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        for _ in range(n_chunks):
+            yield rng
+
+
+def _fill_unit(out: np.ndarray, rng: np.random.Generator, p, buf=None) -> None:
+    n_steps, mu_dt, sig, s0 = p
+    out[:, 0] = s0
+    if buf is None:
+        buf = np.empty((out.shape[0], n_steps))
+    _fill_chunk(rng, buf[: out.shape[0]], out, mu_dt, sig)
+
+
+def iter_gbm_chunks(
+    n_steps: int,
+    n_paths: int,
+    drift: float = 0.0,
+    vol: float = 0.2,
+    seed=None,
+    dt: float | None = None,
+    *,
+    s0: float = 1.0,
+    chunk_paths: int = DEFAULT_CHUNK_PATHS,
+) -> Iterator[np.ndarray]:
+    """
+    simulate_gbm streamed `chunk_paths` rows at a time as (m, n_steps + 1) arrays,
+    so memory is bounded by one chunk however many paths are requested. The
+    concatenated chunks equal simulate_gbm(...) with the same arguments.
+    """
+    shape, bounds, p = _plan(n_steps, n_paths, drift, vol, dt, s0, chunk_paths)
+    buf = np.empty((bounds[0][1], shape[1] - 1))
+    for (a, b), rng in zip(bounds, _chunk_rngs(seed, len(bounds)), strict=True):
+        out = np.empty((b - a, shape[1]))
+        _fill_unit(out, rng, p, buf)
+        yield out
+
+
+def _gbm_unit(job) -> None:
+    # worker side: write this unit's rows straight into the shared result file
+    path, shape, start, stop, rng, p = job
+    paths = np.memmap(path, dtype=np.float64, mode="r+", shape=shape)
+    _fill_unit(paths[start:stop], rng, p)
+    paths.flush()
+
+
+def simulate_gbm(
+    n_steps: int,
+    n_paths: int,
+    drift: float = 0.0,
+    vol: float = 0.2,
+    seed=None,
+    dt: float | None = None,
+    *,
+    s0: float = 1.0,
+    chunk_paths: int = DEFAULT_CHUNK_PATHS,
+    workers: int | None = 1,
+) -> np.ndarray:
+    """
+    Geometric Brownian motion paths as one (n_paths, n_steps + 1) float64 array,
+    paths[i, t], starting at `s0`, generated `chunk_paths` rows at a time.
+
+    `seed` picks the randomness:
+    - an int, None or a numpy Generator: one Generator drawn path-major, so the
+      result is the same for any chunk_paths; chunks run in this process, through
+      one reused scratch buffer (peak memory is the result plus one chunk).
+    - an RngStreams: chunk i draws from its keyed stream (path=i), so any chunk
+      can be regenerated alone and the result depends on chunk_paths but never on
+      `workers`. Chunks then fan out across `workers` processes (None = all
+      cores), which fill a memory-mapped result in place.
+    """
+    shape, bounds, p = _plan(n_steps, n_paths, drift, vol, dt, s0, chunk_paths)
+    rngs = _chunk_rngs(seed, len(bounds))
+    if workers == 1 or len(bounds) == 1:
+        paths = np.empty(shape)
+        buf = np.empty((bounds[0][1], shape[1] - 1))
+        for (a, b), rng in zip(bounds, rngs, strict=True):
+            _fill_unit(paths[a:b], rng, p, buf)
+        return paths
+    if not isinstance(seed, RngStreams):
+        raise ValueError("workers != 1 needs an RngStreams seed (one Generator cannot be split)")
+
+    with tempfile.TemporaryDirectory(prefix="colink-gbm-") as tmp:
+        path = Path(tmp) / "paths.f64"
+        np.memmap(path, dtype=np.float64, mode="w+", shape=shape).flush()
+        jobs = [(path, shape, a, b, rng, p) for (a, b), rng in zip(bounds, rngs, strict=True)]
+        parallel_map(_gbm_unit, jobs, workers)
+        return np.array(np.memmap(path, dtype=np.float64, mode="r", shape=shape))
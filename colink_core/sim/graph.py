@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from .amm import PoolState, cp_amount_out
+from .price_utils import pools_key
+from .split import Route, hop_reserves
+
+
+@dataclass
+class PathQuote:
+    path: list[str]  # asset codes visited, src first
+    amount_in: float
+    amount_out: float
+    effective_price: float
+    hop_outs: list[float]
+
+
+class PoolGraph:
+    """
+    Asset graph whose edges are PoolState instances (X asset <-> Y asset).
+
+    Candidate paths of up to `max_hops` between two assets are enumerated once and
+    kept until the graph topology changes. The best path for a size is cached per
+    log-spaced size bucket (`bucket_base` ** n) and reused until a pool on that
+    cached path is mutated (version bump or fee change; see price_utils.pools_key).
+    A hit checks only the cached path's pools, so it costs one path evaluation
+    however many candidates the pair has. Mutations to pools off the cached path
+    do not invalidate it: if another path may have become better (e.g. liquidity
+    was added elsewhere), call clear_cache().
+    """
+
+    def __init__(self, max_hops: int = 3, bucket_base: float = 2.0):
+        if max_hops <= 0:
+            raise ValueError("max_hops must be > 0")
+        if bucket_base <= 1.0:
+            raise ValueError("bucket_base must be > 1")
+        self.max_hops = int(max_hops)
+        self.bucket_base = float(bucket_base)
+        self._adj: dict[str, list[tuple[str, PoolState, str]]] = {}
+        self._paths: dict[tuple[str, str], list[tuple[list[str], Route]]] = {}
+        self._best: dict[tuple[str, str, int], tuple[int, tuple]] = {}
+
+    # ----- Topology -----
+    def add_pool(self, pool: PoolState, x_asset: str, y_asset: str) -> None:
+        """Register `pool` with X = `x_asset`, Y = `y_asset` (tradable both ways)."""
+        if x_asset == y_asset:
+            raise ValueError("pool assets must differ")
+        self._adj.setdefault(x_asset, []).append((y_asset, pool, "x_for_y"))
+        self._adj.setdefault(y_asset, []).append((x_asset, pool, "y_for_x"))
+        self._paths.clear()
+        self._best.clear()
+
+    def clear_cache(self) -> None:
+        """Forget every cached best-path choice (candidate paths are kept)."""
+        self._best.clear()
+
+    def assets(self) -> list[str]:
+        return sorted(self._adj)
+
+    def paths(self, src: str, dst: str) -> list[tuple[list[str], Route]]:
+        """All simple paths src -> dst of at most max_hops hops (precomputed per pair)."""
+        key = (src, dst)
+        cached = self._paths.get(key)
+        if cached is not None:
+            return cached
+
+        out: list[tuple[list[str], Route]] = []
+
+        def walk(asset: str, assets: list[str], hops: list) -> None:
+            if asset == dst and hops:
+                out.append((list(assets), list(hops)))
+                return
+            if len(hops) == self.max_hops:
+                return
+            for nxt, pool, side in self._adj.get(asset, ()):
+                if nxt in assets:
+                    continue
+                assets.append(nxt)
+                hops.append((pool, side))
+                walk(nxt, assets, hops)
+                assets.pop()
+                hops.pop()
+
+        if src != dst:
+            walk(src, [src], [])
+        self._paths[key] = out
+        return out
+
+    # ----- Quoting -----
+    def _bucket(self, amount_in: float) -> int:
+        return math.floor(math.log(amount_in, self.bucket_base)) if amount_in > 0 else -(10**9)
+
+    @staticmethod
+    def _route_key(route: Route) -> tuple | None:
+        return pools_key(*(pool for pool, _side in route))
+
+    @staticmethod
+    def _walk(route: Route, amount_in: float) -> list[float]:
+        outs = []
+        amt = amount_in
+        for pool, side in route:
+            r_in, r_out = hop_reserves(pool, side)
+            amt = cp_amount_out(r_in, r_out, pool.fee_bps, amt)
+            outs.append(amt)
+        return outs
+
+    def best_path(self, src: str, dst: str, amount_in: float) -> tuple[list[str], Route]:
+        """Best candidate path for `amount_in` (cached per size bucket)."""
+        candidates = self.paths(src, dst)
+        if not candidates:
+            raise ValueError(f"no path from {src} to {dst} within {self.max_hops} hops")
+
+        key = (src, dst, self._bucket(amount_in))
+        hit = self._best.get(key)
+        if hit is not None:
+            i, pk = hit
+            if self._route_key(candidates[i][1]) == pk:
+                return candidates[i]
+
+        best_i = max(
+            range(len(candidates)), key=lambda i: self._walk(candidates[i][1], amount_in)[-1]
+        )
+        pk = self._route_key(candidates[best_i][1])
+        if pk is not None:  # pools without versions are never cached
+            self._best[key] = (best_i, pk)
+        return candidates[best_i]
+
+    def quote(self, src: str, dst: str, amount_in: float) -> PathQuote:
+        """Non-mutating quote along the best path for `amount_in`."""
+        assets, route = self.best_path(src, dst, amount_in)
+        hop_outs = self._walk(route, amount_in)
+        out = hop_outs[-1]
+        eff_price = out / amount_in if amount_in > 0 else 0.0
+        return PathQuote(assets, amount_in, out, eff_price, hop_outs)
+
+    def execute(self, src: str, dst: str, amount_in: float) -> PathQuote:
+        """Mutating execution along the best path for `amount_in`."""
+        assets, route = self.best_path(src, dst, amount_in)
+        hop_outs = []
+        amt = amount_in
+        for pool, side in route:
+            if side == "x_for_y":
+                amt, _ = pool.swap_x_for_y(amt)
+            else:
+                amt, _ = pool.swap_y_for_x(amt)
+            hop_outs.append(amt)
+        eff_price = amt / amount_in if amount_in > 0 else 0.0
+        return PathQuote(assets, amount_in, amt, eff_price, hop_outs)
@@ -5,9 +5,10 @@ from __future__ import annotations
 try:
     from .run_sweep import plot_hist, plot_paths, simulate_gbm_paths  # type: ignore
 except Exception:
-    import math
     import os
-    import random
+
+    from .gbm import DEFAULT_CHUNK_PATHS, simulate_gbm
+    from .rng import RngStreams
 
     def simulate_gbm_paths(
         n_steps: int,
@@ -16,24 +17,16 @@ except Exception:
         vol: float = 0.2,
         seed: int | None = None,
         dt: float | None = None,
+        chunk_paths: int = DEFAULT_CHUNK_PATHS,
+        workers: int | None = 1,
         **_kw: object,
     ):
-        n_steps = max(int(n_steps), 1)
-        n_paths = max(int(n_paths), 1)
-        if dt is None:
-            dt = 1.0 / float(n_steps)
-        rng = random.Random(seed) if seed is not None else random
-        # paths[i][t]
-        paths = [[0.0] * (n_steps + 1) for _ in range(n_paths)]
-        for i in range(n_paths):
-            paths[i][0] = 1.0
-        drift_term = drift - 0.5 * vol * vol
-        sqrt_dt = math.sqrt(dt)
-        for t in range(1, n_steps + 1):
-            for i in range(n_paths):
-                z = rng.gauss(0.0, 1.0)
-                paths[i][t] = paths[i][t - 1] * math.exp(drift_term * dt + vol * sqrt_dt * z)
-        return paths
+        # paths[i, t] as a (n_paths, n_steps + 1) array; each chunk has its own
+        # keyed stream (see gbm.simulate_gbm), so `workers` never changes it
+        streams = RngStreams(seed, scenario="gbm")
+        return simulate_gbm(
+            n_steps, n_paths, drift, vol, streams, dt, chunk_paths=chunk_paths, workers=workers
+        )
 
     def _write_dummy_png(path: str, text: str) -> str:
         try:
@@ -105,6 +98,15 @@ def build_parser() -> argparse.ArgumentParser:
     p_sweep.add_argument("--drift", type=float, default=0.0)
     p_sweep.add_argument("--vol", type=float, default=0.2)
     p_sweep.add_argument("--seed", type=int, default=None)
+    p_sweep.add_argument(
+        "--chunk-paths", type=int, default=8_192, dest="chunk_paths", help="Paths per GBM chunk"
+    )
+    p_sweep.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes (default 1, 0 = all cores); paths are identical for any value",
+    )
     p_sweep.set_defaults(func=cmd_sweep)
 
     return p
@@ -152,6 +154,8 @@ def cmd_sweep(ns: argparse.Namespace) -> int:
         vol=vol,
         seed=seed,
         dt=dt,
+        chunk_paths=int(ns.chunk_paths),
+        workers=int(ns.workers),
     )
     try:
         p1 = plot_paths(paths, outdir)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass
 
 
@@ -12,6 +15,10 @@ class LimitConfig:
 
 
 class TradeLimiter:
+    # slotted: a LimiterRegistry may hold ~100k of these, and subclasses
+    # (_KeyedLimiter, threadsafe.LockedTradeLimiter) declare their own slots
+    __slots__ = ("_cooldown_left", "_need_requote", "cfg", "strikes", "tripped")
+
     def __init__(self, cfg: LimitConfig):
         self.cfg = cfg
         self.strikes = 0
@@ -66,3 +73,89 @@ class TradeLimiter:
         # success clears strikes
         self.strikes = 0
         return True, "approved"
+
+
+class _KeyedLimiter(TradeLimiter):
+    """TradeLimiter plus the last-touch time the registry evicts on."""
+
+    __slots__ = ("last_seen",)
+
+    def __init__(self, cfg: LimitConfig, now: float):
+        super().__init__(cfg)
+        self.last_seen = now
+
+
+class LimiterRegistry:
+    """
+    One TradeLimiter per key, typically (account, pair), all sharing one LimitConfig.
+
+    State is created lazily on the first check_and_record for a key and kept in LRU
+    order. Entries idle longer than `idle_ttl_sec` are evicted as the registry is
+    touched, and the least recently used entry is dropped beyond `max_keys`, so
+    memory stays bounded however many accounts trade. An evicted key starts again
+    from a fresh (untripped, zero-strike) limiter.
+    """
+
+    def __init__(
+        self,
+        cfg: LimitConfig | None = None,
+        *,
+        max_keys: int = 100_000,
+        idle_ttl_sec: float | None = 3_600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_keys <= 0:
+            raise ValueError("max_keys must be > 0")
+        self.cfg = cfg or LimitConfig()
+        self.max_keys = int(max_keys)
+        self.idle_ttl_sec = idle_ttl_sec
+        self._clock = clock
+        self._limiters: OrderedDict[Hashable, _KeyedLimiter] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._limiters)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._limiters
+
+    def evict_idle(self, now: float | None = None) -> int:
+        """Drop entries idle longer than idle_ttl_sec (oldest first). Returns count."""
+        if self.idle_ttl_sec is None:
+            return 0
+        now = self._clock() if now is None else now
+        cutoff = now - self.idle_ttl_sec
+        evicted = 0
+        lims = self._limiters
+        while lims:
+            oldest = next(iter(lims.values()))
+            if oldest.last_seen > cutoff:
+                break
+            lims.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def get(self, key: Hashable) -> TradeLimiter:
+        """Limiter for `key`, created on first use and marked as most recently used."""
+        now = self._clock()
+        self.evict_idle(now)
+        lims = self._limiters
+        lim = lims.get(key)
+        if lim is None:
+            lim = _KeyedLimiter(self.cfg, now)
+            lims[key] = lim
+            if len(lims) > self.max_keys:
+                lims.popitem(last=False)
+        else:
+            lim.last_seen = now
+            lims.move_to_end(key)
+        return lim
+
+    def can_trade(self, key: Hashable) -> tuple[bool, str]:
+        """TradeLimiter.can_trade for `key`; unknown keys are allowed without allocating."""
+        if key not in self._limiters:
+            return True, "ok"
+        return self.get(key).can_trade()
+
+    def check_and_record(self, key: Hashable, col_in: float, dev_bps: float) -> tuple[bool, str]:
+        """TradeLimiter.check_and_record for `key`."""
+        return self.get(key).check_and_record(col_in, dev_bps)
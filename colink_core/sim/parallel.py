@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def resolve_workers(workers: int | None) -> int:
+    """--workers value -> process count (None or 0 = all cores)."""
+    return max(1, int(workers)) if workers else (os.cpu_count() or 1)
+
+
+@contextmanager
+def worker_pool(workers: int | None) -> Iterator[Executor | None]:
+    """
+    One process pool for a whole command, shared by every batch it fans out.
+    Yields None for a single worker, so callers run inline without a pool.
+    """
+    n = resolve_workers(workers)
+    if n <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=n) as ex:
+        yield ex
+
+
+def imap_ordered(
+    fn: Callable[[T], R], units: Iterable[T], executor: Executor | None = None, *, ahead: int = 8
+) -> Iterator[R]:
+    """
+    Lazy fn over `units`, results in unit order. Inline without an executor;
+    otherwise at most `ahead` units are submitted but not yet consumed, so a
+    slow consumer (e.g. a file sink) keeps memory bounded.
+    """
+    if executor is None:
+        yield from map(fn, units)
+        return
+    pending: deque = deque()
+    for u in units:
+        pending.append(executor.submit(fn, u))
+        if len(pending) >= ahead:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def parallel_map(
+    fn: Callable[[T], R],
+    units: Iterable[T],
+    workers: int | None = 1,
+    *,
+    executor: Executor | None = None,
+) -> list[R]:
+    """
+    fn over `units` in worker processes, results in unit order. Pass `executor`
+    to reuse a worker_pool; otherwise one is started for this call. One worker
+    (or one unit) runs inline, so serial and parallel runs share every code path.
+    `fn` and the units must be picklable (module-level functions, plain data).
+    """
+    units = list(units)
+    if len(units) <= 1:
+        return [fn(u) for u in units]
+    if executor is not None:
+        return list(imap_ordered(fn, units, executor, ahead=len(units)))
+    n = min(resolve_workers(workers), len(units))
+    if n <= 1:
+        return [fn(u) for u in units]
+    with ProcessPoolExecutor(max_workers=n) as ex:
+        return list(ex.map(fn, units, chunksize=max(1, len(units) // (4 * n))))
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from copy import deepcopy
+
+import numpy as np
+
+from .amm import PoolBase, PoolState, _pool_uids
+
+
+class PoolBank:
+    """
+    Many constant-product pools stored column-wise in contiguous NumPy arrays
+    (x_reserve, y_reserve, fee_bps, total_lp), one slot per pool.
+
+    Every operation takes an optional `idx` (slice, unique int array or bool mask)
+    selecting the pools it applies to; amounts broadcast against that selection.
+    The math is the same as PoolState's, element-wise.
+    """
+
+    def __init__(self, x_reserve, y_reserve, fee_bps=30):
+        self.x_reserve = np.array(x_reserve, dtype=float, ndmin=1)
+        self.y_reserve = np.array(y_reserve, dtype=float, ndmin=1)
+        if self.x_reserve.shape != self.y_reserve.shape or self.x_reserve.ndim != 1:
+            raise ValueError("x_reserve and y_reserve must be 1-D arrays of equal length")
+        n = self.x_reserve.shape[0]
+        self.fee_bps = np.broadcast_to(np.asarray(fee_bps, dtype=float), (n,)).copy()
+
+        # LP supply initialised from reserves, as in PoolState
+        k = np.maximum(self.x_reserve * self.y_reserve, 0.0)
+        self.total_lp = np.sqrt(k)
+
+        # Per-pool versions, bumped by every mutating call (see PoolState.version)
+        self.uid = next(_pool_uids)
+        self.version = np.zeros(n, dtype=np.int64)
+
+    @classmethod
+    def from_pools(cls, pools: Iterable[PoolState]) -> PoolBank:
+        pools = list(pools)
+        bank = cls(
+            [p.x_reserve for p in pools],
+            [p.y_reserve for p in pools],
+            [p.fee_bps for p in pools],
+        )
+        bank.total_lp[:] = [p.total_lp for p in pools]
+        return bank
+
+    def __deepcopy__(self, memo) -> PoolBank:
+        new = self.__class__.__new__(self.__class__)
+        for name in ("x_reserve", "y_reserve", "fee_bps", "total_lp", "version"):
+            setattr(new, name, getattr(self, name).copy())
+        new.uid = next(_pool_uids)
+        return new
+
+    def __len__(self) -> int:
+        return self.x_reserve.shape[0]
+
+    def view(self, i: int) -> PoolView:
+        """PoolState-compatible view of pool `i`; reads and writes go to the bank arrays."""
+        n = len(self)
+        if not -n <= i < n:
+            raise IndexError(f"pool index {i} out of range for bank of {n}")
+        return PoolView(self, i % n)
+
+    # ----- Swaps -----
+    @staticmethod
+    def _sel(idx):
+        return slice(None) if idx is None else idx
+
+    def _swap(self, r_in: np.ndarray, r_out: np.ndarray, amount, idx):
+        s = self._sel(idx)
+        d = np.asarray(amount, dtype=float)
+        x_in, x_out = r_in[s], r_out[s]
+        d_eff = d * (1.0 - self.fee_bps[s] / 1e4)
+        k = self.x_reserve[s] * self.y_reserve[s]
+        out = x_out - k / (x_in + d_eff)
+        r_in[s] = x_in + d
+        r_out[s] = x_out - out
+        self.version[s] += 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eff = np.where(d > 0, out / d, 0.0)
+        return out, eff
+
+    def swap_x_for_y(self, dx, idx=None) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized PoolState.swap_x_for_y. Returns (dy_out, eff_price) arrays."""
+        return self._swap(self.x_reserve, self.y_reserve, dx, idx)
+
+    def swap_y_for_x(self, dy, idx=None) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized PoolState.swap_y_for_x. Returns (dx_out, eff_price) arrays."""
+        return self._swap(self.y_reserve, self.x_reserve, dy, idx)
+
+    # ----- Liquidity -----
+    def add_liquidity(self, dx, dy, idx=None) -> np.ndarray:
+        """
+        Vectorized PoolState.add_liquidity.
+        Pools with dx <= 0 or dy <= 0 are left untouched and mint 0.
+        Returns minted LP per selected pool.
+        """
+        s = self._sel(idx)
+        x, y, lp = self.x_reserve[s], self.y_reserve[s], self.total_lp[s]
+        dx = np.broadcast_to(np.asarray(dx, dtype=float), x.shape)
+        dy = np.broadcast_to(np.asarray(dy, dtype=float), x.shape)
+        valid = (dx > 0) & (dy > 0)
+        first = lp <= 0
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            proportional = np.minimum(dx / x, dy / y) * lp
+        minted = np.where(first, np.sqrt(np.where(valid, dx * dy, 0.0)), proportional)
+        minted = np.where(valid, minted, 0.0)
+
+        self.x_reserve[s] = np.where(valid, x + dx, x)
+        self.y_reserve[s] = np.where(valid, y + dy, y)
+        self.total_lp[s] = np.where(valid, np.where(first, minted, lp + minted), lp)
+        self.version[s] += valid
+        return minted
+
+    def remove_liquidity(self, fraction, idx=None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized PoolState.remove_liquidity: burn `fraction` of LP (clipped to 1.0)
+        in each selected pool. Returns (dx, dy) arrays withdrawn.
+        """
+        s = self._sel(idx)
+        x, y = self.x_reserve[s], self.y_reserve[s]
+        f = np.broadcast_to(np.asarray(fraction, dtype=float), x.shape)
+        f = np.where(f > 0, np.minimum(f, 1.0), 0.0)
+
+        dx = x * f
+        dy = y * f
+        self.x_reserve[s] = x - dx
+        self.y_reserve[s] = y - dy
+        self.total_lp[s] = self.total_lp[s] * (1.0 - f)
+        self.version[s] += f > 0
+        return dx, dy
+
+
+def _bank_field(name: str) -> property:
+    def fget(self):
+        return float(getattr(self._bank, name)[self._i])
+
+    def fset(self, value):
+        getattr(self._bank, name)[self._i] = value
+
+    return property(fget, fset)
+
+
+class PoolView(PoolBase):
+    """
+    Single-pool window onto a PoolBank slot. Exposes the PoolState API (reserves,
+    swaps, liquidity; both share amm.PoolBase) without owning any per-pool float
+    fields of its own: two slots and no __dict__.
+    """
+
+    __slots__ = ("_bank", "_i")
+
+    x_reserve = _bank_field("x_reserve")
+    y_reserve = _bank_field("y_reserve")
+    fee_bps = _bank_field("fee_bps")
+    total_lp = _bank_field("total_lp")
+
+    @property
+    def version(self) -> int:
+        return int(self._bank.version[self._i])
+
+    @version.setter
+    def version(self, value: int) -> None:
+        self._bank.version[self._i] = value
+
+    @property
+    def uid(self) -> tuple[int, int]:
+        return (self._bank.uid, self._i)
+
+    # Fee tallies are demo-only on PoolState; views report zero.
+    lp_fee_x = lp_fee_y = protocol_fee_x = protocol_fee_y = 0.0
+
+    def __init__(self, bank: PoolBank, i: int):
+        self._bank = bank
+        self._i = i
+
+    def __copy__(self) -> PoolView:
+        return PoolView(self._bank, self._i)
+
+    def __deepcopy__(self, memo) -> PoolView:
+        # a deep copy detaches from the shared bank, like deepcopy of a PoolState
+        return PoolView(deepcopy(self._bank, memo), self._i)
+
+    def __repr__(self) -> str:
+        return (
+            f"PoolView(i={self._i}, x_reserve={self.x_reserve!r}, "
+            f"y_reserve={self.y_reserve!r}, fee_bps={self.fee_bps!r})"
+        )
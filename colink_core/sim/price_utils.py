@@ -1,6 +1,90 @@
 from __future__ import annotations
 
-from .amm import PoolState
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .amm import PoolState, cp_amount_out
+
+
+# ----- Memoization keyed on pool versions -----
+class VersionedLRU:
+    """
+    Bounded LRU map for values derived from pool state. Keys embed each pool's
+    (uid, version, fee_bps), so any mutation of a pool makes its old entries
+    unreachable; they age out through normal LRU eviction. Safe to share between
+    threads: every read-modify of the ordering runs under one lock.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        self.maxsize = int(maxsize)
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+PRICE_CACHE = VersionedLRU()
+
+
+def pools_key(*pools: PoolState) -> tuple | None:
+    """
+    (uid, version, fee_bps) of each pool, or None if a pool does not carry
+    versions. The fee is part of the key because assigning fee_bps does not
+    bump the version.
+    """
+    try:
+        return tuple((p.uid, p.version, p.fee_bps) for p in pools)
+    except AttributeError:
+        return None
+
+
+def cached_quote_col_to_copx(pool_col_x: PoolState, pool_x_copx: PoolState, col_in: float):
+    """
+    router.quote_col_to_copx memoized on (pool versions, size).
+    The returned RouteResult may be shared between callers; treat it as read-only.
+    """
+    from .router import quote_col_to_copx
+
+    pk = pools_key(pool_col_x, pool_x_copx)
+    if pk is None:
+        return quote_col_to_copx(pool_col_x, pool_x_copx, col_in)
+    key = ("quote_col_to_copx", pk, col_in)
+    q = PRICE_CACHE.get(key)
+    if q is None:
+        q = quote_col_to_copx(pool_col_x, pool_x_copx, col_in)
+        PRICE_CACHE.put(key, q)
+    return q
 
 
 # ----- Mid-price helpers -----
@@ -32,26 +116,76 @@ def bps_deviation(effective: float, reference: float) -> float:
     return abs(effective - reference) / reference * 1e4
 
 
-def modeled_bps_impact_for_size(
-    pool_col_x: PoolState, pool_x_copx: PoolState, col_in: float
-) -> float:
+class ImpactCurve:
     """
-    Estimate price impact (in bps) for a COL→COPX trade of size `col_in`,
-    comparing the routed effective price vs the mid price.
+    Modeled COL→COPX impact (bps below mid) as a function of size, frozen for one
+    snapshot of the two pools. The routed quote is a closed-form function of size,
+    so the curve keeps its exact coefficients (hop reserves, fees, mid) rather than
+    a sampled grid: every query is exact at any size, with no interpolation error
+    and no out-of-range fallback. Build once per pool version via impact_curve().
     """
-    if col_in <= 0:
-        return 0.0
 
-    mid = mid_route_price_col_to_copx(pool_col_x, pool_x_copx)
-    if mid <= 0:
-        return 0.0
+    __slots__ = ("col_r_in", "col_r_out", "col_fee", "copx_r_in", "copx_r_out", "copx_fee", "mid")
 
-    # Use the router's non-mutating quote
-    from .router import quote_col_to_copx
+    def __init__(self, pool_col_x: PoolState, pool_x_copx: PoolState):
+        # Hop1 COL -> XRP (y_for_x), Hop2 XRP -> COPX (x_for_y), as quote_col_to_copx
+        self.col_r_in, self.col_r_out = pool_col_x.y_reserve, pool_col_x.x_reserve
+        self.col_fee = pool_col_x.fee_bps
+        self.copx_r_in, self.copx_r_out = pool_x_copx.x_reserve, pool_x_copx.y_reserve
+        self.copx_fee = pool_x_copx.fee_bps
+        self.mid = mid_route_price_col_to_copx(pool_col_x, pool_x_copx)
+
+    def __call__(self, col_in: float) -> float:
+        mid = self.mid
+        if col_in <= 0 or mid <= 0:
+            return 0.0
+        xrp_out = cp_amount_out(self.col_r_in, self.col_r_out, self.col_fee, col_in)
+        copx_out = cp_amount_out(self.copx_r_in, self.copx_r_out, self.copx_fee, xrp_out)
+        eff = copx_out / col_in
+        return max(0.0, (mid - eff) / mid) * 1e4
+
+    def many(self, sizes) -> np.ndarray:
+        """Impact in bps for an array of COL sizes (same values as calling per size)."""
+        a = np.asarray(sizes, dtype=float)
+        mid = self.mid
+        if mid <= 0:
+            return np.zeros_like(a)
+        xrp_out = cp_amount_out(self.col_r_in, self.col_r_out, self.col_fee, a)
+        copx_out = cp_amount_out(self.copx_r_in, self.copx_r_out, self.copx_fee, xrp_out)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            impact = np.maximum(0.0, (mid - copx_out / a) / mid) * 1e4
+        return np.where(a > 0, impact, 0.0)
 
-    q = quote_col_to_copx(pool_col_x, pool_x_copx, col_in)
-    eff = q.effective_price  # COPX per COL
 
-    # Impact as bps below mid (never negative)
-    impact_frac = max(0.0, (mid - eff) / mid)
-    return impact_frac * 1e4  # → bps
+def impact_curve(
+    pool_col_x: PoolState, pool_x_copx: PoolState, cache: VersionedLRU | None = None
+) -> ImpactCurve:
+    """
+    ImpactCurve for the current pool versions (one entry per version pair in
+    `cache`, PRICE_CACHE by default).
+    """
+    cache = PRICE_CACHE if cache is None else cache
+    pk = pools_key(pool_col_x, pool_x_copx)
+    if pk is None:
+        return ImpactCurve(pool_col_x, pool_x_copx)
+    key = ("impact_curve", pk)
+    curve = cache.get(key)
+    if curve is None:
+        curve = ImpactCurve(pool_col_x, pool_x_copx)
+        cache.put(key, curve)
+    return curve
+
+
+def modeled_bps_impact_for_size(
+    pool_col_x: PoolState,
+    pool_x_copx: PoolState,
+    col_in: float,
+    cache: VersionedLRU | None = None,
+) -> float:
+    """
+    Estimate price impact (in bps) for a COL→COPX trade of size `col_in`,
+    comparing the routed effective price vs the mid price.
+    Evaluated on the pools' cached ImpactCurve, so only the first call after a
+    pool mutation pays for reading reserves; any size is then a few flops.
+    """
+    return impact_curve(pool_col_x, pool_x_copx, cache)(col_in)
@@ -1,10 +1,24 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import Executor
 from dataclasses import dataclass
 
-from .price_utils import bps_deviation, modeled_bps_impact_for_size, route_mid_price_copx_per_col
-from .router import quote_col_to_copx
-from .twap import TWAPOracle
+import numpy as np
+
+from .amm import cp_amount_out
+from .limits import LimitConfig
+from .parallel import imap_ordered
+from .price_utils import (
+    bps_deviation,
+    cached_quote_col_to_copx,
+    modeled_bps_impact_for_size,
+    route_mid_price_copx_per_col,
+)
+from .twap import TWAP, OracleBank, QuantileOracle, TWAPOracle
+
+# Anything with value(): equal-weight, time-weighted, multi-window or rolling quantile
+Baseline = TWAPOracle | TWAP | OracleBank | QuantileOracle
 
 
 @dataclass
@@ -25,39 +39,260 @@ def quote_with_slippage(
     if slip_bps is None:
         slip_bps = kwargs.get("slippage_bps", 0.0)
 
-    q = quote_col_to_copx(pool_col_x, pool_x_copx, col_in)
+    q = cached_quote_col_to_copx(pool_col_x, pool_x_copx, col_in)
     min_out = q.amount_out * (1.0 - float(slip_bps) / 1e4)
     return GuardedQuote(
         col_in=col_in, copx_out_quote=q.amount_out, min_out=min_out, slip_bps=float(slip_bps)
     )
 
 
-def size_aware_twap_guard(
+@dataclass
+class GuardEval:
+    """Everything one size-aware TWAP guard check computes (arrays for the batch form)."""
+
+    col_in: float
+    copx_out: float
+    effective_price: float
+    mid: float
+    twap_mid: float
+    modeled_bps: float
+    deviation_bps: float
+    budget_bps: float
+    approved: bool
+
+    def as_tuple(self) -> tuple[bool, float, float]:
+        return (self.approved, self.deviation_bps, self.budget_bps)
+
+
+def allowed_deviation_bps(
+    col_in: float,
+    pool_col_x,
+    pool_x_copx,
+    base_band_bps: float = 100.0,
+    cushion_bps: float = 150.0,
+) -> float:
+    """Uncapped size-aware budget: base band + modeled impact(col_in) + cushion."""
+    return (
+        base_band_bps + modeled_bps_impact_for_size(pool_col_x, pool_x_copx, col_in) + cushion_bps
+    )
+
+
+def _twap_baseline(twap: Baseline, mid: float, window_sec: float | None = None) -> float:
+    # Use TWAP baseline (not instantaneous mid) to detect jumps; an OracleBank can
+    # be read at any of its windows
+    if window_sec is not None and not isinstance(twap, OracleBank):
+        raise TypeError(
+            f"twap_window_sec needs an OracleBank baseline, got {type(twap).__name__}; "
+            "pass the bank itself, or bank.view(window_sec) without twap_window_sec"
+        )
+    twap_mid = float(twap.value() if window_sec is None else twap.sma(window_sec))
+    if twap_mid <= 0:
+        # If TWAP not warmed, fall back to instantaneous mid as a safe default
+        twap_mid = mid
+    return twap_mid
+
+
+def evaluate_guard(
     pool_col_x,
     pool_x_copx,
-    twap: TWAPOracle,
+    twap: Baseline,
     col_in: float,
     *,
     base_guard_bps: float = 100.0,
     cushion_bps: float = 150.0,
     cap_bps: float = 2000.0,
-) -> tuple[bool, float, float]:
+    twap_window_sec: float | None = None,
+) -> GuardEval:
     """
-    Compare routed quote vs **TWAP** mid with a size-aware budget:
-      budget = min(cap_bps, base_guard_bps + mode led_impact(col_in) + cushion_bps)
-    Returns (approved, deviation_bps, budget_bps).
+    Single-pass size-aware TWAP guard: one routed quote and one mid feed the
+    deviation, modeled impact and budget (same numbers as size_aware_twap_guard).
     """
-    # Use TWAP baseline (not instantaneous mid) to detect jumps
-    twap_mid = float(twap.value())
-    if twap_mid <= 0:
-        # If TWAP not warmed, fall back to instantaneous mid as a safe default
-        twap_mid = route_mid_price_copx_per_col(pool_col_x, pool_x_copx)
+    mid = route_mid_price_copx_per_col(pool_col_x, pool_x_copx)
+    twap_mid = _twap_baseline(twap, mid, twap_window_sec)
 
-    # Quote on current pools
-    q = quote_col_to_copx(pool_col_x, pool_x_copx, col_in)
-    dev_bps = bps_deviation(q.effective_price, twap_mid)
+    xrp_out = cp_amount_out(pool_col_x.y_reserve, pool_col_x.x_reserve, pool_col_x.fee_bps, col_in)
+    copx_out = cp_amount_out(
+        pool_x_copx.x_reserve, pool_x_copx.y_reserve, pool_x_copx.fee_bps, xrp_out
+    )
+    eff = copx_out / col_in if col_in > 0 else 0.0
+    dev_bps = bps_deviation(eff, twap_mid)
 
-    # Size-aware budget with hard cap
-    modeled = modeled_bps_impact_for_size(pool_col_x, pool_x_copx, col_in)
+    # Impact as bps below mid (never negative); see modeled_bps_impact_for_size
+    modeled = max(0.0, (mid - eff) / mid) * 1e4 if col_in > 0 and mid > 0 else 0.0
     budget_bps = min(cap_bps, base_guard_bps + modeled + cushion_bps)
-    return (dev_bps <= budget_bps, dev_bps, budget_bps)
+    return GuardEval(
+        col_in, copx_out, eff, mid, twap_mid, modeled, dev_bps, budget_bps, dev_bps <= budget_bps
+    )
+
+
+def evaluate_guard_many(
+    pool_col_x,
+    pool_x_copx,
+    twap: Baseline,
+    sizes,
+    *,
+    base_guard_bps: float = 100.0,
+    cushion_bps: float = 150.0,
+    cap_bps: float = 2000.0,
+    twap_window_sec: float | None = None,
+) -> GuardEval:
+    """evaluate_guard over an array of COL sizes; GuardEval fields are NumPy arrays."""
+    col_in = np.asarray(sizes, dtype=float)
+    mid = route_mid_price_copx_per_col(pool_col_x, pool_x_copx)
+    twap_mid = _twap_baseline(twap, mid, twap_window_sec)
+
+    xrp_out, _ = pool_col_x.quote_many_y_for_x(col_in)
+    copx_out, _ = pool_x_copx.quote_many_x_for_y(xrp_out)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eff = np.where(col_in > 0, copx_out / col_in, 0.0)
+    # bps_deviation, element-wise
+    dev_bps = np.abs(eff - twap_mid) / twap_mid * 1e4 if twap_mid > 0 else np.zeros_like(eff)
+
+    if mid > 0:
+        modeled = np.where(col_in > 0, np.maximum(0.0, (mid - eff) / mid) * 1e4, 0.0)
+    else:
+        modeled = np.zeros_like(eff)
+    budget_bps = np.minimum(cap_bps, base_guard_bps + modeled + cushion_bps)
+    return GuardEval(
+        col_in, copx_out, eff, mid, twap_mid, modeled, dev_bps, budget_bps, dev_bps <= budget_bps
+    )
+
+
+GUARD_CHUNK = 65_536  # sizes per evaluate_guard_many pass when fanned out
+
+
+def _guard_unit(job) -> GuardEval:
+    pool_col_x, pool_x_copx, twap, sizes, kw = job
+    return evaluate_guard_many(pool_col_x, pool_x_copx, twap, sizes, **kw)
+
+
+def iter_guard_chunks(
+    pool_col_x,
+    pool_x_copx,
+    twap: Baseline,
+    sizes,
+    *,
+    chunk: int = GUARD_CHUNK,
+    executor: Executor | None = None,
+    **kw,
+) -> Iterator[GuardEval]:
+    """
+    evaluate_guard_many over consecutive `chunk`-size slices of `sizes`, in order.
+    With an executor (see parallel.worker_pool) the slices run in its worker
+    processes, each getting its own copy of the pools and oracle; a single slice
+    always runs inline, since one vectorized pass is cheaper than shipping it.
+    """
+    if chunk <= 0:
+        raise ValueError("chunk must be > 0")
+    sizes = np.asarray(sizes, dtype=float)
+    jobs = [
+        (pool_col_x, pool_x_copx, twap, sizes[a : a + chunk], kw)
+        for a in range(0, max(sizes.size, 1), chunk)
+    ]
+    yield from imap_ordered(_guard_unit, jobs, executor if len(jobs) > 1 else None)
+
+
+@dataclass
+class GuardDecisions:
+    """Batch guard + limiter verdicts; every field is a NumPy array aligned with the orders."""
+
+    col_in: np.ndarray
+    copx_out: np.ndarray
+    min_out: np.ndarray  # quoted (or current) out less each order's slippage tolerance
+    deviation_bps: np.ndarray
+    budget_bps: np.ndarray
+    within_budget: np.ndarray  # size-aware TWAP guard
+    within_slippage: np.ndarray  # min-out guard: copx_out >= min_out
+    within_limits: np.ndarray  # limiter size and deviation caps
+    approved: np.ndarray
+
+
+def guard_decisions_many(
+    pool_col_x,
+    pool_x_copx,
+    twap: Baseline,
+    sizes,
+    slip_bps=None,
+    *,
+    quoted_out=None,
+    limits: LimitConfig | None = None,
+    base_guard_bps: float = 100.0,
+    cushion_bps: float = 150.0,
+    cap_bps: float = 2000.0,
+    twap_window_sec: float | None = None,
+) -> GuardDecisions:
+    """
+    Re-validate a queue of COL -> COPX orders against the current pools and TWAP in
+    one vectorized pass.
+
+    The slippage check is quote_with_slippage's min-out guard: `slip_bps` (scalar
+    or per order, None = 0) is taken off `quoted_out`, the COPX each order was
+    quoted when it was queued, and an order stays within slippage while the
+    current output still meets that min_out. Without `quoted_out` the orders are
+    quoted now, so min_out only reports the floor to send with them. The TWAP
+    deviation is capped by the size-aware budget and the limiter, never by
+    slip_bps. The limiter's stateless caps (max_col_in, max_dev_bps) apply as
+    predicates; strikes and cooldown still belong to
+    TradeLimiter.check_and_record when an approved order is actually sent.
+    """
+    ev = evaluate_guard_many(
+        pool_col_x,
+        pool_x_copx,
+        twap,
+        sizes,
+        base_guard_bps=base_guard_bps,
+        cushion_bps=cushion_bps,
+        cap_bps=cap_bps,
+        twap_window_sec=twap_window_sec,
+    )
+    cfg = limits or LimitConfig()
+    dev = ev.deviation_bps
+    slip = np.broadcast_to(
+        np.asarray(0.0 if slip_bps is None else slip_bps, dtype=float), dev.shape
+    )
+    quoted = ev.copx_out if quoted_out is None else np.asarray(quoted_out, dtype=float)
+    min_out = quoted * (1.0 - slip / 1e4)
+    within_slippage = ev.copx_out >= min_out
+    within_limits = (ev.col_in <= cfg.max_col_in) & (dev <= cfg.max_dev_bps)
+    approved = ev.approved & within_slippage & within_limits
+    return GuardDecisions(
+        ev.col_in,
+        ev.copx_out,
+        min_out,
+        dev,
+        ev.budget_bps,
+        ev.approved,
+        within_slippage,
+        within_limits,
+        approved,
+    )
+
+
+def size_aware_twap_guard(
+    pool_col_x,
+    pool_x_copx,
+    twap: Baseline,
+    col_in: float,
+    *,
+    base_guard_bps: float = 100.0,
+    cushion_bps: float = 150.0,
+    cap_bps: float = 2000.0,
+    twap_window_sec: float | None = None,
+) -> tuple[bool, float, float]:
+    """
+    Compare routed quote vs **TWAP** mid with a size-aware budget:
+      budget = min(cap_bps, base_guard_bps + modeled_impact(col_in) + cushion_bps)
+    With an OracleBank as `twap`, `twap_window_sec` picks the SMA window used as baseline
+    (any other baseline with twap_window_sec raises TypeError); a MedianOracle gives a baseline one outsized print cannot drag.
+    Returns (approved, deviation_bps, budget_bps). See evaluate_guard for the full result.
+    """
+    return evaluate_guard(
+        pool_col_x,
+        pool_x_copx,
+        twap,
+        col_in,
+        base_guard_bps=base_guard_bps,
+        cushion_bps=cushion_bps,
+        cap_bps=cap_bps,
+        twap_window_sec=twap_window_sec,
+    ).as_tuple()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import zlib
+
+import numpy as np
+
+
+def stable_key(part: int | str) -> int:
+    """Stream-key component: non-negative ints as-is, strings by CRC32 (hash() is salted)."""
+    if isinstance(part, str):
+        return zlib.crc32(part.encode("utf-8"))
+    part = int(part)
+    if part < 0:
+        raise ValueError("stream key parts must be >= 0")
+    return part
+
+
+class RngStreams:
+    """
+    Reproducible random streams for simulations, keyed by (scenario, path, chunk).
+
+    Every key maps through SeedSequence(root entropy, spawn_key=key) to its own
+    counter-based Philox generator, so a stream depends only on the root seed and
+    its key: any chunk of any path can be regenerated alone, on any worker, in any
+    order, and parallel runs reproduce serial ones bit for bit. The object holds
+    two ints and pickles cheaply to worker processes.
+    """
+
+    __slots__ = ("entropy", "scenario")
+
+    def __init__(self, seed: int | None = None, scenario: int | str = 0):
+        # seed=None draws fresh OS entropy once; it is fixed from here on
+        self.entropy = int(np.random.SeedSequence(seed).entropy)
+        self.scenario = stable_key(scenario)
+
+    def seed_sequence(self, path: int | str = 0, chunk: int | str = 0) -> np.random.SeedSequence:
+        key = (self.scenario, stable_key(path), stable_key(chunk))
+        return np.random.SeedSequence(self.entropy, spawn_key=key)
+
+    def generator(self, path: int | str = 0, chunk: int | str = 0) -> np.random.Generator:
+        return np.random.Generator(np.random.Philox(self.seed_sequence(path, chunk)))
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from copy import deepcopy
+import math
 from dataclasses import dataclass
 
-from .amm import PoolState
+import numpy as np
+
+from .amm import PoolState, cp_amount_in, cp_amount_in_many, cp_amount_out
 
 
 @dataclass
@@ -15,26 +17,16 @@ class RouteResult:
     hop2_out: float
 
 
-def _swap_copy(pool: PoolState, side: str, amt: float) -> tuple[float, float, PoolState]:
-    """Side = 'x_for_y' or 'y_for_x'. Returns (out, eff_px, new_pool_copy)."""
-    p = deepcopy(pool)
-    if side == "x_for_y":
-        out, eff = p.swap_x_for_y(amt)
-    elif side == "y_for_x":
-        out, eff = p.swap_y_for_x(amt)
-    else:
-        raise ValueError("side must be 'x_for_y' or 'y_for_x'")
-    return out, eff, p
-
-
 def quote_col_to_copx(pool_col_x: PoolState, pool_x_copx: PoolState, col_in: float) -> RouteResult:
     """
     Hop1: COL -> XRP on pool_col_x (COL treated as Y, XRP as X: use y_for_x).
     Hop2: XRP -> COPX on pool_x_copx (x_for_y).
-    Does NOT mutate original pools.
+    Does NOT mutate original pools (closed form; no pool copies are made).
     """
-    xrp_out, _eff1, _tmp = _swap_copy(pool_col_x, "y_for_x", col_in)
-    copx_out, _eff2, _tmp2 = _swap_copy(pool_x_copx, "x_for_y", xrp_out)
+    xrp_out = cp_amount_out(pool_col_x.y_reserve, pool_col_x.x_reserve, pool_col_x.fee_bps, col_in)
+    copx_out = cp_amount_out(
+        pool_x_copx.x_reserve, pool_x_copx.y_reserve, pool_x_copx.fee_bps, xrp_out
+    )
     eff_price = copx_out / col_in if col_in > 0 else 0.0
     return RouteResult(col_in, copx_out, eff_price, xrp_out, copx_out)
 
@@ -43,14 +35,83 @@ def quote_copx_to_col(pool_col_x: PoolState, pool_x_copx: PoolState, copx_in: fl
     """
     Hop1: COPX -> XRP on pool_x_copx (y_for_x).
     Hop2: XRP -> COL on pool_col_x (x_for_y).
-    Does NOT mutate original pools.
+    Does NOT mutate original pools (closed form; no pool copies are made).
     """
-    xrp_out, _eff1, _tmp = _swap_copy(pool_x_copx, "y_for_x", copx_in)
-    col_out, _eff2, _tmp2 = _swap_copy(pool_col_x, "x_for_y", xrp_out)
+    xrp_out = cp_amount_out(
+        pool_x_copx.y_reserve, pool_x_copx.x_reserve, pool_x_copx.fee_bps, copx_in
+    )
+    col_out = cp_amount_out(pool_col_x.x_reserve, pool_col_x.y_reserve, pool_col_x.fee_bps, xrp_out)
     eff_price = col_out / copx_in if copx_in > 0 else 0.0
     return RouteResult(copx_in, col_out, eff_price, xrp_out, col_out)
 
 
+def quote_col_to_copx_exact_out(
+    pool_col_x: PoolState, pool_x_copx: PoolState, copx_out: float
+) -> RouteResult:
+    """
+    Reverse of quote_col_to_copx: COL required to receive exactly `copx_out`.
+    Solved analytically hop by hop (XRP needed on pool_x_copx, then COL on pool_col_x).
+    amount_in is inf when either pool cannot pay the requested output.
+    Does NOT mutate original pools.
+    """
+    xrp_in = cp_amount_in(
+        pool_x_copx.x_reserve, pool_x_copx.y_reserve, pool_x_copx.fee_bps, copx_out
+    )
+    col_in = cp_amount_in(pool_col_x.y_reserve, pool_col_x.x_reserve, pool_col_x.fee_bps, xrp_in)
+    eff_price = copx_out / col_in if 0 < col_in < math.inf else 0.0
+    return RouteResult(col_in, copx_out, eff_price, xrp_in, copx_out)
+
+
+def quote_copx_to_col_exact_out(
+    pool_col_x: PoolState, pool_x_copx: PoolState, col_out: float
+) -> RouteResult:
+    """
+    Reverse of quote_copx_to_col: COPX required to receive exactly `col_out`.
+    amount_in is inf when either pool cannot pay the requested output.
+    Does NOT mutate original pools.
+    """
+    xrp_in = cp_amount_in(pool_col_x.x_reserve, pool_col_x.y_reserve, pool_col_x.fee_bps, col_out)
+    copx_in = cp_amount_in(
+        pool_x_copx.y_reserve, pool_x_copx.x_reserve, pool_x_copx.fee_bps, xrp_in
+    )
+    eff_price = col_out / copx_in if 0 < copx_in < math.inf else 0.0
+    return RouteResult(copx_in, col_out, eff_price, xrp_in, col_out)
+
+
+def _route_result_many(amount_in, amount_out, hop1) -> RouteResult:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eff = np.where((amount_in > 0) & np.isfinite(amount_in), amount_out / amount_in, 0.0)
+    return RouteResult(amount_in, amount_out, eff, hop1, amount_out)
+
+
+def quote_many_col_to_copx_exact_out(
+    pool_col_x: PoolState, pool_x_copx: PoolState, copx_outs
+) -> RouteResult:
+    """Array form of quote_col_to_copx_exact_out; RouteResult fields are NumPy arrays."""
+    copx_out = np.asarray(copx_outs, dtype=float)
+    xrp_in = cp_amount_in_many(
+        pool_x_copx.x_reserve, pool_x_copx.y_reserve, pool_x_copx.fee_bps, copx_out
+    )
+    col_in = cp_amount_in_many(
+        pool_col_x.y_reserve, pool_col_x.x_reserve, pool_col_x.fee_bps, xrp_in
+    )
+    return _route_result_many(col_in, copx_out, xrp_in)
+
+
+def quote_many_copx_to_col_exact_out(
+    pool_col_x: PoolState, pool_x_copx: PoolState, col_outs
+) -> RouteResult:
+    """Array form of quote_copx_to_col_exact_out; RouteResult fields are NumPy arrays."""
+    col_out = np.asarray(col_outs, dtype=float)
+    xrp_in = cp_amount_in_many(
+        pool_col_x.x_reserve, pool_col_x.y_reserve, pool_col_x.fee_bps, col_out
+    )
+    copx_in = cp_amount_in_many(
+        pool_x_copx.y_reserve, pool_x_copx.x_reserve, pool_x_copx.fee_bps, xrp_in
+    )
+    return _route_result_many(copx_in, col_out, xrp_in)
+
+
 def exec_col_to_copx(pool_col_x: PoolState, pool_x_copx: PoolState, col_in: float) -> RouteResult:
     """Mutating execution of COL→XRP→COPX."""
     xrp_out, _ = pool_col_x.swap_y_for_x(col_in)
@@ -6,13 +6,14 @@ import math
 import os
 import pathlib
 import platform
-import random
 import statistics
 import subprocess
 import sys
 import time
 from datetime import UTC, datetime
 
+from .rng import RngStreams
+
 
 def _select_backend(name: str | None) -> str:
     backend = (name or os.getenv("DISPLAY_BACKEND") or "Agg").strip()
@@ -38,14 +39,15 @@ def _git_sha() -> str | None:
         return None
 
 
-def _demo_series(n: int = 240) -> list[tuple[int, float]]:
+def _demo_series(n: int = 240, seed: int | None = None) -> list[tuple[int, float]]:
     """Generate a simple synthetic series (random-walk over a gentle sine)."""
     series: list[tuple[int, float]] = []
     t0 = time.time()
+    steps = RngStreams(seed, scenario="run.demo").generator().uniform(-0.25, 0.25, n).tolist()
     val = 0.0
     for i in range(n):
         # jittered sine + bounded random walk
-        val += random.uniform(-0.25, 0.25)
+        val += steps[i]
         baseline = 2.0 * math.sin(i / 24.0)
         y = baseline + val
         ts_ms = int((t0 + i * 0.05) * 1000)  # 20 Hz-ish
@@ -53,12 +55,12 @@ def _demo_series(n: int = 240) -> list[tuple[int, float]]:
     return series
 
 
-def run_demo(out_prefix: pathlib.Path, display: str | None) -> dict:
+def run_demo(out_prefix: pathlib.Path, display: str | None, seed: int | None = None) -> dict:
     backend = _select_backend(display)
     # Import pyplot only after backend selection
     import matplotlib.pyplot as plt
 
-    series = _demo_series()
+    series = _demo_series(seed=seed)
 
     # 1) Plot → PNG
     xs = [t for (t, _y) in series]
@@ -133,6 +135,7 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p.add_argument(
         "--out-prefix", type=str, required=True, help="Output path prefix (no extension)"
     )
+    p.add_argument("--seed", type=int, default=None, help="Demo series seed (default: random)")
     return p.parse_args(argv)
 
 
@@ -140,7 +143,7 @@ def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
     out_prefix = pathlib.Path(args.out_prefix)
     if args.demo:
-        res = run_demo(out_prefix, args.display)
+        res = run_demo(out_prefix, args.display, args.seed)
         print(json.dumps({"ok": True, "backend": res["backend"], "prefix": str(out_prefix)}))
         return 0
     print(json.dumps({"ok": False, "error": "no mode selected (try --demo)"}))
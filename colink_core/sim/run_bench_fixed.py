@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import time
+from decimal import Decimal, getcontext
+
+import numpy as np
+
+from .amm import PoolState
+from .amm_fixed import FixedPoolState
+
+getcontext().prec = 34
+
+
+class DecimalPool:
+    """Decimal constant-product reference (the arithmetic style of routes/trade.py)."""
+
+    def __init__(self, x_reserve: float, y_reserve: float, fee_bps: float = 30):
+        self.x = Decimal(str(x_reserve))
+        self.y = Decimal(str(y_reserve))
+        self.g = 1 - Decimal(str(fee_bps)) / Decimal(10_000)
+
+    def swap_x_for_y(self, dx: float) -> Decimal:
+        d = Decimal(str(dx))
+        out = self.y - self.x * self.y / (self.x + d * self.g)
+        self.x += d
+        self.y -= out
+        return out
+
+
+def ops_per_sec(fn, sizes, n: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(n):
+        fn(sizes[i % len(sizes)])
+    return n / (time.perf_counter() - t0)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Swap throughput: float vs Decimal vs integer drops")
+    ap.add_argument("-n", type=int, default=50_000, help="Swaps per measurement")
+    args = ap.parse_args(argv)
+
+    sizes = [0.5, 1.0, 2.5, 10.0, 25.0, 100.0]
+    pools = {
+        "float PoolState": PoolState(10_000.0, 25_000_000.0, 30),
+        "Decimal reference": DecimalPool(10_000.0, 25_000_000.0, 30),
+        "FixedPoolState": FixedPoolState(10_000.0, 25_000_000.0, 30),
+    }
+    rates = {name: ops_per_sec(p.swap_x_for_y, sizes, args.n) for name, p in pools.items()}
+
+    fixed = FixedPoolState(10_000.0, 25_000_000.0, 30)
+    batch = np.resize(np.array(sizes) * 1_000_000, args.n).astype(np.int64)
+    t0 = time.perf_counter()
+    fixed.quote_many_x_for_y_units(batch)
+    rates["FixedPoolState batch quote"] = args.n / (time.perf_counter() - t0)
+
+    for name, rate in rates.items():
+        print(f"{name:<28} {rate:>14,.0f} ops/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
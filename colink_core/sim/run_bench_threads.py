@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .amm import PoolState
+from .limits import LimitConfig, LimiterRegistry
+from .price_utils import PRICE_CACHE, cached_quote_col_to_copx
+from .threadsafe import LockedTWAPOracle, StripedLimiterRegistry
+
+
+class GlobalLockRegistry:
+    """Whole LimiterRegistry behind one mutex, kept here as the benchmark reference."""
+
+    def __init__(self, cfg: LimitConfig):
+        self._reg = LimiterRegistry(cfg)
+        self._lock = threading.Lock()
+
+    def check_and_record(self, key, col_in: float, dev_bps: float):
+        with self._lock:
+            return self._reg.check_and_record(key, col_in, dev_bps)
+
+
+def calls_per_sec(registry, tw: LockedTWAPOracle, callers: int, n: int, accounts: int) -> float:
+    """
+    `callers` threads each doing `n` limiter checks, a TWAP push/read and a
+    cached route quote (shared PRICE_CACHE, a few hundred distinct sizes).
+    """
+    pool_col_x = PoolState(x_reserve=10_000.0, y_reserve=200_000.0, fee_bps=30)
+    pool_x_copx = PoolState(x_reserve=10_000.0, y_reserve=25_000_000.0, fee_bps=30)
+    PRICE_CACHE.clear()
+    start = threading.Barrier(callers + 1)
+
+    def worker(tid: int) -> None:
+        start.wait()
+        for i in range(n):
+            registry.check_and_record((tid * 7 + i) % accounts, 1_000.0, 50.0)
+            tw.push(125.0)
+            tw.value()
+            cached_quote_col_to_copx(pool_col_x, pool_x_copx, float(100 + (tid + i) % 256))
+
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        futs = [pool.submit(worker, t) for t in range(callers)]
+        start.wait()
+        t0 = time.perf_counter()
+        for f in futs:
+            f.result()
+        elapsed = time.perf_counter() - t0
+    return callers * n / elapsed
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="Limiter/TWAP/quote-cache throughput under concurrent callers"
+    )
+    ap.add_argument("--callers", type=int, default=32)
+    ap.add_argument("-n", type=int, default=5_000, help="Calls per caller")
+    ap.add_argument("--accounts", type=int, default=1_024)
+    ap.add_argument("--stripes", type=int, default=64)
+    args = ap.parse_args(argv)
+
+    cfg = LimitConfig()
+    before = calls_per_sec(
+        GlobalLockRegistry(cfg), LockedTWAPOracle(64), args.callers, args.n, args.accounts
+    )
+    striped = StripedLimiterRegistry(cfg, stripes=args.stripes)
+    after = calls_per_sec(striped, LockedTWAPOracle(64), args.callers, args.n, args.accounts)
+    print(f"callers={args.callers} accounts={args.accounts} stripes={args.stripes}")
+    print(f"global lock:     {before:>12,.0f} calls/s")
+    print(f"striped locks:   {after:>12,.0f} calls/s  (x{after / before:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
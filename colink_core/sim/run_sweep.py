@@ -7,9 +7,17 @@ import json
 import math
 import os
 import pathlib
-import random
 import sys
 
+try:
+    from .rng import RngStreams
+    from .sink import RunningStats
+except ImportError:  # executed as a plain script
+    from colink_core.sim.rng import RngStreams
+    from colink_core.sim.sink import RunningStats
+
+SERIES_CHUNK = 4096  # steps per random-stream chunk
+
 # case-insensitive backend normalizer
 BACKENDS = {
     "agg": "Agg",
@@ -33,21 +41,31 @@ except Exception:
     plt = None
 
 
-def _gen_series(steps: int, seed: int):
-    rnd = random.Random(seed)
+def _iter_series(steps: int, seed: int):
+    # chunk c of the walk draws from stream (seed, "run_sweep.series", 0, c), so
+    # the draws of any step range can be regenerated without replaying the rest
+    streams = RngStreams(seed, scenario="run_sweep.series")
+    n = max(steps, 1)
     price = 1.0
-    series = []
-    for i in range(max(steps, 1)):
-        # deterministic price walk (seeded)
-        price = max(0.001, price * (1.0 + rnd.uniform(-0.02, 0.03)))
-        # deterministic spread independent of seed; sin(0)=0 -> 10.0 at t=0
-        spread_bps = 10.0 + 5.0 * math.sin(float(i))
-        # deterministic depth (seeded), positive and stable across runs with same seed
-        depth = 1000.0 + 100.0 * rnd.uniform(-0.5, 0.5)
-        series.append(
-            {"t": i, "price": float(price), "spread_bps": float(spread_bps), "depth": float(depth)}
-        )
-    return series
+    for c, start in enumerate(range(0, n, SERIES_CHUNK)):
+        u = streams.generator(chunk=c).random((min(SERIES_CHUNK, n - start), 2)).tolist()
+        for i, (u_price, u_depth) in enumerate(u, start):
+            # deterministic price walk (seeded): step uniform in [-2%, +3%)
+            price = max(0.001, price * (1.0 + (u_price * 0.05 - 0.02)))
+            # deterministic spread independent of seed; sin(0)=0 -> 10.0 at t=0
+            spread_bps = 10.0 + 5.0 * math.sin(float(i))
+            # deterministic depth (seeded), positive and stable across runs with same seed
+            depth = 1000.0 + 100.0 * (u_depth - 0.5)
+            yield {
+                "t": i,
+                "price": float(price),
+                "spread_bps": float(spread_bps),
+                "depth": float(depth),
+            }
+
+
+def _gen_series(steps: int, seed: int):
+    return list(_iter_series(steps, seed))
 
 
 def write_json(
@@ -59,11 +77,7 @@ def write_json(
     trades_csv: str | None,
     volatility_csv: str | None,
 ):
-    pts = _gen_series(steps, seed)
-    prices = [p["price"] for p in pts]
-    spreads = [p["spread_bps"] for p in pts]
-
-    doc = {
+    header = {
         "schema_version": "colink.sim.v1",
         "ok": True,
         "timestamp": dt.datetime.now(dt.UTC).isoformat(),
@@ -76,21 +90,31 @@ def write_json(
             "trades_csv": trades_csv,
             "volatility_csv": volatility_csv,
         },
-        "points": pts,
-        "summary": {
+    }
+    price = RunningStats()
+    spread = RunningStats()
+
+    # Stream the document: points are written as they are generated and the
+    # summary is accumulated on the fly, so memory does not grow with `steps`.
+    with path.open("w", encoding="utf-8") as f:
+        f.write("{\n")
+        for k, v in header.items():
+            f.write(f"  {json.dumps(k)}: {json.dumps(v, ensure_ascii=False)},\n")
+        f.write('  "points": [')
+        sep = "\n"
+        for p in _iter_series(steps, seed):
+            price.push(p["price"])
+            spread.push(p["spread_bps"])
+            f.write(sep + "    " + json.dumps(p, ensure_ascii=False))
+            sep = ",\n"
+        summary = {
             "count_points": steps,
-            "price": {
-                "min": float(min(prices)) if prices else 0.0,
-                "max": float(max(prices)) if prices else 0.0,
-            },
-            "spread_bps": {
-                "min": float(min(spreads)) if spreads else 0.0,
-                "max": float(max(spreads)) if spreads else 0.0,
-            },
+            "price": {"min": price.min, "max": price.max},
+            "spread_bps": {"min": spread.min, "max": spread.max},
             "notes": "compat shim",
-        },
-    }
-    path.write_text(json.dumps(doc, ensure_ascii=False, indent=2), encoding="utf-8")
+        }
+        f.write("\n  ],\n")
+        f.write(f'  "summary": {json.dumps(summary, ensure_ascii=False)}\n}}\n')
 
 
 def write_png(path: pathlib.Path, title: str):
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .amm import PoolState, cp_amount_out
+from .gbm import simulate_gbm
+from .parallel import parallel_map, worker_pool
+from .rng import RngStreams
+
+SCHEMA_VERSION = "colink.scenario.v1"
+REPEAT_BLOCK = 4_096  # repeats per RNG stream and per parallel work unit
+
+
+@dataclass
+class MarketSpec:
+    pair: str  # "BASE/QUOTE"; the pool holds BASE as X and QUOTE as Y
+    init_price: float  # starting mid (QUOTE per BASE) of every repeat's price path
+    init_depth_base: float  # the depths fix the pool's liquidity k = x * y
+    init_depth_quote: float
+
+    def pool(self, fee_bps: float) -> PoolState:
+        return PoolState(self.init_depth_base, self.init_depth_quote, fee_bps)
+
+
+@dataclass
+class ScenarioPlan:
+    """A compiled configs/sims/*.yml scenario: markets x sizes x repeats plus guard settings."""
+
+    name: str
+    seed: int
+    markets: list[MarketSpec]
+    sizes: np.ndarray  # order sizes in BASE units
+    repeats: int
+    guard_bps: float
+    fee_bps: float = 30.0
+    steps: int = 32  # GBM steps of mid-price drift before each repeat's quotes
+    vol: float = 0.02  # per-horizon volatility of that drift
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.markets) * self.repeats * len(self.sizes)
+
+
+def compile_scenario(doc: dict) -> ScenarioPlan:
+    """
+    Validate a parsed scenario document and turn it into a ScenarioPlan.
+    A top-level `charts:` list is accepted but ignored: the runner writes result
+    files only (plot them from the parquet output).
+    """
+    try:
+        sweep = doc["sweep"]
+        markets = [
+            MarketSpec(
+                pair=str(m["pair"]),
+                init_price=float(m["init_price"]),
+                init_depth_base=float(m["init_depth_col"]),
+                init_depth_quote=float(m["init_depth_copx"]),
+            )
+            for m in doc["markets"]
+        ]
+        plan = ScenarioPlan(
+            name=str(doc["name"]),
+            seed=int(doc.get("seed", 0)),
+            markets=markets,
+            sizes=np.asarray(sweep["sizes_col"], dtype=float),
+            repeats=int(sweep.get("repeats", 1)),
+            guard_bps=float(sweep["twap_guard_bps"]),
+            fee_bps=float(sweep.get("fee_bps", 30.0)),
+            steps=int(sweep.get("steps", 32)),
+            vol=float(sweep.get("vol", 0.02)),
+        )
+    except KeyError as e:
+        raise ValueError(f"scenario is missing required key {e}") from None
+    if not plan.markets or plan.sizes.size == 0 or plan.repeats <= 0:
+        raise ValueError("scenario needs at least one market, one size and one repeat")
+    return plan
+
+
+def load_scenario(path: str | Path) -> ScenarioPlan:
+    try:
+        import yaml  # optional: only needed to read scenario files
+    except ImportError as e:
+        raise RuntimeError("reading scenario files requires PyYAML (pip install pyyaml)") from e
+    with open(path, encoding="utf-8") as f:
+        return compile_scenario(yaml.safe_load(f))
+
+
+# ----- Execution -----
+def run_block(plan: ScenarioPlan, m: int, b: int) -> dict[str, np.ndarray]:
+    """
+    Repeats [b * REPEAT_BLOCK, (b + 1) * REPEAT_BLOCK) x all sizes of market m in
+    a single vectorized pass. Each repeat drifts the mid along a GBM path (the
+    TWAP is that path's equal-weight mean), re-prices the pool to the final mid
+    at constant k, then quotes every size. Block b of market m draws from its
+    own (seed, scenario name, m, b) stream, so blocks can run in any order or
+    process and the output never depends on the worker count.
+    """
+    spec = plan.markets[m]
+    pool = spec.pool(plan.fee_bps)
+    k = pool.x_reserve * pool.y_reserve
+    start = b * REPEAT_BLOCK
+    n = min(REPEAT_BLOCK, plan.repeats - start)
+    rng = RngStreams(plan.seed, scenario=plan.name).generator(path=m, chunk=b)
+    paths = simulate_gbm(plan.steps, n, 0.0, plan.vol, seed=rng, s0=spec.init_price)
+    twap = paths.mean(axis=1)
+    mid = paths[:, -1]
+
+    x = np.sqrt(k / mid)[:, None]
+    y = np.sqrt(k * mid)[:, None]
+    sizes = plan.sizes[None, :]
+    out = cp_amount_out(x, y, plan.fee_bps, sizes)
+    eff = out / sizes
+    dev_bps = np.abs(eff - twap[:, None]) / twap[:, None] * 1e4
+    impact_bps = np.maximum(0.0, (mid[:, None] - eff) / mid[:, None]) * 1e4
+
+    shape = out.shape
+    return {
+        "market": np.full(out.size, spec.pair),
+        "repeat": np.broadcast_to(start + np.arange(n)[:, None], shape).ravel(),
+        "size": np.broadcast_to(sizes, shape).ravel(),
+        "amount_out": out.ravel(),
+        "eff_price": eff.ravel(),
+        "mid": np.broadcast_to(mid[:, None], shape).ravel(),
+        "twap": np.broadcast_to(twap[:, None], shape).ravel(),
+        "dev_bps": dev_bps.ravel(),
+        "impact_bps": impact_bps.ravel(),
+        "approved": (dev_bps <= plan.guard_bps).ravel(),
+    }
+
+
+def _block_unit(job) -> dict[str, np.ndarray]:
+    plan, m, b = job
+    return run_block(plan, m, b)
+
+
+def plan_units(plan: ScenarioPlan) -> list[tuple[ScenarioPlan, int, int]]:
+    """(plan, market, repeat block) work units, in output row order."""
+    blocks = -(-plan.repeats // REPEAT_BLOCK)
+    return [(plan, m, b) for m in range(len(plan.markets)) for b in range(blocks)]
+
+
+def _concat(parts: list[dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+    return {c: np.concatenate([p[c] for p in parts]) for c in parts[0]}
+
+
+def run_market(plan: ScenarioPlan, m: int) -> dict[str, np.ndarray]:
+    """All repeats x sizes of one market (its repeat blocks in order)."""
+    return _concat([run_block(*u) for u in plan_units(plan) if u[1] == m])
+
+
+def run_plan(plan: ScenarioPlan, executor=None) -> dict[str, np.ndarray]:
+    """
+    Columns for every (market, repeat, size) row of the plan, markets in order.
+    With an executor (parallel.worker_pool) the market x repeat-block units are
+    spread over its processes.
+    """
+    return _concat(parallel_map(_block_unit, plan_units(plan), executor=executor))
+
+
+def write_columns(columns: dict[str, np.ndarray], path: Path, plan: ScenarioPlan) -> Path:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    meta = {"schema_version": SCHEMA_VERSION, "scenario": plan.name, "seed": str(plan.seed)}
+    table = pa.table(columns).replace_schema_metadata(meta)
+    pq.write_table(table, path)
+    return path
+
+
+def _report(plan: ScenarioPlan, cols: dict[str, np.ndarray], outdir: str) -> dict:
+    out = write_columns(cols, Path(outdir) / f"{plan.name}.parquet", plan)
+    return {
+        "scenario": plan.name,
+        "rows": int(cols["size"].size),
+        "approved_rate": float(cols["approved"].mean()),
+        "out": out.as_posix(),
+    }
+
+
+def run_scenario_file(path: str, outdir: str, executor=None) -> dict:
+    plan = load_scenario(path)
+    return _report(plan, run_plan(plan, executor), outdir)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="colink-scenario", description="Run configs/sims/*.yml scenarios -> Parquet"
+    )
+    ap.add_argument("scenarios", nargs="+", help="Scenario YAML files")
+    ap.add_argument("--outdir", default=".artifacts/scenarios")
+    ap.add_argument("--workers", type=int, default=None, help="Processes (default / 0: all cores)")
+    args = ap.parse_args(argv)
+
+    Path(args.outdir).mkdir(parents=True, exist_ok=True)
+    plans = [load_scenario(p) for p in args.scenarios]
+    # Every market x repeat block of every scenario goes to one shared pool, so a
+    # single large scenario uses all cores too
+    units = [u for plan in plans for u in plan_units(plan)]
+    with worker_pool(args.workers if len(units) > 1 else 1) as ex:
+        parts = parallel_map(_block_unit, units, executor=ex)
+    for plan in plans:
+        n = len(plan_units(plan))
+        cols, parts = _concat(parts[:n]), parts[n:]
+        sys.stdout.write(json.dumps(_report(plan, cols, args.outdir)) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import csv
+import json
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_BUFFER_ROWS = 65_536
+
+
+class RunningStats:
+    """Streaming count / min / max / mean / std of one column (Chan's batch merge)."""
+
+    __slots__ = ("count", "min", "max", "mean", "_m2")
+
+    def __init__(self):
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def push(self, x: float) -> None:
+        """One value (Welford); cheaper than update() for scalar streams."""
+        x = float(x)
+        self.count += 1
+        d = x - self.mean
+        self.mean += d / self.count
+        self._m2 += d * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def update(self, values) -> None:
+        """A batch of values, merged in one vectorized step."""
+        a = np.asarray(values, dtype=float).ravel()
+        n = a.size
+        if n == 0:
+            return
+        b_mean = float(a.mean())
+        b_m2 = float(((a - b_mean) ** 2).sum())
+        total = self.count + n
+        delta = b_mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += b_m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(a.min()))
+        self.max = max(self.max, float(a.max()))
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self._m2 / self.count) if self.count else 0.0
+
+    def as_dict(self) -> dict:
+        if not self.count:
+            return {"count": 0, "min": 0.0, "max": 0.0, "mean": 0.0, "std": 0.0}
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "std": self.std,
+        }
+
+
+class SweepSink(ABC):
+    """
+    Bounded-buffer writer for sweep results. Rows arrive as column batches
+    (write_columns) or one at a time (write_row); once `buffer_rows` are pending
+    they are flushed to the file, so memory stays flat however long the sweep
+    runs. Numeric columns get RunningStats along the way; close() returns them.
+    Subclasses implement _write_batch and _finish (release the file or writer).
+    """
+
+    def __init__(self, path: str | Path, buffer_rows: int = DEFAULT_BUFFER_ROWS):
+        if buffer_rows <= 0:
+            raise ValueError("buffer_rows must be > 0")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.buffer_rows = int(buffer_rows)
+        self.rows = 0
+        self.stats: dict[str, RunningStats] = {}
+        self._columns: list[str] | None = None
+        self._pending: list[dict[str, np.ndarray]] = []
+        self._pending_rows = 0
+
+    # ----- Input -----
+    def write_columns(self, columns: Mapping[str, object]) -> None:
+        cols = {k: np.asarray(v) for k, v in columns.items()}
+        if self._columns is None:
+            self._columns = list(cols)
+        elif list(cols) != self._columns:
+            raise ValueError(f"columns {list(cols)} != {self._columns}")
+        n = len(next(iter(cols.values()))) if cols else 0
+        if n == 0:
+            return
+        for k, v in cols.items():
+            if v.dtype.kind in "iuf":
+                self.stats.setdefault(k, RunningStats()).update(v)
+        self._pending.append(cols)
+        self._pending_rows += n
+        self.rows += n
+        if self._pending_rows >= self.buffer_rows:
+            self.flush()
+
+    def write_row(self, row: Mapping[str, object]) -> None:
+        self.write_columns({k: [v] for k, v in row.items()})
+
+    # ----- Output -----
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        batch = {k: np.concatenate([p[k] for p in self._pending]) for k in self._columns}
+        self._pending.clear()
+        self._pending_rows = 0
+        self._write_batch(batch)
+
+    @abstractmethod
+    def _write_batch(self, batch: dict[str, np.ndarray]) -> None: ...
+
+    @abstractmethod
+    def _finish(self) -> None: ...
+
+    def summary(self) -> dict:
+        return {"rows": self.rows, "columns": {k: s.as_dict() for k, s in self.stats.items()}}
+
+    def close(self) -> dict:
+        self.flush()
+        self._finish()
+        return self.summary()
+
+    def __enter__(self) -> SweepSink:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class CsvSink(SweepSink):
+    def __init__(self, path, buffer_rows: int = DEFAULT_BUFFER_ROWS):
+        super().__init__(path, buffer_rows)
+        self._f = open(self.path, "w", newline="", encoding="utf-8")  # noqa: SIM115
+        self._w = csv.writer(self._f)
+
+    def _write_header(self):
+        if self._f.tell() == 0 and self._columns is not None:
+            self._w.writerow(self._columns)
+
+    def _write_batch(self, batch):
+        self._write_header()
+        self._w.writerows(zip(*(batch[k].tolist() for k in self._columns), strict=True))
+
+    def _finish(self):
+        # a sweep that produced no rows still gets its header row
+        self._write_header()
+        self._f.close()
+
+
+class NdjsonSink(SweepSink):
+    def __init__(self, path, buffer_rows: int = DEFAULT_BUFFER_ROWS):
+        super().__init__(path, buffer_rows)
+        self._f = open(self.path, "w", encoding="utf-8")  # noqa: SIM115
+
+    def _write_batch(self, batch):
+        keys = self._columns
+        for values in zip(*(batch[k].tolist() for k in keys), strict=True):
+            self._f.write(json.dumps(dict(zip(keys, values, strict=True))) + "\n")
+
+    def _finish(self):
+        self._f.close()
+
+
+class ParquetSink(SweepSink):
+    """One Parquet row group per flush (needs pyarrow)."""
+
+    def __init__(self, path, buffer_rows: int = DEFAULT_BUFFER_ROWS):
+        super().__init__(path, buffer_rows)
+        self._writer = None
+
+    def _write_batch(self, batch):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.table(batch)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+
+    def _finish(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+SINKS = {".csv": CsvSink, ".ndjson": NdjsonSink, ".jsonl": NdjsonSink, ".parquet": ParquetSink}
+
+
+def open_sink(path: str | Path, buffer_rows: int = DEFAULT_BUFFER_ROWS) -> SweepSink:
+    """Sink for `path`, chosen by suffix (.csv, .ndjson/.jsonl, .parquet)."""
+    suffix = Path(path).suffix.lower()
+    try:
+        cls = SINKS[suffix]
+    except KeyError:
+        raise ValueError(
+            f"unsupported sink format {suffix!r}; use one of {sorted(SINKS)}"
+        ) from None
+    return cls(path, buffer_rows)
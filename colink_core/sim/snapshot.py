@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from .amm import PoolState, _pool_uids
+from .limits import LimitConfig, TradeLimiter
+from .twap import TWAPOracle
+
+# One .npz per snapshot: a float64 array per object, keyed "<kind>:<name>".
+# Loading is a handful of array reads, so a restart resumes warm in milliseconds.
+SNAPSHOT_FORMAT = 1
+
+_POOL_FIELDS = (
+    "x_reserve",
+    "y_reserve",
+    "fee_bps",
+    "total_lp",
+    "lp_fee_x",
+    "lp_fee_y",
+    "protocol_fee_x",
+    "protocol_fee_y",
+    "version",
+)
+
+
+@dataclass
+class Snapshot:
+    pools: dict[str, PoolState] = field(default_factory=dict)
+    oracles: dict[str, TWAPOracle] = field(default_factory=dict)
+    limiters: dict[str, TradeLimiter] = field(default_factory=dict)
+
+
+# ----- Per-object array codecs -----
+def pool_to_array(pool: PoolState) -> np.ndarray:
+    return np.array([getattr(pool, f) for f in _POOL_FIELDS], dtype=np.float64)
+
+
+def pool_from_array(a: np.ndarray) -> PoolState:
+    """Rebuild a PoolState; it gets a fresh uid, so no stale cache entry can match it."""
+    pool = PoolState.__new__(PoolState)
+    for f, v in zip(_POOL_FIELDS, a.tolist(), strict=True):
+        setattr(pool, f, v)
+    pool.version = int(pool.version)
+    pool.uid = next(_pool_uids)
+    return pool
+
+
+def oracle_to_array(tw: TWAPOracle) -> np.ndarray:
+    # the running sum is stored as-is so value() restores bit for bit
+    return np.array([tw.window, tw._sum, *tw._buf], dtype=np.float64)
+
+
+def oracle_from_array(a: np.ndarray) -> TWAPOracle:
+    tw = TWAPOracle(window=int(a[0]))
+    tw._buf.extend(a[2:].tolist())
+    tw._sum = float(a[1])
+    return tw
+
+
+def limiter_to_array(lim: TradeLimiter) -> np.ndarray:
+    c = lim.cfg
+    return np.array(
+        [
+            c.max_col_in,
+            c.max_dev_bps,
+            c.strikes_window,
+            c.cooldown_trades,
+            lim.strikes,
+            lim.tripped,
+            lim._cooldown_left,
+            lim._need_requote,
+        ],
+        dtype=np.float64,
+    )
+
+
+def limiter_from_array(a: np.ndarray) -> TradeLimiter:
+    max_col_in, max_dev_bps, window, cooldown, strikes, tripped, left, requote = a.tolist()
+    lim = TradeLimiter(LimitConfig(max_col_in, max_dev_bps, int(window), int(cooldown)))
+    lim.strikes = int(strikes)
+    lim.tripped = bool(tripped)
+    lim._cooldown_left = int(left)
+    lim._need_requote = bool(requote)
+    return lim
+
+
+# ----- Files -----
+def save_snapshot(
+    path: str | Path,
+    *,
+    pools: Mapping[str, PoolState] | None = None,
+    oracles: Mapping[str, TWAPOracle] | None = None,
+    limiters: Mapping[str, TradeLimiter] | None = None,
+) -> Path:
+    """
+    Write named pools / TWAPOracles / TradeLimiters to `path` (.npz). The file is
+    written beside the target and renamed into place, so a crash mid-checkpoint
+    never leaves a torn snapshot behind.
+    """
+    arrays = {"format": np.array([SNAPSHOT_FORMAT], dtype=np.float64)}
+    for name, p in (pools or {}).items():
+        arrays[f"pool:{name}"] = pool_to_array(p)
+    for name, tw in (oracles or {}).items():
+        arrays[f"twap:{name}"] = oracle_to_array(tw)
+    for name, lim in (limiters or {}).items():
+        arrays[f"limiter:{name}"] = limiter_to_array(lim)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+    return path
+
+
+def load_snapshot(path: str | Path) -> Snapshot:
+    snap = Snapshot()
+    decode = {
+        "pool": (snap.pools, pool_from_array),
+        "twap": (snap.oracles, oracle_from_array),
+        "limiter": (snap.limiters, limiter_from_array),
+    }
+    with np.load(Path(path)) as z:
+        if int(z["format"][0]) != SNAPSHOT_FORMAT:
+            raise ValueError(f"unsupported snapshot format {int(z['format'][0])}")
+        for key in z.files:
+            kind, _, name = key.partition(":")
+            if kind in decode:
+                out, fn = decode[kind]
+                out[name] = fn(z[key])
+    return snap
+
+
+class Checkpointer:
+    """Periodic save_snapshot: maybe_save() writes at most once per `every_sec`."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        every_sec: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if every_sec < 0:
+            raise ValueError("every_sec must be >= 0")
+        self.path = Path(path)
+        self.every_sec = float(every_sec)
+        self._clock = clock
+        self._last: float | None = None
+
+    def save(self, **state) -> Path:
+        self._last = self._clock()
+        return save_snapshot(self.path, **state)
+
+    def maybe_save(self, **state) -> bool:
+        if self._last is not None and self._clock() - self._last < self.every_sec:
+            return False
+        self.save(**state)
+        return True
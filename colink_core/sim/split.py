@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from .amm import PoolState, cp_amount_out
+
+# A route is an ordered list of hops; each hop is (pool, side) with side in
+# {"x_for_y", "y_for_x"}, naming the PoolState.swap_x_for_y / swap_y_for_x
+# direction in amm.py (x_for_y spends the pool's x reserve asset).
+Hop = tuple[PoolState, str]
+Route = Sequence[Hop]
+
+
+@dataclass
+class SplitResult:
+    amount_in: float
+    amount_out: float
+    effective_price: float
+    allocations: list[float]  # input sent down each route (same order as `routes`)
+    outputs: list[float]  # output received from each route
+
+
+def route_col_to_copx(pool_col_x: PoolState, pool_x_copx: PoolState) -> list[Hop]:
+    """COL -> XRP -> COPX as a route (same hops as router.quote_col_to_copx)."""
+    return [(pool_col_x, "y_for_x"), (pool_x_copx, "x_for_y")]
+
+
+def route_copx_to_col(pool_col_x: PoolState, pool_x_copx: PoolState) -> list[Hop]:
+    """COPX -> XRP -> COL as a route (same hops as router.quote_copx_to_col)."""
+    return [(pool_x_copx, "y_for_x"), (pool_col_x, "x_for_y")]
+
+
+def hop_reserves(pool: PoolState, side: str) -> tuple[float, float]:
+    """(reserve in, reserve out) of `pool` when traded in direction `side`."""
+    if side == "x_for_y":
+        return pool.x_reserve, pool.y_reserve
+    if side == "y_for_x":
+        return pool.y_reserve, pool.x_reserve
+    raise ValueError("side must be 'x_for_y' or 'y_for_x'")
+
+
+def _route_curve(route: Route) -> tuple[float, float]:
+    """
+    Collapse a chain of constant-product hops into out(a) = P * a / (Q + a).
+    One hop is P = r_out, Q = r_in / (1 - fee); chaining (P1, Q1) into (P2, Q2)
+    gives P = P1 * P2 / (Q2 + P1), Q = Q1 * Q2 / (Q2 + P1).
+    """
+    p, q = math.inf, 0.0
+    for pool, side in route:
+        r_in, r_out = hop_reserves(pool, side)
+        p2, q2 = r_out, r_in / (1.0 - pool.fee_bps / 1e4)
+        if math.isinf(p):
+            p, q = p2, q2
+        else:
+            d = q2 + p
+            p, q = p * p2 / d, q * q2 / d
+    return p, q
+
+
+def route_amount_out(route: Route, amount_in: float) -> float:
+    """Non-mutating output of `route` for `amount_in` (hop by hop, PoolState math)."""
+    amt = amount_in
+    for pool, side in route:
+        r_in, r_out = hop_reserves(pool, side)
+        amt = cp_amount_out(r_in, r_out, pool.fee_bps, amt)
+    return amt
+
+
+def optimal_split(routes: Sequence[Route], amount_in: float) -> list[float]:
+    """
+    Output-maximising allocation of `amount_in` across parallel routes.
+
+    Each route's marginal output is P*Q / (Q + a)^2; the optimum equalises it
+    across every route that receives flow (water-filling). Routes are ranked by
+    their zero-size marginal price P/Q and added until the next one is no longer
+    worth entering, so the solve is O(N log N) with no iteration on amounts.
+    """
+    n = len(routes)
+    if n == 0:
+        raise ValueError("need at least one route")
+    if amount_in <= 0:
+        return [0.0] * n
+
+    curves = [_route_curve(r) for r in routes]
+    order = sorted(range(n), key=lambda i: curves[i][0] / curves[i][1], reverse=True)
+
+    sum_q = 0.0
+    sum_root = 0.0
+    active = 0
+    scale = 0.0
+    for j, i in enumerate(order):
+        p, q = curves[i]
+        sum_q += q
+        sum_root += math.sqrt(p * q)
+        active = j + 1
+        scale = (amount_in + sum_q) / sum_root  # = 1 / sqrt(lambda)
+        if j + 1 < n:
+            p_next, q_next = curves[order[j + 1]]
+            if p_next / q_next <= 1.0 / (scale * scale):
+                break
+
+    alloc = [0.0] * n
+    for i in order[:active]:
+        p, q = curves[i]
+        alloc[i] = max(scale * math.sqrt(p * q) - q, 0.0)
+
+    # Put float residue on the largest leg so allocations sum to amount_in exactly.
+    big = max(order[:active], key=lambda i: alloc[i])
+    alloc[big] = amount_in - sum(a for i, a in enumerate(alloc) if i != big)
+    return alloc
+
+
+def _pool_identity(pool) -> tuple:
+    # uid, not id(): two PoolViews of one PoolBank slot are distinct objects
+    # but the same pool (uid == (bank.uid, i))
+    uid = getattr(pool, "uid", None)
+    return ("id", id(pool)) if uid is None else ("uid", uid)
+
+
+def _check_disjoint(routes: Sequence[Route]) -> None:
+    seen: set[tuple] = set()
+    for route in routes:
+        ids = {_pool_identity(pool) for pool, _side in route}
+        if seen & ids:
+            raise ValueError("routes must not share pools")
+        seen |= ids
+
+
+def _result(amount_in: float, alloc: list[float], outs: list[float]) -> SplitResult:
+    total = sum(outs)
+    eff_price = total / amount_in if amount_in > 0 else 0.0
+    return SplitResult(amount_in, total, eff_price, alloc, outs)
+
+
+def quote_split(routes: Sequence[Route], amount_in: float) -> SplitResult:
+    """Non-mutating split quote across pool-disjoint parallel routes."""
+    _check_disjoint(routes)
+    alloc = optimal_split(routes, amount_in)
+    outs = [route_amount_out(r, a) if a > 0 else 0.0 for r, a in zip(routes, alloc, strict=True)]
+    return _result(amount_in, alloc, outs)
+
+
+def exec_split(routes: Sequence[Route], amount_in: float) -> SplitResult:
+    """Mutating execution of the optimal split (each leg swaps through its pools)."""
+    _check_disjoint(routes)
+    alloc = optimal_split(routes, amount_in)
+    outs = []
+    for route, a in zip(routes, alloc, strict=True):
+        amt = a
+        if a > 0:
+            for pool, side in route:
+                if side == "x_for_y":
+                    amt, _ = pool.swap_x_for_y(amt)
+                else:
+                    amt, _ = pool.swap_y_for_x(amt)
+        outs.append(amt)
+    return _result(amount_in, alloc, outs)
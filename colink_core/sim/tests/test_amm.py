@@ -1,3 +1,5 @@
+import math
+
 from colink_core.sim.amm import PoolState
 
 
@@ -45,3 +47,56 @@ def test_price_monotonicity_basic():
     p.swap_x_for_y(100.0)
     price1 = p.y_reserve / p.x_reserve
     assert price1 < price0  # buying Y with X pushes price down (more X, less Y)
+
+
+def test_quote_many_matches_scalar_swaps_and_does_not_mutate():
+    sizes = [0.0, 1.0, 100.0, 2_500.0]
+    p = seed()
+    x0, y0 = p.x_reserve, p.y_reserve
+    outs, effs = p.quote_many_x_for_y(sizes)
+    outs_yx, effs_yx = p.quote_many_y_for_x([s * 2_500 for s in sizes])
+    assert (p.x_reserve, p.y_reserve) == (x0, y0)
+    for i, s in enumerate(sizes):
+        out, eff = seed().swap_x_for_y(s)
+        assert outs[i] == out and effs[i] == eff
+        out, eff = seed().swap_y_for_x(s * 2_500)
+        assert outs_yx[i] == out and effs_yx[i] == eff
+
+
+def test_exact_out_quotes_invert_swaps():
+    p = seed()
+    dx_in, eff = p.quote_exact_out_x_for_y(250_000.0)
+    out, _ = seed().swap_x_for_y(dx_in)
+    assert abs(out - 250_000.0) / 250_000.0 < 1e-9
+    assert eff > 0
+
+    dy_in, _ = p.quote_exact_out_y_for_x(100.0)
+    out, _ = seed().swap_y_for_x(dy_in)
+    assert abs(out - 100.0) / 100.0 < 1e-9
+
+    # cannot drain the pool
+    assert p.quote_exact_out_y_for_x(p.x_reserve) == (math.inf, 0.0)
+
+    ins, _ = p.quote_many_exact_out_x_for_y([250_000.0, p.y_reserve])
+    assert ins[0] == dx_in and ins[1] == math.inf
+
+
+def test_every_mutation_bumps_version():
+    p = seed()
+    versions = [p.version]
+    p.swap_x_for_y(1.0)
+    versions.append(p.version)
+    p.swap_y_for_x(1.0)
+    versions.append(p.version)
+    p.add_liquidity(1.0, 2_500.0)
+    versions.append(p.version)
+    p.remove_liquidity(0.01)
+    versions.append(p.version)
+    assert versions == sorted(set(versions))
+
+    # no-op calls and quotes leave the version alone
+    v = p.version
+    p.add_liquidity(0.0, 1.0)
+    p.remove_liquidity(0.0)
+    p.quote_many_x_for_y([1.0])
+    assert p.version == v
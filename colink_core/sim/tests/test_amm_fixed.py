@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from colink_core.sim.amm import PoolState
+from colink_core.sim.amm_fixed import FixedPoolState, swap_in_units, swap_out_units
+from colink_core.sim.router import exec_col_to_copx
+
+
+def seed():
+    return FixedPoolState(x_reserve=10_000.0, y_reserve=25_000_000.0, fee_bps=30)
+
+
+def test_swap_rounds_in_pool_favour_and_tracks_float_engine():
+    p = seed()
+    k0 = p.x_units * p.y_units
+    out, eff = p.swap_x_for_y(100.0)
+    ref, _ = PoolState(10_000.0, 25_000_000.0, 30).swap_x_for_y(100.0)
+    assert out <= ref and ref - out < 1e-6 + 1e-12 * ref
+    assert eff > 0
+    assert p.x_units * p.y_units >= k0
+    assert p.version == 1
+
+
+def test_exact_out_rounds_up_and_inverts_swap():
+    p = seed()
+    want = 1_000_000_000  # 1,000 COPX in 1e-6 units
+    need = swap_in_units(p.x_units, p.y_units, p.trading_fee, want)
+    assert swap_out_units(p.x_units, p.y_units, p.trading_fee, need) >= want
+    assert swap_out_units(p.x_units, p.y_units, p.trading_fee, need - 1) < want
+    with pytest.raises(ValueError):
+        swap_in_units(p.x_units, p.y_units, p.trading_fee, p.y_units)
+
+
+def test_batch_quote_matches_scalar_units():
+    p = seed()
+    sizes = np.array([0, 1, 1_000_000, 250_000_000], dtype=np.int64)
+    outs = p.quote_many_x_for_y_units(sizes)
+    for s, o in zip(sizes, outs, strict=True):
+        assert o == seed().swap_x_for_y_units(int(s))
+    assert (p.x_units, p.version) == (seed().x_units, 0)
+
+    # small reserves stay on the int64 path; huge ones overflow it and fall back
+    small = FixedPoolState(x_reserve=10.0, y_reserve=20.0, fee_bps=30)
+    big = FixedPoolState(x_reserve=1e12, y_reserve=2.5e13, fee_bps=30)
+    for pool, top in ((small, 10**6), (big, 10**12)):
+        sizes = np.array([0, 7, 1_000, top], dtype=np.int64)
+        outs = pool.quote_many_x_for_y_units(sizes)
+        assert outs.dtype == np.int64
+        want = [swap_out_units(pool.x_units, pool.y_units, pool.trading_fee, int(s)) for s in sizes]
+        assert outs.tolist() == want
+
+
+def test_liquidity_round_trip_never_pays_out_more_than_deposited():
+    p = seed()
+    minted = p.add_liquidity_units(1_000_000_000, 2_500_000_000_000)
+    dx, dy = p.remove_liquidity_units(minted)
+    assert dx <= 1_000_000_000 and dy <= 2_500_000_000_000
+    assert 0.8999 < p.remove_liquidity(0.10)[0] / 1_000.0 < 1.0001
+
+
+def test_fixed_pools_work_with_router():
+    a = FixedPoolState(x_reserve=10_000.0, y_reserve=200_000.0, fee_bps=30)
+    r = exec_col_to_copx(a, seed(), 5_000.0)
+    assert r.amount_out > 0 and a.y_reserve == 205_000.0
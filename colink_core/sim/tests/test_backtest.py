@@ -0,0 +1,140 @@
+import csv
+import datetime as dt
+import json
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from colink_core.ingest.fills_reader import Fill, read_fills_columns, read_fills_csv
+from colink_core.sim.amm import PoolState
+from colink_core.sim.backtest import REPORT_COLUMNS, backtest_fills, write_report
+from colink_core.sim.pool_bank import PoolBank
+from colink_core.sim.router import exec_col_to_copx, exec_copx_to_col
+
+
+def seed():
+    pool_x_copx = PoolState(x_reserve=10_000.0, y_reserve=25_000_000.0, fee_bps=30)
+    pool_col_x = PoolState(x_reserve=10_000.0, y_reserve=200_000.0, fee_bps=30)
+    return pool_col_x, pool_x_copx
+
+
+def fills(n=200):
+    rng = np.random.default_rng(4)
+    t0 = dt.datetime(2025, 11, 4, 13, 0)
+    out = []
+    for i in rng.permutation(n):
+        side = "sell" if rng.random() < 0.5 else "buy"
+        col = float(rng.uniform(100.0, 8_000.0))
+        out.append(Fill(t0 + dt.timedelta(seconds=int(i) * 30), side, col, col * 124.0, 124.0, 8.0))
+    return out
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["ts", "side", "col_in", "copx_out", "price", "slip_bps", "notes"])
+        w.writerows(rows)
+    return path
+
+
+def test_replay_matches_exec_in_timestamp_order():
+    a, b = seed()
+    fs = fills()
+    bt = backtest_fills(fs, a, b)
+    assert list(bt.columns) == list(REPORT_COLUMNS)
+    assert np.all(np.diff(bt.columns["ts"]) > 0)
+    assert vars(a) == vars(seed()[0]) | {"uid": a.uid}  # inputs untouched
+
+    ra, rb = seed()
+    for i, got in zip(bt.columns["row"], bt.columns["model_out"], strict=True):
+        f = fs[i]
+        if f.side == "sell":
+            assert exec_col_to_copx(ra, rb, f.col_in).amount_out == got
+        else:
+            assert exec_copx_to_col(ra, rb, f.copx_out).amount_out == got
+    for got, ref in ((bt.pool_col_x, ra), (bt.pool_x_copx, rb)):
+        assert (got.x_reserve, got.y_reserve) == (ref.x_reserve, ref.y_reserve)
+
+
+def test_replay_never_mutates_pool_bank_views():
+    a, b = seed()
+    bank = PoolBank.from_pools([a, b])
+    before = (bank.x_reserve.copy(), bank.y_reserve.copy(), bank.version.copy())
+    bt = backtest_fills(fills(20), bank.view(0), bank.view(1))
+    assert np.array_equal(bank.x_reserve, before[0])
+    assert np.array_equal(bank.y_reserve, before[1])
+    assert np.array_equal(bank.version, before[2])
+
+    ref = backtest_fills(fills(20), a, b)
+    assert np.array_equal(bt.columns["model_out"], ref.columns["model_out"])
+    assert type(bt.pool_col_x) is PoolState and bt.pool_col_x.version == 20
+    assert bt.pool_col_x.x_reserve == ref.pool_col_x.x_reserve
+
+
+def test_report_columns_follow_the_guard_and_slip_conventions():
+    a, b = seed()
+    bt = backtest_fills(fills(), a, b, cap_bps=300.0)
+    c = bt.columns
+    sell = c["side"] == "sell"
+    assert np.allclose(c["model_price"][sell], c["model_out"][sell] / c["col_in"][sell])
+    assert np.allclose(c["model_slip_bps"], (c["twap"] - c["model_price"]) / c["twap"] * 1e4)
+    assert np.allclose(c["slip_err_bps"], c["model_slip_bps"] - 8.0)
+    assert np.all(c["budget_bps"] <= 300.0)
+    assert np.array_equal(c["within_budget"], c["deviation_bps"] <= c["budget_bps"])
+    assert c["approved"].any() and not c["approved"].all()
+
+
+def test_columnar_reader_matches_row_reader(tmp_path):
+    rows = [
+        ["2025-11-04T13:20:00Z", "SELL", 1000, 124000, 124.0, 5.5, "a,b"],
+        ["1762262500", "buy", 10, 1250, 125.0, -2.0, ""],
+        ["2025-11-04 13:25:00", "sell", 7.5, 900, 120.0, 1.0, ""],
+    ]
+    path = write_csv(tmp_path / "fills.csv", rows)
+    cols = read_fills_columns(path)
+    ref = read_fills_csv(path)
+    assert cols["ts"].tolist() == [f.ts for f in ref]
+    assert cols["side"].tolist() == [f.side for f in ref]
+    assert cols["copx_out"].tolist() == [f.copx_out for f in ref]
+
+    # offsets are converted to UTC on both readers, never dropped
+    mixed = [
+        ["2025-11-04T13:20:00+02:00", "sell", 1, 124, 124.0, 0.0, ""],
+        ["2025-11-04T06:20:00-05:00", "sell", 1, 124, 124.0, 0.0, ""],
+        ["2025-11-04T11:20:00Z", "sell", 1, 124, 124.0, 0.0, ""],
+        ["1762255200", "sell", 1, 124, 124.0, 0.0, ""],
+    ]
+    path = write_csv(tmp_path / "mixed.csv", mixed)
+    want = [dt.datetime(2025, 11, 4, 11, 20)] * 4
+    assert read_fills_columns(path)["ts"].tolist() == want
+    assert [f.ts for f in read_fills_csv(path)] == want
+
+    write_csv(tmp_path / "bad.csv", [[*rows[0][:1], "hold", *rows[0][2:]]])
+    with pytest.raises(ValueError):
+        read_fills_columns(tmp_path / "bad.csv")
+
+
+def test_backtest_cli_writes_report(tmp_path):
+    rows = [[f"{1762262400 + 60 * i}", "sell", 500.0, 62_000.0, 124.0, 3.0, ""] for i in range(50)]
+    path = write_csv(tmp_path / "fills.csv", rows)
+    out = tmp_path / "report.csv"
+    args = ["backtest", "--fills", str(path), "--out", str(out)]
+    res = json.loads(subprocess.check_output([sys.executable, "-m", "colink_core.sim", *args]))
+    assert res["rows"] == 50
+
+    bt = backtest_fills(read_fills_columns(path), *seed())
+    stats = write_report(bt, tmp_path / "again.ndjson", chunk_rows=16)
+    assert stats["rows"] == 50
+    with open(out, encoding="utf-8") as f:
+        assert next(csv.reader(f)) == list(REPORT_COLUMNS)
+
+
+def test_fills_reader_ships_with_the_package():
+    from pathlib import Path
+
+    from setuptools import find_packages
+
+    root = Path(__file__).resolve().parents[3]
+    assert "colink_core.ingest" in find_packages(where=root, include=["colink_core*"])
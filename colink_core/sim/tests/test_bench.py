@@ -0,0 +1,56 @@
+import copy
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from colink_core.sim.bench import compare, measure, run_suite, seed_pools, to_metrics_doc
+from colink_core.sim.price_utils import PRICE_CACHE, modeled_bps_impact_for_size
+
+
+def test_suite_emits_collector_shaped_metrics_and_gates_regressions():
+    results = run_suite(number=20, repeat=3, only=["twap.push", "limits."])
+    assert {r.name for r in results} == {"twap.push", "limits.check_and_record"}
+    doc = to_metrics_doc(results, run_id="bench-test", sha="deadbeef")
+    for key in ("run_id", "timestamp", "backend", "os", "sha", "schema_version", "metrics"):
+        assert key in doc
+    assert doc["metrics"]["success_rate"] is None
+    assert doc["sha"] == "deadbeef"
+    assert len(to_metrics_doc(results, run_id="bench-test")["sha"]) >= 7  # schema minLength
+    assert doc["metrics"]["p95_latency_ms"] >= 0.0
+
+    assert compare(doc, doc, threshold=0.2) == []
+    slower = copy.deepcopy(doc)
+    for b in slower["metrics"]["benchmarks"].values():
+        b["ops_per_sec"] *= 0.5
+    assert len(compare(doc, slower, threshold=0.2)) == len(results)
+
+
+def test_latency_percentiles_are_per_call_and_cold_case_leaves_price_cache():
+    calls = iter(range(10**6))
+
+    def op():
+        # every 10th call is slow; batch means would smooth this out of p99
+        if next(calls) % 10 == 0:
+            time.sleep(0.002)
+
+    r = measure("spiky", 1.0, op, number=20, repeat=3)
+    assert r.p50_us < 1_000.0 <= r.p99_us
+
+    a, b = seed_pools()
+    modeled_bps_impact_for_size(a, b, 100.0)
+    run_suite(number=5, repeat=2, only=["price_utils.modeled_bps_impact.cold"])
+    hits = PRICE_CACHE.hits
+    modeled_bps_impact_for_size(a, b, 5_000.0)
+    assert PRICE_CACHE.hits == hits + 1
+
+
+def test_metrics_doc_is_schema_valid_outside_ci(monkeypatch):
+    jsonschema = pytest.importorskip("jsonschema")
+    monkeypatch.delenv("GITHUB_SHA", raising=False)
+    monkeypatch.delenv("GIT_SHA", raising=False)
+    root = Path(__file__).resolve().parents[3]
+    schema = json.loads((root / "tools" / "metrics.schema.json").read_text(encoding="utf-8-sig"))
+    doc = to_metrics_doc(run_suite(number=5, repeat=2, only=["twap.push"]), run_id="local")
+    jsonschema.validate(json.loads(json.dumps(doc)), schema)
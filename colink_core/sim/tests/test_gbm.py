@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from colink_core.sim.gbm import iter_gbm_chunks, simulate_gbm
+from colink_core.sim.json_cli import simulate_gbm_paths
+
+
+def test_paths_are_seeded_and_independent_of_chunk_size():
+    ref = simulate_gbm(64, 1_000, drift=0.05, vol=0.3, seed=11)
+    assert ref.shape == (1_000, 65)
+    assert np.all(ref[:, 0] == 1.0) and np.all(ref > 0)
+    for chunk in (1, 7, 256, 5_000):
+        assert np.array_equal(simulate_gbm(64, 1_000, 0.05, 0.3, seed=11, chunk_paths=chunk), ref)
+        chunks = list(iter_gbm_chunks(64, 1_000, 0.05, 0.3, seed=11, chunk_paths=chunk))
+        assert max(len(c) for c in chunks) <= chunk
+        assert np.array_equal(np.vstack(chunks), ref)
+    assert not np.array_equal(simulate_gbm(64, 1_000, 0.05, 0.3, seed=12), ref)
+
+
+def test_log_returns_have_gbm_moments():
+    drift, vol = 0.08, 0.25
+    paths = simulate_gbm(50, 40_000, drift, vol, seed=5, s0=2.0)
+    log_ret = np.log(paths[:, -1] / 2.0)  # horizon T = n_steps * dt = 1
+    assert abs(log_ret.mean() - (drift - 0.5 * vol**2)) < 0.01
+    assert abs(log_ret.std() - vol) < 0.01
+
+
+def test_json_cli_engine_keeps_its_signature():
+    paths = simulate_gbm_paths(n_steps=10, n_paths=3, drift=0.0, vol=0.2, seed=1, dt=0.1)
+    assert paths.shape == (3, 11)
+    assert np.array_equal(paths, simulate_gbm_paths(10, 3, 0.0, 0.2, seed=1, dt=0.1))
+    with pytest.raises(ValueError):
+        simulate_gbm(10, 3, chunk_paths=0)
@@ -0,0 +1,70 @@
+from colink_core.sim.amm import PoolState
+from colink_core.sim.graph import PoolGraph
+from colink_core.sim.router import quote_col_to_copx
+
+
+def seed():
+    pool_x_copx = PoolState(x_reserve=10_000.0, y_reserve=25_000_000.0, fee_bps=30)
+    pool_col_x = PoolState(x_reserve=10_000.0, y_reserve=200_000.0, fee_bps=30)
+    g = PoolGraph(max_hops=3)
+    g.add_pool(pool_col_x, "XRP", "COL")
+    g.add_pool(pool_x_copx, "XRP", "COPX")
+    return g, pool_col_x, pool_x_copx
+
+
+def test_two_hop_graph_quote_matches_router():
+    g, a, b = seed()
+    q = g.quote("COL", "COPX", 5_000.0)
+    r = quote_col_to_copx(a, b, 5_000.0)
+    assert q.path == ["COL", "XRP", "COPX"]
+    assert q.amount_out == r.amount_out
+    assert q.hop_outs == [r.hop1_out, r.hop2_out]
+
+
+def test_best_path_prefers_deeper_direct_pool_and_recomputes_on_change():
+    g, _a, _b = seed()
+    direct = PoolState(x_reserve=2_000.0, y_reserve=260_000.0, fee_bps=5)  # X=COL, Y=COPX
+    g.add_pool(direct, "COL", "COPX")
+    # direct pool is shallow: good for tiny sizes, poor for big ones
+    small = g.quote("COL", "COPX", 10.0)
+    big = g.quote("COL", "COPX", 50_000.0)
+    assert small.path == ["COL", "COPX"]
+    assert big.path == ["COL", "XRP", "COPX"]
+
+    # drain the direct pool's COPX side -> cached choice for the small bucket is invalidated
+    direct.swap_x_for_y(20_000.0)
+    assert g.quote("COL", "COPX", 10.0).path == ["COL", "XRP", "COPX"]
+
+
+def test_fee_change_invalidates_cached_path_and_price():
+    g, _a, _b = seed()
+    direct = PoolState(x_reserve=2_000.0, y_reserve=260_000.0, fee_bps=5)  # X=COL, Y=COPX
+    g.add_pool(direct, "COL", "COPX")
+    before = g.quote("COL", "COPX", 10.0)
+    assert before.path == ["COL", "COPX"]
+    direct.fee_bps = 2_000.0
+    after = g.quote("COL", "COPX", 10.0)
+    assert after.path == ["COL", "XRP", "COPX"]
+    assert after.amount_out != before.amount_out
+
+
+def test_execute_mutates_pools_on_chosen_path():
+    g, a, b = seed()
+    q = g.quote("COL", "COPX", 5_000.0)
+    r = g.execute("COL", "COPX", 5_000.0)
+    assert r.amount_out == q.amount_out
+    assert a.y_reserve == 205_000.0
+
+
+def test_cache_hit_checks_only_the_cached_path():
+    g, _a, _b = seed()
+    direct = PoolState(x_reserve=2_000.0, y_reserve=260_000.0, fee_bps=5)  # X=COL, Y=COPX
+    g.add_pool(direct, "COL", "COPX")
+    assert g.quote("COL", "COPX", 50_000.0).path == ["COL", "XRP", "COPX"]
+
+    # deepening the off-path direct pool leaves the cached choice in place ...
+    direct.add_liquidity(200_000.0, 26_000_000.0)
+    assert g.quote("COL", "COPX", 50_000.0).path == ["COL", "XRP", "COPX"]
+    # ... until the cache is cleared
+    g.clear_cache()
+    assert g.quote("COL", "COPX", 50_000.0).path == ["COL", "COPX"]
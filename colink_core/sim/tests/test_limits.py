@@ -1,4 +1,6 @@
-from colink_core.sim.limits import LimitConfig, TradeLimiter
+import pytest
+
+from colink_core.sim.limits import LimitConfig, LimiterRegistry, TradeLimiter
 
 
 def test_limiter_size_and_dev_caps_and_breaker():
@@ -26,3 +28,53 @@ def test_limiter_size_and_dev_caps_and_breaker():
     # first request after auto-reset tells caller to re-quote
     ok, reason = lim.check_and_record(10_000.0, 100.0)
     assert not ok and "auto_reset" in reason
+
+
+def test_registry_isolates_keys_and_applies_limiter_semantics_per_key():
+    cfg = LimitConfig(max_col_in=25_000.0, max_dev_bps=2_000.0, strikes_window=2, cooldown_trades=1)
+    reg = LimiterRegistry(cfg)
+    alice, bob = ("alice", "COL/COPX"), ("bob", "COL/COPX")
+
+    reg.check_and_record(alice, 30_000.0, 0.0)
+    ok, _ = reg.check_and_record(alice, 30_000.0, 0.0)
+    assert not ok and reg.get(alice).tripped
+    ok, reason = reg.check_and_record(bob, 10_000.0, 100.0)
+    assert ok and reason == "approved"
+
+    ok, reason = reg.can_trade(alice)
+    assert not ok and "circuit_breaker_tripped" in reason
+    assert reg.can_trade(("carol", "COL/COPX")) == (True, "ok")
+    assert ("carol", "COL/COPX") not in reg
+
+
+def test_registry_evicts_idle_and_lru_entries():
+    now = [0.0]
+    reg = LimiterRegistry(max_keys=3, idle_ttl_sec=60.0, clock=lambda: now[0])
+    for i in range(5):
+        reg.check_and_record(("acct", i), 1.0, 0.0)
+    assert len(reg) == 3 and ("acct", 0) not in reg
+
+    now[0] = 30.0
+    reg.get(("acct", 4))
+    now[0] = 70.0
+    assert reg.evict_idle() == 2
+    assert len(reg) == 1 and ("acct", 4) in reg and ("acct", 3) not in reg
+
+    # an evicted key comes back as a fresh, untripped limiter
+    tripped = LimiterRegistry(
+        LimitConfig(strikes_window=1), idle_ttl_sec=60.0, clock=lambda: now[0]
+    )
+    tripped.check_and_record("acct", 30_000.0, 0.0)
+    assert tripped.get("acct").tripped
+    now[0] = 200.0
+    lim = tripped.get("acct")
+    assert not lim.tripped and lim.strikes == 0
+
+
+def test_limiters_are_slotted():
+    # ~100k registry entries stay small: no per-instance __dict__
+    lim = LimiterRegistry().get("acct")
+    assert not hasattr(TradeLimiter(LimitConfig()), "__dict__")
+    assert not hasattr(lim, "__dict__")
+    with pytest.raises(AttributeError):
+        lim.note = "x"
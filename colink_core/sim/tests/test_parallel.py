@@ -0,0 +1,65 @@
+import json
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from colink_core.sim.amm import PoolState
+from colink_core.sim.gbm import simulate_gbm
+from colink_core.sim.parallel import imap_ordered, parallel_map, worker_pool
+from colink_core.sim.price_utils import route_mid_price_copx_per_col
+from colink_core.sim.risk_guard import evaluate_guard_many, iter_guard_chunks
+from colink_core.sim.rng import RngStreams
+from colink_core.sim.twap import TWAPOracle
+
+
+def seed():
+    pool_x_copx = PoolState(x_reserve=10_000.0, y_reserve=25_000_000.0, fee_bps=30)
+    pool_col_x = PoolState(x_reserve=10_000.0, y_reserve=200_000.0, fee_bps=30)
+    return pool_col_x, pool_x_copx
+
+
+def test_parallel_map_keeps_unit_order():
+    assert parallel_map(abs, range(-20, 0), workers=3) == list(range(20, 0, -1))
+
+
+def test_one_worker_pool_serves_every_batch():
+    with worker_pool(1) as ex:
+        assert ex is None
+    with worker_pool(2) as ex:
+        for _ in range(3):
+            assert parallel_map(abs, range(-6, 0), executor=ex) == [6, 5, 4, 3, 2, 1]
+        assert list(imap_ordered(abs, range(-50, 0), ex, ahead=4)) == list(range(50, 0, -1))
+
+
+def test_gbm_units_are_identical_for_any_worker_count():
+    kw = dict(seed=RngStreams(9, scenario="gbm"), chunk_paths=128)
+    ref = simulate_gbm(16, 1_000, 0.05, 0.2, workers=1, **kw)
+    assert ref.shape == (1_000, 17) and np.all(ref[:, 0] == 1.0)
+    for workers in (2, 3):
+        assert np.array_equal(simulate_gbm(16, 1_000, 0.05, 0.2, workers=workers, **kw), ref)
+    assert not np.array_equal(ref[:128], ref[128:256])
+    # a single Generator cannot be split across processes
+    with pytest.raises(ValueError):
+        simulate_gbm(16, 1_000, 0.05, 0.2, seed=9, chunk_paths=128, workers=2)
+
+
+def test_parallel_guard_sweep_matches_single_pass():
+    a, b = seed()
+    tw = TWAPOracle(window=8)
+    tw.warm([route_mid_price_copx_per_col(a, b)] * 8)
+    sizes = np.geomspace(100.0, 50_000.0, 37)
+    ref = evaluate_guard_many(a, b, tw, sizes, cap_bps=1_500.0)
+    with worker_pool(3) as ex:
+        parts = list(iter_guard_chunks(a, b, tw, sizes, chunk=10, executor=ex, cap_bps=1_500.0))
+    assert [p.col_in.size for p in parts] == [10, 10, 10, 7]
+    for f in ("copx_out", "deviation_bps", "budget_bps", "approved"):
+        assert np.array_equal(np.concatenate([getattr(p, f) for p in parts]), getattr(ref, f))
+    assert {(p.mid, p.twap_mid) for p in parts} == {(ref.mid, ref.twap_mid)}
+
+
+def test_json_sweep_accepts_workers(tmp_path):
+    args = ["sweep", "--outdir", tmp_path.as_posix(), "--n-paths", "300", "--workers", "2"]
+    out = subprocess.check_output([sys.executable, "-m", "colink_core.sim.json_cli", *args])
+    assert len(json.loads(out)["charts"]) == 2
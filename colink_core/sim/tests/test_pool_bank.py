@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from colink_core.sim.amm import PoolBase, PoolState
+from colink_core.sim.pool_bank import PoolBank
+from colink_core.sim.router import quote_col_to_copx
+
+
+def seed_pools():
+    return [
+        PoolState(x_reserve=10_000.0, y_reserve=25_000_000.0, fee_bps=30),
+        PoolState(x_reserve=10_000.0, y_reserve=200_000.0, fee_bps=30),
+        PoolState(x_reserve=5_000.0, y_reserve=80_000.0, fee_bps=5),
+    ]
+
+
+def test_vectorized_swaps_match_scalar_pools():
+    pools = seed_pools()
+    bank = PoolBank.from_pools(pools)
+    sizes = np.array([100.0, 250.0, 0.0])
+
+    out, eff = bank.swap_x_for_y(sizes)
+    for i, p in enumerate(pools):
+        o, e = p.swap_x_for_y(float(sizes[i]))
+        assert out[i] == o and eff[i] == e
+        assert bank.x_reserve[i] == p.x_reserve and bank.y_reserve[i] == p.y_reserve
+
+    out, _ = bank.swap_y_for_x(5_000.0, idx=[1, 2])
+    for j, i in enumerate([1, 2]):
+        o, _ = pools[i].swap_y_for_x(5_000.0)
+        assert out[j] == o
+    assert bank.y_reserve[0] == pools[0].y_reserve
+
+
+def test_liquidity_add_and_remove_match_scalar_pools():
+    pools = seed_pools()
+    bank = PoolBank.from_pools(pools)
+
+    minted = bank.add_liquidity([1_000.0, -1.0, 500.0], [2_500_000.0, 10.0, 8_000.0])
+    dx, dy = bank.remove_liquidity(0.10)
+    for i, p in enumerate(pools):
+        assert minted[i] == p.add_liquidity(
+            [1_000.0, -1.0, 500.0][i], [2_500_000.0, 10.0, 8_000.0][i]
+        )
+        assert (dx[i], dy[i]) == p.remove_liquidity(0.10)
+        assert bank.total_lp[i] == p.total_lp
+
+
+def test_view_is_pool_state_compatible():
+    bank = PoolBank.from_pools(seed_pools())
+    pool_x_copx, pool_col_x = bank.view(0), bank.view(1)
+    q = quote_col_to_copx(pool_col_x, pool_x_copx, 5_000.0)
+    ref = quote_col_to_copx(seed_pools()[1], seed_pools()[0], 5_000.0)
+    assert q == ref
+
+    pool_x_copx.swap_x_for_y(100.0)
+    assert bank.x_reserve[0] == 10_100.0
+
+
+def test_views_carry_no_instance_dict():
+    bank = PoolBank.from_pools(seed_pools())
+    v = bank.view(0)
+    assert not hasattr(v, "__dict__")
+    with pytest.raises(AttributeError):
+        v.note = "x"
+    assert isinstance(v, PoolBase) and isinstance(seed_pools()[0], PoolBase)
@@ -1,6 +1,20 @@
+import numpy as np
+import pytest
+
 from colink_core.sim.amm import PoolState
-from colink_core.sim.price_utils import route_mid_price_copx_per_col
-from colink_core.sim.risk_guard import quote_with_slippage, size_aware_twap_guard
+from colink_core.sim.limits import LimitConfig, TradeLimiter
+from colink_core.sim.price_utils import (
+    bps_deviation,
+    modeled_bps_impact_for_size,
+    route_mid_price_copx_per_col,
+)
+from colink_core.sim.risk_guard import (
+    evaluate_guard,
+    evaluate_guard_many,
+    guard_decisions_many,
+    quote_with_slippage,
+    size_aware_twap_guard,
+)
 from colink_core.sim.router import quote_col_to_copx
 from colink_core.sim.twap import TWAPOracle
 
@@ -32,3 +46,64 @@ def test_size_aware_twap_guard_blocks_large_deviation():
     )
     assert not ok
     assert dev_bps > budget_bps
+
+
+def test_fused_guard_matches_separate_quote_and_impact_calls():
+    a, b = seed()
+    tw = TWAPOracle(window=8)
+    tw.warm([route_mid_price_copx_per_col(a, b)] * 8)
+    b.swap_x_for_y(300.0)
+    sizes = [0.0, 100.0, 5_000.0, 25_000.0]
+
+    batch = evaluate_guard_many(a, b, tw, sizes)
+    for i, col_in in enumerate(sizes):
+        g = evaluate_guard(a, b, tw, col_in)
+        q = quote_col_to_copx(a, b, col_in)
+        assert g.copx_out == q.amount_out
+        assert g.modeled_bps == modeled_bps_impact_for_size(a, b, col_in)
+        assert g.deviation_bps == bps_deviation(q.effective_price, tw.value())
+        assert g.as_tuple() == size_aware_twap_guard(a, b, tw, col_in)
+        assert (batch.deviation_bps[i], batch.budget_bps[i], batch.approved[i]) == (
+            g.deviation_bps,
+            g.budget_bps,
+            g.approved,
+        )
+
+
+def test_batch_decisions_match_per_order_guard_and_limiter():
+    a, b = seed()
+    tw = TWAPOracle(window=8)
+    tw.warm([route_mid_price_copx_per_col(a, b)] * 8)
+    sizes = np.array([100.0, 5_000.0, 15_000.0, 25_000.0, 40_000.0])
+    slip = np.array([50.0, 500.0, 5_000.0, 5_000.0, 5_000.0])
+    queued = [quote_with_slippage(a, b, s, slip_bps=slip[i]) for i, s in enumerate(sizes)]
+    b.swap_x_for_y(50.0)  # ~1% worse COPX price since the orders were quoted
+    cfg = LimitConfig(max_col_in=20_000.0, max_dev_bps=1_000.0)
+
+    quoted = np.array([gq.copx_out_quote for gq in queued])
+    d = guard_decisions_many(a, b, tw, sizes, slip, quoted_out=quoted, limits=cfg)
+    for i, col_in in enumerate(sizes):
+        ok, dev, budget = size_aware_twap_guard(a, b, tw, col_in)
+        lim_ok, _ = TradeLimiter(cfg).check_and_record(col_in, dev)
+        out = quote_col_to_copx(a, b, col_in).amount_out
+        assert (d.deviation_bps[i], d.budget_bps[i]) == (dev, budget)
+        assert d.within_budget[i] == ok and d.within_limits[i] == lim_ok
+        assert d.min_out[i] == queued[i].min_out
+        assert d.within_slippage[i] == (out >= queued[i].min_out)
+        assert d.approved[i] == (ok and lim_ok and out >= queued[i].min_out)
+    # under its min-out; approved; over the dev cap; over budget and the size cap (x2)
+    assert d.within_slippage.tolist() == [False, True, True, True, True]
+    assert d.approved.tolist() == [False, True, False, False, False]
+
+    # quoted now: min_out is the floor to send, so it never fails the check
+    now = guard_decisions_many(a, b, tw, sizes, slip, limits=cfg)
+    assert now.within_slippage.all()
+    assert np.array_equal(now.min_out, now.copx_out * (1.0 - slip / 1e4))
+
+
+def test_window_on_a_single_window_baseline_is_a_type_error():
+    a, b = seed()
+    tw = TWAPOracle(window=8)
+    tw.warm([route_mid_price_copx_per_col(a, b)] * 8)
+    with pytest.raises(TypeError, match="OracleBank"):
+        size_aware_twap_guard(a, b, tw, 1_000.0, twap_window_sec=60.0)
@@ -0,0 +1,58 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from colink_core.sim.gbm import iter_gbm_chunks, simulate_gbm
+from colink_core.sim.json_cli import simulate_gbm_paths
+from colink_core.sim.rng import RngStreams, stable_key
+from colink_core.sim.run_sweep import SERIES_CHUNK, _gen_series
+
+
+def test_streams_depend_only_on_seed_and_key():
+    a = RngStreams(42, scenario="demo")
+    # drawing other keys first (or in another process) never shifts a stream
+    for key in [(3, 1), (0, 0), (7, 2)]:
+        a.generator(*key).random(10)
+    b = pickle.loads(pickle.dumps(RngStreams(42, scenario="demo")))
+    assert np.array_equal(a.generator(3, 1).random(8), b.generator(3, 1).random(8))
+
+    draws = {
+        RngStreams(42, scenario=scen).generator(p, c).random(4).tobytes()
+        for scen in ("demo", "other")
+        for p in range(3)
+        for c in range(3)
+    }
+    assert len(draws) == 18
+    assert isinstance(a.generator().bit_generator, np.random.Philox)
+
+
+def test_stable_key_is_process_independent():
+    assert stable_key("gbm") == 3_591_442_551
+    assert stable_key(5) == 5
+    with pytest.raises(ValueError):
+        stable_key(-1)
+
+
+def test_gbm_chunk_regenerates_alone_and_cli_is_worker_invariant():
+    kw = dict(seed=11, dt=0.0625, chunk_paths=100)
+    full = simulate_gbm_paths(16, 450, 0.05, 0.2, workers=2, **kw)
+    assert np.array_equal(full, simulate_gbm_paths(16, 450, 0.05, 0.2, **kw))
+    streams = RngStreams(11, scenario="gbm")
+    assert np.array_equal(full, simulate_gbm(16, 450, 0.05, 0.2, streams, 0.0625, chunk_paths=100))
+    chunks = iter_gbm_chunks(16, 450, 0.05, 0.2, streams, 0.0625, chunk_paths=100)
+    assert np.array_equal(full, np.vstack(list(chunks)))
+
+    # rebuild chunk 3 (paths 300..399) straight from its stream
+    z = RngStreams(11, scenario="gbm").generator(path=3).standard_normal((100, 16))
+    sig = 0.2 * 0.25
+    steps = (0.05 - 0.5 * 0.2 * 0.2) * 0.0625 + sig * z
+    assert np.allclose(full[300:400, 1:], np.exp(np.cumsum(steps, axis=1)), rtol=1e-12)
+
+
+def test_series_chunks_are_independent_streams():
+    pts = _gen_series(SERIES_CHUNK + 10, seed=5)
+    assert _gen_series(SERIES_CHUNK + 10, seed=5) == pts
+    assert _gen_series(SERIES_CHUNK - 1, seed=5) == pts[: SERIES_CHUNK - 1]
+    u = RngStreams(5, scenario="run_sweep.series").generator(chunk=1).random((10, 2))
+    assert [p["depth"] for p in pts[SERIES_CHUNK:]] == (1000.0 + 100.0 * (u[:, 1] - 0.5)).tolist()
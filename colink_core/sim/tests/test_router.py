@@ -1,5 +1,14 @@
 from colink_core.sim.amm import PoolState
-from colink_core.sim.router import exec_col_to_copx, quote_col_to_copx
+from colink_core.sim.router import (
+    exec_col_to_copx,
+    exec_copx_to_col,
+    quote_col_to_copx,
+    quote_col_to_copx_exact_out,
+    quote_copx_to_col,
+    quote_copx_to_col_exact_out,
+    quote_many_col_to_copx_exact_out,
+    quote_many_copx_to_col_exact_out,
+)
 
 
 def seed():
@@ -16,3 +25,43 @@ def test_quote_and_exec_are_positive_and_reasonable():
     a2, b2 = seed()
     r = exec_col_to_copx(a2, b2, 5_000.0)
     assert abs(r.amount_out - q.amount_out) / q.amount_out < 1e-9
+
+
+def test_closed_form_quotes_match_deepcopy_swaps_bit_for_bit():
+    a, b = seed()
+    for size in (0.0, 1.0, 5_000.0, 250_000.0):
+        q = quote_col_to_copx(a, b, size)
+        a2, b2 = seed()
+        r = exec_col_to_copx(a2, b2, size)
+        assert (q.hop1_out, q.amount_out, q.effective_price) == (
+            r.hop1_out,
+            r.amount_out,
+            r.effective_price,
+        )
+        q = quote_copx_to_col(a, b, size * 100)
+        a2, b2 = seed()
+        r = exec_copx_to_col(a2, b2, size * 100)
+        assert (q.hop1_out, q.amount_out, q.effective_price) == (
+            r.hop1_out,
+            r.amount_out,
+            r.effective_price,
+        )
+
+
+def test_exact_out_quotes_round_trip_both_routes():
+    a, b = seed()
+    r = quote_col_to_copx_exact_out(a, b, 100_000.0)
+    q = quote_col_to_copx(a, b, r.amount_in)
+    assert abs(q.amount_out - 100_000.0) / 100_000.0 < 1e-9
+    assert abs(q.hop1_out - r.hop1_out) / r.hop1_out < 1e-9
+
+    r = quote_copx_to_col_exact_out(a, b, 4_000.0)
+    q = quote_copx_to_col(a, b, r.amount_in)
+    assert abs(q.amount_out - 4_000.0) / 4_000.0 < 1e-9
+
+    many = quote_many_col_to_copx_exact_out(a, b, [100_000.0, b.y_reserve * 2])
+    assert many.amount_in[0] == quote_col_to_copx_exact_out(a, b, 100_000.0).amount_in
+    assert many.amount_in[1] == float("inf") and many.effective_price[1] == 0.0
+
+    many = quote_many_copx_to_col_exact_out(a, b, [4_000.0])
+    assert many.amount_in[0] == quote_copx_to_col_exact_out(a, b, 4_000.0).amount_in
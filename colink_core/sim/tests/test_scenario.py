@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from colink_core.sim.amm import PoolState
+from colink_core.sim.parallel import worker_pool
+from colink_core.sim.scenario import (
+    REPEAT_BLOCK,
+    compile_scenario,
+    load_scenario,
+    main,
+    run_block,
+    run_plan,
+)
+
+CONFIGS = Path(__file__).resolve().parents[3] / "configs" / "sims"
+
+
+def doc(**sweep):
+    return {
+        "name": "t",
+        "seed": 5,
+        "markets": [
+            {"pair": "COL/COPX", "init_price": 1.0, "init_depth_col": 1e5, "init_depth_copx": 1e5},
+            {"pair": "COL/XRP", "init_price": 0.05, "init_depth_col": 4e5, "init_depth_copx": 2e4},
+        ],
+        "sweep": {"sizes_col": [100, 1_000, 10_000], "repeats": 4, "twap_guard_bps": 150, **sweep},
+    }
+
+
+def test_plan_runs_vectorized_and_matches_pool_quotes():
+    plan = compile_scenario(doc())
+    cols = run_plan(plan)
+    assert cols["size"].size == plan.n_rows == 2 * 4 * 3
+    assert list(cols["market"][:12]) == ["COL/COPX"] * 12
+
+    for i in range(0, plan.n_rows, 3):
+        x = np.sqrt(1e10 / cols["mid"][i]) if i < 12 else np.sqrt(8e9 / cols["mid"][i])
+        pool = PoolState(x, x * cols["mid"][i], 30)
+        out, _ = pool.quote_many_x_for_y(cols["size"][i : i + 3])
+        np.testing.assert_allclose(cols["amount_out"][i : i + 3], out, rtol=1e-12)
+    assert np.array_equal(cols["approved"], cols["dev_bps"] <= 150)
+
+    again = run_plan(compile_scenario(doc()))
+    assert all(np.array_equal(cols[c], again[c]) for c in cols)
+
+
+def test_repeat_blocks_run_anywhere_with_identical_output():
+    plan = compile_scenario(doc(repeats=REPEAT_BLOCK + 5))
+    serial = run_plan(plan)
+    assert serial["size"].size == plan.n_rows
+    with worker_pool(2) as ex:
+        fanned = run_plan(plan, ex)
+    assert all(np.array_equal(serial[c], fanned[c]) for c in serial)
+
+    # block 1 of market 1 regenerates alone
+    tail = run_block(plan, 1, 1)
+    assert np.array_equal(tail["mid"], serial["mid"][-5 * 3 :])
+    assert (
+        tail["repeat"].tolist() == np.repeat(np.arange(REPEAT_BLOCK, REPEAT_BLOCK + 5), 3).tolist()
+    )
+
+
+def test_compile_rejects_incomplete_scenarios():
+    bad = doc()
+    del bad["sweep"]["twap_guard_bps"]
+    with pytest.raises(ValueError):
+        compile_scenario(bad)
+    with pytest.raises(ValueError):
+        compile_scenario(doc(repeats=0))
+
+
+def test_repo_scenarios_write_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    pytest.importorskip("yaml")
+    files = sorted(str(p) for p in CONFIGS.glob("*.yml"))
+    assert main([*files, "--outdir", str(tmp_path), "--workers", "1"]) == 0
+    for f in files:
+        plan = load_scenario(f)
+        table = pq.read_table(tmp_path / f"{plan.name}.parquet")
+        assert table.num_rows == plan.n_rows
+        assert table.schema.metadata[b"scenario"] == plan.name.encode()
@@ -0,0 +1,72 @@
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from colink_core.sim.sink import RunningStats, SweepSink, open_sink
+
+
+def batches(n=1_000, size=64):
+    rng = np.random.default_rng(1)
+    for a in range(0, n, size):
+        m = min(size, n - a)
+        yield {"i": np.arange(a, a + m), "x": rng.normal(5.0, 2.0, m), "ok": rng.random(m) < 0.5}
+
+
+def test_running_stats_match_numpy_for_batches_and_scalars():
+    data = np.random.default_rng(0).normal(3.0, 4.0, 10_001)
+    batched, scalar = RunningStats(), RunningStats()
+    for chunk in np.array_split(data, 7):
+        batched.update(chunk)
+    for v in data:
+        scalar.push(v)
+    for s in (batched, scalar):
+        assert s.count == data.size and (s.min, s.max) == (data.min(), data.max())
+        assert s.mean == pytest.approx(data.mean(), rel=1e-12)
+        assert s.std == pytest.approx(data.std(), rel=1e-10)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".ndjson", ".parquet"])
+def test_sinks_stream_all_rows_in_order(tmp_path, suffix):
+    if suffix == ".parquet":
+        pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / f"out{suffix}"
+    with open_sink(path, buffer_rows=200) as sink:
+        for b in batches():
+            sink.write_columns(b)
+            assert sink._pending_rows < 200
+    summary = sink.summary()
+    assert summary["rows"] == 1_000
+    assert set(summary["columns"]) == {"i", "x"}
+
+    if suffix == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            got = [int(r["i"]) for r in csv.DictReader(f)]
+    elif suffix == ".ndjson":
+        got = [json.loads(line)["i"] for line in path.read_text(encoding="utf-8").splitlines()]
+    else:
+        meta = pq.ParquetFile(path).metadata
+        assert meta.num_row_groups == 4  # flushed every 4 batches of 64 rows
+        got = pq.read_table(path).column("i").to_pylist()
+    assert got == list(range(1_000))
+    x = np.concatenate([b["x"] for b in batches()])
+    assert summary["columns"]["x"]["max"] == x.max()
+
+
+def test_sink_rejects_changing_columns_and_unknown_format(tmp_path):
+    with open_sink(tmp_path / "a.csv") as sink:
+        sink.write_row({"a": 1, "b": 2.0})
+        with pytest.raises(ValueError):
+            sink.write_row({"b": 2.0, "a": 1})
+    with pytest.raises(ValueError):
+        open_sink(tmp_path / "a.xlsx")
+
+
+def test_sink_base_is_abstract_and_empty_csv_keeps_its_header(tmp_path):
+    with pytest.raises(TypeError):
+        SweepSink(tmp_path / "x.csv")
+
+    with open_sink(tmp_path / "empty.csv") as sink:
+        sink.write_columns({"size": np.array([]), "dev_bps": np.array([])})
+    assert (tmp_path / "empty.csv").read_text(encoding="utf-8").splitlines() == ["size,dev_bps"]
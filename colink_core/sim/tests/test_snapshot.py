@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from colink_core.sim.amm import PoolState
+from colink_core.sim.limits import LimitConfig, TradeLimiter
+from colink_core.sim.snapshot import Checkpointer, load_snapshot, save_snapshot
+from colink_core.sim.twap import TWAPOracle
+
+
+def seed():
+    pool_x_copx = PoolState(x_reserve=10_000.0, y_reserve=25_000_000.0, fee_bps=30)
+    pool_col_x = PoolState(x_reserve=10_000.0, y_reserve=200_000.0, fee_bps=30)
+    return pool_col_x, pool_x_copx
+
+
+def test_snapshot_round_trips_pools_oracle_and_limiter(tmp_path):
+    a, b = seed()
+    a.swap_y_for_x(3_000.0)
+    b.add_liquidity(100.0, 250_000.0)
+    tw = TWAPOracle(window=8)
+    tw.warm([100.0 + 0.1 * i for i in range(13)])
+    lim = TradeLimiter(LimitConfig(strikes_window=2, cooldown_trades=3))
+    lim.check_and_record(30_000.0, 0.0)
+    lim.check_and_record(30_000.0, 0.0)
+    lim.can_trade()
+
+    path = save_snapshot(
+        tmp_path / "state.npz",
+        pools={"col_x": a, "x_copx": b},
+        oracles={"twap": tw},
+        limiters={"acct": lim},
+    )
+    snap = load_snapshot(path)
+
+    for name, orig in (("col_x", a), ("x_copx", b)):
+        got = snap.pools[name]
+        assert vars(got) | {"uid": orig.uid} == vars(orig)
+        assert got.uid != orig.uid
+        assert got.swap_y_for_x(500.0) == orig.swap_y_for_x(500.0)
+
+    rtw = snap.oracles["twap"]
+    assert rtw.value() == tw.value() and list(rtw._buf) == list(tw._buf)
+    rtw.push(99.0)
+    tw.push(99.0)
+    assert rtw.value() == tw.value()
+
+    rlim = snap.limiters["acct"]
+    assert rlim.cfg == lim.cfg
+    for _ in range(4):
+        assert rlim.can_trade() == lim.can_trade()
+
+
+def test_checkpointer_saves_at_most_once_per_interval(tmp_path):
+    now = [0.0]
+    ck = Checkpointer(tmp_path / "ck.npz", every_sec=10.0, clock=lambda: now[0])
+    tw = TWAPOracle(window=4)
+    tw.push(1.0)
+    assert ck.maybe_save(oracles={"twap": tw})
+    tw.push(3.0)
+    now[0] = 5.0
+    assert not ck.maybe_save(oracles={"twap": tw})
+    assert load_snapshot(ck.path).oracles["twap"].value() == 1.0
+    now[0] = 10.0
+    assert ck.maybe_save(oracles={"twap": tw})
+    assert load_snapshot(ck.path).oracles["twap"].value() == 2.0
+    assert not (tmp_path / "ck.npz.tmp").exists()
+
+
+def test_load_rejects_unknown_format(tmp_path):
+    path = tmp_path / "bad.npz"
+    np.savez(path, format=np.array([99.0]))
+    with pytest.raises(ValueError):
+        load_snapshot(path)
@@ -0,0 +1,83 @@
+import pytest
+
+from colink_core.sim.amm import PoolState
+from colink_core.sim.pool_bank import PoolBank
+from colink_core.sim.router import quote_col_to_copx
+from colink_core.sim.split import (
+    exec_split,
+    optimal_split,
+    quote_split,
+    route_amount_out,
+    route_col_to_copx,
+)
+
+
+def seed():
+    pool_x_copx = PoolState(x_reserve=10_000.0, y_reserve=25_000_000.0, fee_bps=30)
+    pool_col_x = PoolState(x_reserve=10_000.0, y_reserve=200_000.0, fee_bps=30)
+    return pool_col_x, pool_x_copx
+
+
+def test_route_amount_out_matches_router_quote():
+    a, b = seed()
+    assert (
+        route_amount_out(route_col_to_copx(a, b), 5_000.0)
+        == quote_col_to_copx(a, b, 5_000.0).amount_out
+    )
+
+
+def test_identical_routes_split_evenly_and_beat_single_route():
+    routes = [route_col_to_copx(*seed()), route_col_to_copx(*seed())]
+    alloc = optimal_split(routes, 50_000.0)
+    assert abs(alloc[0] - alloc[1]) < 1e-6
+    assert sum(alloc) == 50_000.0
+
+    split = quote_split(routes, 50_000.0)
+    single = quote_col_to_copx(*seed(), 50_000.0)
+    assert split.amount_out > single.amount_out
+
+
+def test_split_with_direct_pool_is_optimal_vs_grid():
+    direct = PoolState(x_reserve=200_000.0, y_reserve=20_000_000.0, fee_bps=5)  # X=COL, Y=COPX
+    routes = [route_col_to_copx(*seed()), [(direct, "x_for_y")]]
+    total = 40_000.0
+    best = max(
+        route_amount_out(routes[0], total * k / 1000)
+        + route_amount_out(routes[1], total * (1 - k / 1000))
+        for k in range(1001)
+    )
+    res = quote_split(routes, total)
+    assert res.amount_out >= best - 1e-6 * best
+
+
+def test_tiny_order_uses_best_route_only():
+    poor = PoolState(x_reserve=200_000.0, y_reserve=1_000_000.0, fee_bps=30)
+    routes = [route_col_to_copx(*seed()), [(poor, "x_for_y")]]
+    assert optimal_split(routes, 10.0)[1] == 0.0
+
+
+def test_exec_split_matches_quote_and_mutates_pools():
+    a1, b1 = seed()
+    a2, b2 = seed()
+    routes = [route_col_to_copx(a1, b1), route_col_to_copx(a2, b2)]
+    q = quote_split(routes, 20_000.0)
+    r = exec_split(routes, 20_000.0)
+    assert r.outputs == q.outputs
+    assert a1.y_reserve > 200_000.0 and a2.y_reserve > 200_000.0
+
+
+def test_routes_sharing_a_pool_bank_slot_are_rejected():
+    bank = PoolBank.from_pools([*seed(), *seed()])
+    ok = [
+        route_col_to_copx(bank.view(0), bank.view(1)),
+        route_col_to_copx(bank.view(2), bank.view(3)),
+    ]
+    assert quote_split(ok, 1_000.0).amount_out > 0
+
+    # distinct view objects onto the same slot are still the same pool
+    shared = [
+        route_col_to_copx(bank.view(0), bank.view(1)),
+        route_col_to_copx(bank.view(0), bank.view(3)),
+    ]
+    with pytest.raises(ValueError):
+        quote_split(shared, 1_000.0)
@@ -1,6 +1,26 @@
+import numpy as np
+import pytest
+
 from colink_core.sim.amm import PoolState
-from colink_core.sim.price_utils import bps_deviation, route_mid_price_copx_per_col
-from colink_core.sim.twap import TWAPOracle
+from colink_core.sim.price_utils import (
+    PRICE_CACHE,
+    VersionedLRU,
+    bps_deviation,
+    cached_quote_col_to_copx,
+    impact_curve,
+    modeled_bps_impact_for_size,
+    route_mid_price_copx_per_col,
+)
+from colink_core.sim.risk_guard import size_aware_twap_guard
+from colink_core.sim.router import quote_col_to_copx
+from colink_core.sim.twap import (
+    TWAP,
+    MedianOracle,
+    OracleBank,
+    QuantileOracle,
+    TWAPOracle,
+    rolling_twap,
+)
 
 
 def seed():
@@ -24,3 +44,175 @@ def test_bps_deviation_zero_when_equal():
 def test_bps_deviation_positive_when_below_twap():
     dev = bps_deviation(95.0, 100.0)
     assert 499.0 < dev < 501.0  # ~500 bps
+
+
+def test_modeled_impact_memoized_until_pool_changes():
+    a, b = seed()
+    PRICE_CACHE.clear()
+    first = modeled_bps_impact_for_size(a, b, 5_000.0)
+    hits = PRICE_CACHE.hits
+    assert modeled_bps_impact_for_size(a, b, 5_000.0) == first
+    assert PRICE_CACHE.hits == hits + 1
+
+    b.swap_x_for_y(500.0)
+    changed = modeled_bps_impact_for_size(a, b, 5_000.0)
+    assert changed != first
+    assert changed == modeled_bps_impact_for_size(*seed_after_swap(), 5_000.0)
+
+
+def seed_after_swap():
+    a, b = seed()
+    b.swap_x_for_y(500.0)
+    return a, b
+
+
+def test_impact_curve_is_exact_at_any_size_and_rebuilt_on_mutation():
+    a, b = seed()
+    curve = impact_curve(a, b)
+    sizes = np.geomspace(1.0, 1e7, 36)
+    mid = route_mid_price_copx_per_col(a, b)
+    for col_in, bps in zip(sizes, curve.many(sizes), strict=True):
+        eff = quote_col_to_copx(a, b, col_in).effective_price
+        assert curve(col_in) == bps == max(0.0, (mid - eff) / mid) * 1e4
+    assert curve(0.0) == curve.many([0.0])[0] == 0.0
+    assert np.all(np.diff(curve.many(sizes)) >= 0)
+
+    assert impact_curve(a, b) is curve
+    a.swap_y_for_x(1_000.0)
+    assert impact_curve(a, b) is not curve
+
+
+def test_versioned_lru_is_bounded():
+    cache = VersionedLRU(maxsize=2)
+    for i in range(5):
+        cache.put(i, i)
+    assert len(cache) == 2
+    assert cache.get(0) is None and cache.get(4) == 4
+
+
+def test_cached_quote_sees_fee_changes():
+    a, b = seed()
+    q = cached_quote_col_to_copx(a, b, 1_000.0)
+    a.fee_bps = 100.0
+    assert cached_quote_col_to_copx(a, b, 1_000.0) == quote_col_to_copx(a, b, 1_000.0) != q
+
+
+def test_time_weighted_twap_weights_by_duration_not_sample_count():
+    tw = TWAP(window_sec=10.0)
+    tw.add(100.0, ts=0.0)
+    tw.add(200.0, ts=8.0)
+    # burst of spikes within one instant-ish span carries almost no weight
+    for i in range(100):
+        tw.add(10_000.0, ts=9.0 + i * 1e-6)
+    tw.add(200.0, ts=9.0001)
+    # window [0.0001, 10.0001]: ~100 for 8s, 200 for ~1s, spike for 1e-4s, 200 for 1s
+    assert (
+        abs(tw.value(now=10.0001) - (100.0 * 7.9999 + 200.0 * 2.0 + 10_000.0 * 1e-4) / 10.0) < 1e-6
+    )
+
+
+def test_time_weighted_twap_evicts_by_age_and_stays_bounded():
+    tw = TWAP(window_sec=5.0, capacity=16)
+    for t in range(100):
+        tw.add(float(t), ts=float(t))
+    assert len(tw) <= 16
+    # window [94, 99]: price t holds on [t, t+1)
+    assert tw.value() == sum(range(94, 99)) / 5.0
+    # far in the future only the last price is in force
+    assert tw.value(now=1_000.0) == 99.0
+    assert len(tw) == 1
+
+
+def test_oracle_bank_windows_match_single_window_twaps():
+    bank = OracleBank(windows_sec=(5.0, 30.0), ema_half_lives_sec=(10.0,))
+    singles = {5.0: TWAP(window_sec=5.0), 30.0: TWAP(window_sec=30.0)}
+    for t in range(100):
+        px = 100.0 + (t % 7) * 3.0
+        bank.add(px, ts=float(t))
+        for tw in singles.values():
+            tw.add(px, ts=float(t))
+    for w, tw in singles.items():
+        assert abs(bank.sma(w) - tw.value()) < 1e-9
+    # unregistered window inside retention is answered by search
+    assert abs(bank.sma(12.0) - sum(100.0 + (t % 7) * 3.0 for t in range(87, 99)) / 12.0) < 1e-9
+    # EMA converges to a constant price
+    for t in range(100, 400):
+        bank.add(50.0, ts=float(t))
+    assert abs(bank.ema(10.0) - 50.0) < 1e-6
+
+
+def test_oracle_bank_refuses_windows_past_its_retained_span():
+    bank = OracleBank(windows_sec=(10.0, 60.0), capacity=32)
+    for t in range(100):
+        bank.add(100.0, ts=t * 0.5)  # 120 samples per 60s window, only 32 kept
+    assert bank.sma(10.0) == 100.0  # 20 samples: still fully covered
+    with pytest.raises(ValueError, match="capacity"):
+        bank.sma(60.0)
+    with pytest.raises(ValueError, match="longest"):
+        bank.sma(120.0)
+
+    roomy = OracleBank(windows_sec=(10.0, 60.0), capacity=256)
+    for t in range(100):
+        roomy.add(100.0, ts=t * 0.5)
+    assert roomy.sma(60.0) == 100.0
+
+
+def test_guard_accepts_oracle_bank_window():
+    a, b = seed()
+    bank = OracleBank(windows_sec=(60.0, 3600.0))
+    mid = route_mid_price_copx_per_col(a, b)
+    bank.add(mid * 1.2, ts=0.0)
+    bank.add(mid, ts=3540.0)
+    bank.add(mid, ts=3600.0)
+    _ok, dev_short, _budget = size_aware_twap_guard(a, b, bank, 1_000.0, twap_window_sec=60.0)
+    _ok, dev_long, _budget = size_aware_twap_guard(a, b, bank, 1_000.0, twap_window_sec=3600.0)
+    assert dev_long > dev_short
+    assert size_aware_twap_guard(a, b, bank.view(60.0), 1_000.0)[1] == dev_short
+
+
+def test_rolling_twap_matches_streaming_oracles():
+    rng = np.random.default_rng(7)
+    prices = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, 2_000)))
+
+    tw = TWAPOracle(window=20)
+    streamed = []
+    for px in prices:
+        tw.push(px)
+        streamed.append(tw.value())
+    np.testing.assert_allclose(rolling_twap(prices, 20), streamed, rtol=1e-12)
+
+    # irregular stamps with bursts (repeated instants) and a late sample
+    ts = np.cumsum(rng.exponential(1.0, prices.size) * (rng.random(prices.size) > 0.2))
+    ts[500] = ts[499] - 3.0
+    tw = TWAP(window_sec=30.0, capacity=prices.size)
+    streamed = []
+    for px, t in zip(prices, ts, strict=True):
+        tw.add(px, ts=t)
+        streamed.append(tw.value())
+    got = rolling_twap(prices, timestamps=ts, window_sec=30.0)
+    np.testing.assert_allclose(got, streamed, rtol=1e-10)
+
+
+def test_rolling_quantiles_match_numpy_over_the_window():
+    rng = np.random.default_rng(3)
+    prices = np.round(rng.normal(100.0, 2.0, 2_000), 1)  # rounding forces ties
+    for window, q in [(1, 0.5), (8, 0.5), (33, 0.1), (33, 0.9), (64, 0.0), (64, 1.0)]:
+        orc = QuantileOracle(window, q)
+        for i, p in enumerate(prices):
+            orc.push(p)
+            assert orc.value() == np.quantile(prices[max(0, i - window + 1) : i + 1], q)
+        assert len(orc) == window
+
+
+def test_median_baseline_resists_single_outlier_in_guard():
+    a, b = seed()
+    mid = route_mid_price_copx_per_col(a, b)
+    med, mean = MedianOracle(window=9), TWAPOracle(window=9)
+    med.warm([mid] * 8 + [mid * 3])
+    mean.warm([mid] * 8 + [mid * 3])
+    assert med.value() == mid
+
+    ok_med, dev_med, _ = size_aware_twap_guard(a, b, med, 1_000.0)
+    ok_mean, dev_mean, _ = size_aware_twap_guard(a, b, mean, 1_000.0)
+    assert ok_med and not ok_mean
+    assert dev_med < dev_mean
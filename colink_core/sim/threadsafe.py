@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable, Iterable
+
+from .limits import LimitConfig, LimiterRegistry, TradeLimiter
+from .twap import TWAP, TWAPOracle
+
+# None of the critical sections below await or block, and each holds its lock for
+# a few microseconds, so these classes are safe to call from FastAPI's sync-route
+# thread pool and directly from async routes on the event loop alike.
+# price_utils.PRICE_CACHE (behind cached_quote_col_to_copx / impact_curve)
+# takes its own lock inside VersionedLRU, so it needs no wrapper here.
+
+
+class LockedTradeLimiter(TradeLimiter):
+    """TradeLimiter whose strike / cooldown updates are atomic across threads."""
+
+    __slots__ = ("_lock",)
+
+    def __init__(self, cfg: LimitConfig):
+        super().__init__(cfg)
+        # re-entrant: check_and_record() calls can_trade() while holding it
+        self._lock = threading.RLock()
+
+    def can_trade(self) -> tuple[bool, str]:
+        with self._lock:
+            return super().can_trade()
+
+    def check_and_record(self, col_in: float, dev_bps: float) -> tuple[bool, str]:
+        with self._lock:
+            return super().check_and_record(col_in, dev_bps)
+
+
+class LockedTWAPOracle(TWAPOracle):
+    """TWAPOracle with push/value/warm serialized so `_sum` never tears."""
+
+    def __init__(self, window: int = 20):
+        super().__init__(window)
+        self._lock = threading.Lock()
+
+    def push(self, price: float) -> None:
+        with self._lock:
+            super().push(price)
+
+    def value(self) -> float:
+        with self._lock:
+            return super().value()
+
+    def warm(self, prices: Iterable[float]) -> None:
+        prices = list(prices)
+        with self._lock:
+            for p in prices:
+                TWAPOracle.push(self, p)
+
+
+class LockedTWAP(TWAP):
+    """Time-weighted TWAP with add/value serialized (value() may evict)."""
+
+    def __init__(self, window_sec: float = 60.0, capacity: int = 4096):
+        super().__init__(window_sec, capacity)
+        self._lock = threading.Lock()
+
+    def add(self, price: float, ts: float | None = None) -> None:
+        with self._lock:
+            super().add(price, ts)
+
+    def value(self, now: float | None = None) -> float:
+        with self._lock:
+            return super().value(now)
+
+
+class StripedLimiterRegistry:
+    """
+    LimiterRegistry split into `stripes` independently locked shards by key hash.
+    Callers on different accounts rarely share a lock, so the breaker stays exact
+    per key without serializing the whole API behind one mutex.
+    """
+
+    def __init__(
+        self,
+        cfg: LimitConfig | None = None,
+        *,
+        stripes: int = 64,
+        max_keys: int = 100_000,
+        idle_ttl_sec: float | None = 3_600.0,
+        clock: Callable[[], float] | None = None,
+    ):
+        if stripes <= 0:
+            raise ValueError("stripes must be > 0")
+        per_stripe = max(1, -(-int(max_keys) // stripes))
+        kw = {} if clock is None else {"clock": clock}
+        self._shards = [
+            LimiterRegistry(cfg, max_keys=per_stripe, idle_ttl_sec=idle_ttl_sec, **kw)
+            for _ in range(stripes)
+        ]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self._shards)
+
+    def _shard(self, key: Hashable) -> int:
+        return hash(key) % len(self._shards)
+
+    def can_trade(self, key: Hashable) -> tuple[bool, str]:
+        i = self._shard(key)
+        with self._locks[i]:
+            return self._shards[i].can_trade(key)
+
+    def check_and_record(self, key: Hashable, col_in: float, dev_bps: float) -> tuple[bool, str]:
+        i = self._shard(key)
+        with self._locks[i]:
+            return self._shards[i].check_and_record(key, col_in, dev_bps)
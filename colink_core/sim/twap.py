@@ -1,6 +1,15 @@
+from __future__ import annotations
+
+import heapq
+import math
+import time
 from collections import deque
 from collections.abc import Iterable
 
+import numpy as np
+
+_LN2 = math.log(2.0)
+
 
 class TWAPOracle:
     """
@@ -30,3 +39,424 @@ class TWAPOracle:
     def warm(self, prices: Iterable[float]) -> None:
         for p in prices:
             self.push(p)
+
+
+class QuantileOracle:
+    """
+    Rolling q-quantile of the last `window` pushed prices (numpy's default linear
+    interpolation). Unlike the equal-weight TWAPOracle, one outlier print moves the
+    median by at most one rank, so a single large swap cannot drag the baseline.
+
+    The window is split across a max-heap (lowest ranks, top = the quantile's
+    lower neighbour) and a min-heap (the rest). Evicted samples are deleted lazily
+    when they surface, so push() is O(log n) and value() is O(1).
+    """
+
+    def __init__(self, window: int = 20, q: float = 0.5):
+        if window <= 0:
+            raise ValueError("window must be > 0")
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be in [0, 1]")
+        self.window = int(window)
+        self.q = float(q)
+        self._buf: deque[float] = deque()
+        self._lo: list[float] = []  # max-heap via negated values
+        self._hi: list[float] = []
+        self._lo_n = 0  # live (not lazily deleted) entries in each heap
+        self._hi_n = 0
+        self._lo_dead: dict[float, int] = {}
+        self._hi_dead: dict[float, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def _prune(self) -> None:
+        lo, hi, lo_dead, hi_dead = self._lo, self._hi, self._lo_dead, self._hi_dead
+        while lo and lo_dead.get(-lo[0]):
+            lo_dead[-lo[0]] -= 1
+            heapq.heappop(lo)
+        while hi and hi_dead.get(hi[0]):
+            hi_dead[hi[0]] -= 1
+            heapq.heappop(hi)
+
+    def _rebalance(self) -> None:
+        # the low heap holds ranks 0..floor(q*(n-1)), so its top is the lower neighbour
+        n = len(self._buf)
+        k = math.floor(self.q * (n - 1)) + 1 if n else 0
+        while self._lo_n > k:
+            heapq.heappush(self._hi, -heapq.heappop(self._lo))
+            self._lo_n -= 1
+            self._hi_n += 1
+            self._prune()
+        while self._lo_n < k:
+            heapq.heappush(self._lo, -heapq.heappop(self._hi))
+            self._lo_n += 1
+            self._hi_n -= 1
+            self._prune()
+
+    def _compact(self) -> None:
+        # dead entries buried below live tops never surface on their own; rebuild
+        # from the window once they outnumber it
+        ordered = sorted(self._buf)
+        n = len(ordered)
+        k = math.floor(self.q * (n - 1)) + 1 if n else 0
+        self._lo = [-p for p in reversed(ordered[:k])]
+        self._hi = ordered[k:]
+        heapq.heapify(self._lo)
+        self._lo_n, self._hi_n = k, n - k
+        self._lo_dead.clear()
+        self._hi_dead.clear()
+
+    def push(self, price: float) -> None:
+        p = float(price)
+        if len(self._buf) == self.window:
+            old = self._buf.popleft()
+            # tops are always live, so old <= lo top means a live copy sits in lo
+            if old <= -self._lo[0]:
+                self._lo_dead[old] = self._lo_dead.get(old, 0) + 1
+                self._lo_n -= 1
+            else:
+                self._hi_dead[old] = self._hi_dead.get(old, 0) + 1
+                self._hi_n -= 1
+            self._prune()
+        self._buf.append(p)
+        if self._hi_n and p >= self._hi[0] and not (self._lo_n and p <= -self._lo[0]):
+            heapq.heappush(self._hi, p)
+            self._hi_n += 1
+        else:
+            heapq.heappush(self._lo, -p)
+            self._lo_n += 1
+        self._rebalance()
+        if len(self._lo) + len(self._hi) > 2 * self.window + 16:
+            self._compact()
+
+    def value(self) -> float:
+        n = len(self._buf)
+        if n == 0:
+            return 0.0
+        lower = -self._lo[0]
+        frac = self.q * (n - 1) - (self._lo_n - 1)
+        if frac <= 0.0 or not self._hi_n:
+            return lower
+        return lower + frac * (self._hi[0] - lower)
+
+    def warm(self, prices: Iterable[float]) -> None:
+        for p in prices:
+            self.push(p)
+
+
+class MedianOracle(QuantileOracle):
+    """Rolling median of the last `window` prices; see QuantileOracle."""
+
+    def __init__(self, window: int = 20):
+        super().__init__(window, q=0.5)
+
+
+class TWAP:
+    """
+    Time-weighted average price over a trailing window of `window_sec` seconds.
+
+    Each price holds from its timestamp until the next sample (step function), so
+    bursts of samples at nearly the same time carry almost no weight. Samples live
+    in a preallocated ring buffer of (timestamp, price, cumulative price*dt); the
+    window integral is two lookups, so add() is amortized O(1) and value() is O(1).
+    If more than `capacity` samples fall inside the window the oldest is evicted
+    early, keeping memory bounded at any tick rate.
+    """
+
+    def __init__(self, window_sec: float = 60.0, capacity: int = 4096):
+        if window_sec <= 0:
+            raise ValueError("window_sec must be > 0")
+        if capacity < 2:
+            raise ValueError("capacity must be >= 2")
+        self.window_sec = float(window_sec)
+        self.capacity = int(capacity)
+        self._ts = [0.0] * self.capacity
+        self._px = [0.0] * self.capacity
+        self._cum = [0.0] * self.capacity  # integral of price dt from the first sample
+        self._head = 0  # oldest retained sample (the one in force at window start)
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _last(self) -> int:
+        return (self._head + self._n - 1) % self.capacity
+
+    def _evict(self, start: float) -> None:
+        # Drop the head while the next sample already covers the window start.
+        cap = self.capacity
+        while self._n > 1 and self._ts[(self._head + 1) % cap] <= start:
+            self._head = (self._head + 1) % cap
+            self._n -= 1
+
+    def add(self, price: float, ts: float | None = None) -> None:
+        p = float(price)
+        t = time.time() if ts is None else float(ts)
+        cap = self.capacity
+        if self._n == 0:
+            cum = 0.0
+        else:
+            i = self._last()
+            t_last = self._ts[i]
+            # late (out-of-order) samples are treated as arriving at the latest time
+            t = max(t, t_last)
+            cum = self._cum[i] + self._px[i] * (t - t_last)
+            if t == t_last:
+                # same instant: the newer price replaces the older one
+                self._px[i] = p
+                return
+        if self._n == cap:
+            self._head = (self._head + 1) % cap
+            self._n -= 1
+        j = (self._head + self._n) % cap
+        self._ts[j], self._px[j], self._cum[j] = t, p, cum
+        self._n += 1
+        self._evict(t - self.window_sec)
+
+    def _integral(self, i: int, t: float) -> float:
+        return self._cum[i] + self._px[i] * (t - self._ts[i])
+
+    def value(self, now: float | None = None) -> float:
+        """TWAP over [now - window_sec, now]; `now` defaults to the latest sample time."""
+        if self._n == 0:
+            return 0.0
+        last = self._last()
+        now = self._ts[last] if now is None else max(float(now), self._ts[last])
+        start = now - self.window_sec
+        self._evict(start)
+
+        h = self._head
+        t0 = max(start, self._ts[h])
+        span = now - t0
+        if span <= 0:
+            return self._px[last]
+        return (self._integral(last, now) - self._integral(h, t0)) / span
+
+
+class OracleView:
+    """value()-only handle on one OracleBank series; usable wherever a TWAPOracle is."""
+
+    __slots__ = ("_bank", "_window_sec", "_half_life_sec")
+
+    def __init__(self, bank: OracleBank, window_sec=None, half_life_sec=None):
+        self._bank = bank
+        self._window_sec = window_sec
+        self._half_life_sec = half_life_sec
+
+    def value(self, now: float | None = None) -> float:
+        if self._half_life_sec is not None:
+            return self._bank.ema(self._half_life_sec, now)
+        return self._bank.sma(self._window_sec, now)
+
+
+class OracleBank:
+    """
+    Several time-weighted SMAs and EMAs of one price stream over a single shared
+    sample buffer: each price is ingested once.
+
+    The buffer keeps (timestamp, price, cumulative price*dt) for the longest SMA
+    window, so any window's average is a difference of two prefix sums. Registered
+    windows keep their own start pointer (amortized O(1) reads); other windows up
+    to the longest one are located by binary search. EMAs are continuous-time with
+    the given half-lives and are updated in O(1) per sample.
+
+    `capacity` bounds the buffer: size it to at least the number of samples the
+    longest window can hold at the peak sample rate. Once it overflows, the
+    oldest in-window samples are dropped, and sma() raises ValueError for any
+    window reaching back past the oldest retained sample instead of silently
+    averaging over a shorter span. Windows longer than the longest registered
+    one are rejected the same way.
+    """
+
+    def __init__(
+        self,
+        windows_sec: Iterable[float] = (60.0, 300.0, 3600.0),
+        ema_half_lives_sec: Iterable[float] = (),
+        capacity: int = 65_536,
+    ):
+        self.windows_sec = tuple(sorted({float(w) for w in windows_sec}))
+        self.ema_half_lives_sec = tuple(sorted({float(h) for h in ema_half_lives_sec}))
+        if not self.windows_sec or self.windows_sec[0] <= 0:
+            raise ValueError("need at least one window, all > 0")
+        if any(h <= 0 for h in self.ema_half_lives_sec):
+            raise ValueError("EMA half-lives must be > 0")
+        if capacity < 2:
+            raise ValueError("capacity must be >= 2")
+        self.capacity = int(capacity)
+        self.retention_sec = self.windows_sec[-1]
+        self._ts = [0.0] * self.capacity
+        self._px = [0.0] * self.capacity
+        self._cum = [0.0] * self.capacity
+        # absolute sample indices; slot = index % capacity
+        self._lo = 0
+        self._hi = 0
+        self._heads = dict.fromkeys(self.windows_sec, 0)
+        self._ema = dict.fromkeys(self.ema_half_lives_sec, 0.0)
+        # history before this timestamp was evicted by capacity, not by retention
+        self._lost_before = -math.inf
+
+    def __len__(self) -> int:
+        return self._hi - self._lo
+
+    def add(self, price: float, ts: float | None = None) -> None:
+        p = float(price)
+        t = time.time() if ts is None else float(ts)
+        cap = self.capacity
+        if self._hi == self._lo:
+            cum = 0.0
+            for h in self._ema:
+                self._ema[h] = p
+        else:
+            i = (self._hi - 1) % cap
+            t_last, p_last = self._ts[i], self._px[i]
+            t = max(t, t_last)  # late samples are treated as arriving at the latest time
+            dt = t - t_last
+            cum = self._cum[i] + p_last * dt
+            for h, e in self._ema.items():
+                self._ema[h] = p_last + (e - p_last) * math.exp(-dt * _LN2 / h)
+            if dt == 0:
+                self._px[i] = p
+                return
+        if self._hi - self._lo == cap:
+            self._lo += 1
+            self._lost_before = self._ts[self._lo % cap]
+        j = self._hi % cap
+        self._ts[j], self._px[j], self._cum[j] = t, p, cum
+        self._hi += 1
+
+        start = t - self.retention_sec
+        while self._hi - self._lo > 1 and self._ts[(self._lo + 1) % cap] <= start:
+            self._lo += 1
+
+    def _advance(self, window_sec: float, start: float) -> int:
+        cap = self.capacity
+        head = max(self._heads[window_sec], self._lo)
+        if self._ts[head % cap] > start and head > self._lo:
+            # queried further back than last time; re-locate instead of walking back
+            head = self._search(start)
+        while head + 1 < self._hi and self._ts[(head + 1) % cap] <= start:
+            head += 1
+        self._heads[window_sec] = head
+        return head
+
+    def _search(self, start: float) -> int:
+        # last retained sample with ts <= start (or the oldest one)
+        cap = self.capacity
+        lo, hi = self._lo, self._hi - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self._ts[mid % cap] <= start:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def _now(self, now: float | None) -> tuple[int, float]:
+        last = (self._hi - 1) % self.capacity
+        t_last = self._ts[last]
+        return last, t_last if now is None else max(float(now), t_last)
+
+    def sma(self, window_sec: float | None = None, now: float | None = None) -> float:
+        """
+        Time-weighted average over [now - window_sec, now] (default: shortest window).
+        Raises ValueError if the window is longer than the retention or reaches
+        back past samples dropped by a full buffer (see `capacity`).
+        """
+        if self._hi == self._lo:
+            return 0.0
+        w = self.windows_sec[0] if window_sec is None else float(window_sec)
+        if w > self.retention_sec:
+            raise ValueError(
+                f"window {w}s exceeds the longest registered window {self.retention_sec}s"
+            )
+        last, now = self._now(now)
+        start = now - w
+        if start < self._lost_before:
+            raise ValueError(
+                f"window {w}s reaches back past the retained span (capacity={self.capacity} "
+                f"samples kept since t={self._lost_before}); raise capacity"
+            )
+        h = self._advance(w, start) if w in self._heads else self._search(start)
+        h %= self.capacity
+
+        t0 = max(start, self._ts[h])
+        span = now - t0
+        if span <= 0:
+            return self._px[last]
+        integral_now = self._cum[last] + self._px[last] * (now - self._ts[last])
+        integral_t0 = self._cum[h] + self._px[h] * (t0 - self._ts[h])
+        return (integral_now - integral_t0) / span
+
+    def ema(self, half_life_sec: float, now: float | None = None) -> float:
+        """Continuous-time EMA with a registered half-life, evaluated at `now`."""
+        if self._hi == self._lo:
+            return 0.0
+        e = self._ema[float(half_life_sec)]
+        last, now = self._now(now)
+        p = self._px[last]
+        return p + (e - p) * math.exp(-(now - self._ts[last]) * _LN2 / half_life_sec)
+
+    def value(self, now: float | None = None) -> float:
+        """Shortest-window SMA, so a bank can stand in for a single TWAP."""
+        return self.sma(None, now)
+
+    def view(self, window_sec: float | None = None, half_life_sec: float | None = None):
+        """value()-only handle on one SMA window or EMA half-life."""
+        if half_life_sec is not None and float(half_life_sec) not in self._ema:
+            raise KeyError(f"EMA half-life {half_life_sec} is not registered")
+        return OracleView(self, window_sec, half_life_sec)
+
+
+def rolling_twap(
+    prices,
+    window: int | None = None,
+    *,
+    timestamps=None,
+    window_sec: float | None = None,
+) -> np.ndarray:
+    """
+    Whole-series TWAP in one vectorized pass: out[i] is what the streaming oracle
+    returns from value() right after sample i.
+
+    - Count windows (`window`): matches TWAPOracle(window).push per sample.
+    - Time windows (`timestamps` + `window_sec`): matches TWAP(window_sec).add(p, ts)
+      per sample, assuming its ring capacity is not exceeded. Out-of-order stamps are
+      clamped forward and same-instant samples supersede each other, as in TWAP.
+
+    Prices are re-based on the first sample before the cumulative sums so long
+    series do not lose precision to a growing prefix sum.
+    """
+    p = np.asarray(prices, dtype=float)
+    if p.ndim != 1:
+        raise ValueError("prices must be 1-D")
+    if p.size == 0:
+        return p.copy()
+    base = p[0]
+    d = p - base
+
+    if timestamps is None:
+        if window is None or window <= 0:
+            raise ValueError("window must be > 0")
+        c = np.concatenate(([0.0], np.cumsum(d)))
+        idx = np.arange(1, p.size + 1)
+        lo = np.maximum(idx - int(window), 0)
+        return base + (c[idx] - c[lo]) / (idx - lo)
+
+    if window_sec is None or window_sec <= 0:
+        raise ValueError("window_sec must be > 0 with timestamps")
+    t = np.maximum.accumulate(np.asarray(timestamps, dtype=float))
+    if t.shape != p.shape:
+        raise ValueError("timestamps must match prices")
+
+    # cum[i] = integral of (price - base) dt from t[0] to t[i]; price k holds on [t_k, t_k+1)
+    cum = np.concatenate(([0.0], np.cumsum(d[:-1] * np.diff(t))))
+    start = t - float(window_sec)
+    # sample in force at the window start: last with ts <= start, else the first one
+    j = np.maximum(np.searchsorted(t, start, side="right") - 1, 0)
+    t0 = np.maximum(start, t[j])
+    span = t - t0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avg = (cum - (cum[j] + d[j] * (t0 - t[j]))) / span
+    # zero-length span (first sample / single instant): the latest price is the TWAP
+    return np.where(span > 0, base + avg, p)